@@ -0,0 +1,68 @@
+"""
+Benchmarks for hojo's ORM, schema and mapper hot paths.
+
+    python -m benchmarks --output bench.json [--compare previous.json]
+
+The ORM benchmarks use an in-memory SQLite database unless `--db-uri` (or the
+`BENCH_DB_URI` environment variable) points somewhere else.
+"""
+import argparse
+import json
+import os
+import sys
+
+from hojo import Hojo
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--db-uri", default=os.environ.get("BENCH_DB_URI", "sqlite://"))
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--compare", help="JSON report to compare the results with")
+    parser.add_argument("--filter", default="", help="only run matching benchmarks")
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="multiply every benchmark's size"
+    )
+    args = parser.parse_args(argv)
+
+    Hojo.config(db_uri=args.db_uri)
+
+    # Imported after configuring, they declare models and register benchmarks
+    from benchmarks import bench_mapper, bench_orm, bench_schema  # noqa: F401
+    from benchmarks.harness import BENCHMARKS, compare, load_report, report, run
+    from benchmarks.models import teardown_database
+
+    results = []
+    try:
+        for name, bench in BENCHMARKS.items():
+            if args.filter not in name:
+                continue
+
+            result = run(bench, args.scale)
+            results.append(result)
+            print(
+                f"{name:<32} {result.median * 1e6:>10.1f}us/op "
+                f"{result.ops_per_sec:>12.0f} ops/s",
+                file=sys.stderr,
+            )
+    finally:
+        teardown_database()
+
+    current = report(results, args.db_uri)
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump(current, fp, indent=2)
+    else:
+        json.dump(current, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        print(f"\nCompared with {args.compare}:", file=sys.stderr)
+        for line in compare(current, load_report(args.compare)):
+            print(line, file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+from typing import Optional
+
+from sqlalchemy.orm import registry
+
+from benchmarks.harness import benchmark
+from hojo.base import BaseModel, field, model
+from hojo.orm.mapper import map_models
+
+
+def _declare(index: int, parent=None) -> type:
+    annotations = {"name": str, "score": int, "active": bool}
+    namespace = {"__annotations__": annotations, "score": 0, "active": True}
+    if parent is not None:
+        annotations["parent"] = Optional[parent]
+        namespace["parent"] = field(belongs_to=parent, default=None)
+
+    return type(f"BenchModel{index}", (), namespace)
+
+
+def _models(size: int) -> list:
+    models = []
+    for index in range(size):
+        models.append(model(_declare(index, models[-1] if models else None)))
+
+    # Keep the throwaway classes out of `automap()`
+    for cls in models:
+        BaseModel._registry.remove(cls)
+    return models
+
+
+@benchmark("mapper.model", size=200)
+def model_decoration(size):
+    def operation():
+        _models(size)
+
+    return operation
+
+
+@benchmark("mapper.map_models", size=50)
+def mapping(size):
+    def operation(models):
+        map_models(models, registry())
+
+    return (lambda: _models(size)), operation
@@ -0,0 +1,88 @@
+from sqlalchemy import delete
+
+from benchmarks.harness import benchmark
+from benchmarks.models import Book, setup_database
+
+
+def _reset_books(count: int = 0) -> None:
+    session = setup_database()
+    session.execute(delete(Book))
+    session.commit()
+    if count:
+        Book.objects.bulk_create(
+            [{"title": f"book-{i}", "pages": i} for i in range(count)]
+        )
+    session.expunge_all()
+
+
+@benchmark("orm.create", size=300)
+def create(size):
+    def prepare():
+        _reset_books()
+
+    def operation(_):
+        for i in range(size):
+            Book.objects.create(title=f"book-{i}", pages=i)
+
+    return prepare, operation
+
+
+@benchmark("orm.filter_first", size=1000)
+def filter_first(size):
+    _reset_books(1000)
+
+    def operation():
+        for i in range(size):
+            Book.objects.filter(title=f"book-{i % 1000}").first()
+
+    return operation
+
+
+@benchmark("orm.get_by_id", size=1000)
+def get_by_id(size):
+    _reset_books(1000)
+    ids = [book.id for book in Book.objects.all()]
+    session = setup_database()
+
+    def operation():
+        session.expunge_all()
+        for i in range(size):
+            Book.objects.get(id=ids[i % len(ids)])
+
+    return operation
+
+
+@benchmark("orm.iterate", size=5000)
+def iterate(size):
+    _reset_books(size)
+    session = setup_database()
+
+    def operation():
+        session.expunge_all()
+        for _ in Book.objects.all():
+            pass
+
+    return operation
+
+
+@benchmark("orm.iterator", size=5000)
+def iterator(size):
+    _reset_books(size)
+
+    def operation():
+        for _ in Book.objects.iterator(chunk_size=1000, expunge=True):
+            pass
+
+    return operation
+
+
+@benchmark("orm.bulk_create", size=5000)
+def bulk_create(size):
+    def prepare():
+        _reset_books()
+        return [Book(title=f"book-{i}", pages=i) for i in range(size)]
+
+    def operation(books):
+        Book.objects.bulk_create(books)
+
+    return prepare, operation
@@ -0,0 +1,97 @@
+from uuid import uuid4
+
+import pendulum
+
+from benchmarks.harness import benchmark
+from benchmarks.models import Address, LineItem, Order, Status
+
+
+def _payload(i: int) -> dict:
+    return {
+        "id": str(uuid4()),
+        "status": "open",
+        "created_at": "2024-01-02T03:04:05+00:00",
+        "shipping": {"street": f"{i} Main St", "city": "Lisbon"},
+        "items": [
+            {"sku": f"sku-{n}", "quantity": n, "price": n * 1.5} for n in range(5)
+        ],
+    }
+
+
+def _orders(size: int) -> list:
+    return [
+        Order(
+            id=uuid4(),
+            status=Status.PAID,
+            created_at=pendulum.now("UTC"),
+            shipping=Address(street=f"{i} Main St", city="Lisbon"),
+            items=[
+                LineItem(sku=f"sku-{n}", quantity=n, price=n * 1.5) for n in range(5)
+            ],
+        )
+        for i in range(size)
+    ]
+
+
+@benchmark("schema.load", size=2000)
+def load(size):
+    payloads = [_payload(i) for i in range(size)]
+
+    def operation():
+        for payload in payloads:
+            Order.load(payload)
+
+    return operation
+
+
+@benchmark("schema.load_many", size=2000)
+def load_many(size):
+    payloads = [_payload(i) for i in range(size)]
+
+    def operation():
+        Order.load_many(payloads)
+
+    return operation
+
+
+@benchmark("schema.dump", size=2000)
+def dump(size):
+    orders = _orders(size)
+
+    def operation():
+        for order in orders:
+            order.dump()
+
+    return operation
+
+
+@benchmark("schema.dump_filtered", size=2000)
+def dump_filtered(size):
+    orders = _orders(size)
+
+    def operation():
+        for order in orders:
+            order.dump(skip_none=True, exclude=["items"])
+
+    return operation
+
+
+@benchmark("schema.dump_many", size=2000)
+def dump_many(size):
+    orders = _orders(size)
+
+    def operation():
+        Order.dump_many(orders)
+
+    return operation
+
+
+@benchmark("schema.dumps", size=2000)
+def dumps(size):
+    orders = _orders(size)
+
+    def operation():
+        for order in orders:
+            order.dumps()
+
+    return operation
@@ -0,0 +1,144 @@
+import json
+import platform
+import statistics
+import sys
+import tomllib
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Dict, List, Optional
+
+# name -> benchmark, in registration order
+BENCHMARKS: Dict[str, "Benchmark"] = {}
+
+
+@dataclass
+class Benchmark:
+    name: str
+    setup: Callable[[int], Callable[[], None]]
+    size: int
+    repeat: int
+
+
+@dataclass
+class Result:
+    name: str
+    size: int
+    repeat: int
+    min: float
+    median: float
+    mean: float
+    stdev: float
+    ops_per_sec: float
+
+
+def benchmark(name: str, size: int = 1, repeat: int = 5):
+    """
+    Register a benchmark. The decorated function receives `size`, does its setup and
+    returns the callable to time; that callable performs `size` operations, and
+    results are reported per operation.
+
+    It may instead return a `(prepare, operation)` pair: `prepare()` then runs
+    untimed before every repetition and its result is passed to `operation`.
+    """
+
+    def decorator(setup):
+        BENCHMARKS[name] = Benchmark(name, setup, size, repeat)
+        return setup
+
+    return decorator
+
+
+def run(bench: Benchmark, scale: float = 1.0) -> Result:
+    size = max(1, int(bench.size * scale))
+    operation = bench.setup(size)
+    if isinstance(operation, tuple):
+        prepare, operation = operation
+    else:
+        prepare, operation = None, _no_argument(operation)
+
+    timings = []
+    # The first run is a warm-up: compiled caches, first connection
+    for _ in range(bench.repeat + 1):
+        argument = prepare() if prepare else None
+        started = perf_counter()
+        operation(argument)
+        timings.append((perf_counter() - started) / size)
+    timings = timings[1:]
+
+    median = statistics.median(timings)
+    return Result(
+        name=bench.name,
+        size=size,
+        repeat=bench.repeat,
+        min=min(timings),
+        median=median,
+        mean=statistics.fmean(timings),
+        stdev=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        ops_per_sec=1 / median if median else 0.0,
+    )
+
+
+def _no_argument(operation: Callable[[], None]) -> Callable[[None], None]:
+    return lambda _: operation()
+
+
+def _version(package: str) -> Optional[str]:
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def _hojo_version() -> Optional[str]:
+    # Running from a checkout, hojo itself usually isn't installed
+    pyproject = Path(__file__).resolve().parent.parent / "pyproject.toml"
+    if pyproject.exists():
+        with open(pyproject, "rb") as fp:
+            return tomllib.load(fp)["tool"]["poetry"]["version"]
+    return _version("hojo")
+
+
+def environment(db_uri: str) -> dict:
+    return {
+        "hojo": _hojo_version(),
+        "sqlalchemy": _version("sqlalchemy"),
+        "cattrs": _version("cattrs"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "database": db_uri.split("://", 1)[0],
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def report(results: List[Result], db_uri: str) -> dict:
+    return {
+        "environment": environment(db_uri),
+        "benchmarks": {result.name: asdict(result) for result in results},
+    }
+
+
+def compare(current: dict, baseline: dict) -> List[str]:
+    """
+    One line per benchmark present in both reports, with the change in median time
+    per operation; positive means slower.
+    """
+    lines = []
+    for name, result in current["benchmarks"].items():
+        previous = baseline.get("benchmarks", {}).get(name)
+        if not previous or not previous["median"]:
+            continue
+
+        change = (result["median"] - previous["median"]) / previous["median"] * 100
+        lines.append(
+            f"{name:<32} {previous['median'] * 1e6:>10.1f}us "
+            f"-> {result['median'] * 1e6:>10.1f}us  {change:+6.1f}%"
+        )
+    return lines
+
+
+def load_report(path: str) -> dict:
+    with open(path) as fp:
+        return json.load(fp)
@@ -0,0 +1,70 @@
+from enum import StrEnum
+from typing import List, Optional
+from uuid import UUID
+
+from pendulum import DateTime
+
+from hojo import Connection, automap, field, model, schema
+from hojo.orm.mapper import MAPPER_REGISTRY
+
+
+@model
+class Author:
+    name: str = field(index=True)
+    books: list = field(has_many="Book", factory=list, repr=False)
+
+
+@model
+class Book:
+    title: str = field(index=True)
+    pages: int = 0
+    rating: Optional[float] = None
+    author: Optional[Author] = field(belongs_to=Author, default=None, repr=False)
+
+
+class Status(StrEnum):
+    OPEN = "open"
+    PAID = "paid"
+
+
+@schema
+class Address:
+    street: str
+    city: str
+    zip_code: Optional[str] = None
+
+
+@schema
+class LineItem:
+    sku: str
+    quantity: int
+    price: float
+
+
+@schema
+class Order:
+    id: UUID
+    status: Status
+    created_at: DateTime
+    shipping: Address
+    items: List[LineItem]
+    note: Optional[str] = None
+
+
+_database_ready = False
+
+
+def setup_database():
+    global _database_ready
+    if not _database_ready:
+        automap()
+        MAPPER_REGISTRY.metadata.create_all(Connection()._get_engine())
+        _database_ready = True
+
+    return Connection().session
+
+
+def teardown_database():
+    if _database_ready:
+        Connection().session.remove()
+        MAPPER_REGISTRY.metadata.drop_all(Connection()._get_engine())
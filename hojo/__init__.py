@@ -1,9 +1,54 @@
-from hojo.base import BaseModel, field, model
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from hojo.config import Config
-from hojo.connection import Connection
-from hojo.orm.mapper import automap
 from hojo.schema import BaseSchema, schema
 
+if TYPE_CHECKING:
+    from hojo.base import BaseModel, field, model
+    from hojo.connection import Connection
+    from hojo.orm.aggregates import Avg, Count, Max, Min, Sum
+    from hojo.orm.cache import ModelCache
+    from hojo.orm.mapper import automap
+    from hojo.routing import DatabaseRouter
+    from hojo.sessions import session_scope
+    from hojo.transaction import atomic
+
+# The ORM pulls in SQLAlchemy, pendulum and friends, so it is only imported the
+# first time one of these names is used; `from hojo import schema` stays light.
+_LAZY_IMPORTS = {
+    "BaseModel": "hojo.base",
+    "field": "hojo.base",
+    "model": "hojo.base",
+    "Connection": "hojo.connection",
+    "Avg": "hojo.orm.aggregates",
+    "Count": "hojo.orm.aggregates",
+    "Max": "hojo.orm.aggregates",
+    "Min": "hojo.orm.aggregates",
+    "Sum": "hojo.orm.aggregates",
+    "ModelCache": "hojo.orm.cache",
+    "automap": "hojo.orm.mapper",
+    "DatabaseRouter": "hojo.routing",
+    "session_scope": "hojo.sessions",
+    "atomic": "hojo.transaction",
+}
+
+__all__ = ["BaseSchema", "Config", "Hojo", "schema", *_LAZY_IMPORTS]
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'hojo' has no attribute '{name}'")
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
+
 
 class Hojo:
     @staticmethod
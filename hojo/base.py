@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from typing import Any, ClassVar, List, Optional, Type
 from uuid import UUID
 
@@ -7,7 +8,9 @@ from attrs import make_class
 from pendulum import DateTime, now
 from uuid6 import uuid7
 
-from hojo.orm.manager import Manager, ModelDescriptor
+from hojo.config import Config
+from hojo.orm.cache import ModelCache
+from hojo.orm.manager import AsyncManager, Manager, ModelDescriptor
 from hojo.schema import BaseSchema
 
 
@@ -15,6 +18,8 @@ class BaseModel(BaseSchema):
     _registry: List["BaseModel"] = []
 
     objects: ClassVar = ModelDescriptor(Manager())
+    aobjects: ClassVar = ModelDescriptor(AsyncManager())
+    _model_cache: ClassVar[Optional[ModelCache]] = None
 
 
 def field(
@@ -44,16 +49,31 @@ def field(
     return attrfield(**kwargs)
 
 
+def _pendulum_now() -> DateTime:
+    return now("UTC")
+
+
+def _stdlib_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 def model(cls, slots=False) -> Type[BaseModel]:
     klass = define(cls)
 
+    # `Hojo.config(stdlib_timestamps=True)` makes models declared afterwards use plain
+    # `datetime` for their timestamps, skipping pendulum on every instance
+    if Config.get("stdlib_timestamps"):
+        timestamp_type, timestamp_factory = datetime, _stdlib_now
+    else:
+        timestamp_type, timestamp_factory = DateTime, _pendulum_now
+
     class_fields = {
         "id": attrfield(type=UUID, factory=uuid7, kw_only=True),
         "created_at": attrfield(
-            type=DateTime, factory=lambda: now("UTC"), kw_only=True
+            type=timestamp_type, factory=timestamp_factory, kw_only=True
         ),  # type: ignore
         "updated_at": attrfield(
-            type=DateTime, factory=lambda: now("UTC"), kw_only=True
+            type=timestamp_type, factory=timestamp_factory, kw_only=True
         ),  # type: ignore
     }
 
@@ -67,6 +87,12 @@ def model(cls, slots=False) -> Type[BaseModel]:
     ProxyModel.__module__ = cls.__module__
     ProxyModel.__doc__ = cls.__doc__
 
+    for name, value in vars(klass).items():
+        if isinstance(value, Manager):
+            setattr(ProxyModel, name, ModelDescriptor(value))
+        elif isinstance(value, ModelCache):
+            ProxyModel._model_cache = value.bind(ProxyModel)
+
     BaseModel._registry.append(ProxyModel)
 
     return ProxyModel
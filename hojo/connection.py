@@ -1,17 +1,100 @@
 import json
 import os
-from typing import Optional
+from asyncio import current_task
+from itertools import count
+from threading import Lock, get_ident
+from time import perf_counter
+from typing import Dict, List, Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import Session, scoped_session, sessionmaker
+from sqlalchemy.util import ThreadLocalRegistry
 
 from hojo.config import Config
+from hojo.instrumentation import instrument_engine
+from hojo.sessions import SessionRegistry, TaskRegistry
+
+ENGINE_OPTIONS = (
+    "pool_size",
+    "max_overflow",
+    "pool_timeout",
+    "pool_recycle",
+    "pool_pre_ping",
+    "pool_use_lifo",
+    "echo",
+)
+
+
+DEFAULT_DATABASE = "default"
+
+# How a database with several URIs (a group of replicas) picks one per statement
+BALANCING_STRATEGIES = ("round_robin", "least_loaded")
 
 
 class ConnectionCredentialError(RuntimeError):
     pass
 
 
+class PoolMetrics:
+    """
+    Checkout counters for a connection pool. Wait time is measured from the moment
+    a connection is requested until the pool hands it over, so it includes both
+    queueing on an exhausted pool and opening new connections.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record_checkout(self, wait: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def as_dict(self) -> dict:
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_total": self.wait_total,
+            "wait_max": self.wait_max,
+            "wait_avg": self.wait_total / self.checkouts if self.checkouts else 0.0,
+        }
+
+
+def timed_pool_class(pool_class, metrics: PoolMetrics):
+    # A subclass rather than a wrapper, so the timing survives `Pool.recreate()`
+    class TimedPool(pool_class):
+        def connect(self):
+            start = perf_counter()
+            try:
+                connection = super().connect()
+            except PoolTimeoutError:
+                metrics.record_timeout()
+                raise
+
+            wait = perf_counter() - start
+            metrics.record_checkout(wait)
+
+            on_checkout = Config.get("on_pool_checkout")
+            if on_checkout:
+                on_checkout(wait)
+
+            return connection
+
+    TimedPool.__name__ = TimedPool.__qualname__ = f"Timed{pool_class.__name__}"
+    return TimedPool
+
+
 class Connection:
     _instance = None
 
@@ -21,13 +104,48 @@ class Connection:
         return cls._instance
 
     def __init__(self) -> None:
+        if getattr(self, "_initialized", False):
+            return
+
         self._session = None
-        self._engine = None
-        self.db_uri = Config.get("db_uri") or os.environ.get("DB_URI")
+        self._async_session = None
+        self.databases = self._configured_databases()
+        self.db_uri = self.databases[DEFAULT_DATABASE][0]
+        self._engines: Dict[str, list] = {}
+        self._async_engines: Dict[str, list] = {}
+        self._turns: Dict[str, count] = {}
+        self._engines_lock = Lock()
+
+        self._pool_metrics = {name: PoolMetrics() for name in self.databases}
+        self.pool_metrics = self._pool_metrics[DEFAULT_DATABASE]
+        self._initialized = True
 
-        if not self.db_uri:
+    def _configured_databases(self) -> Dict[str, List[str]]:
+        """
+        `Hojo.config(databases={"default": uri, "replica": [uri, ...]})` names the
+        databases, each with one URI or a group of them (e.g. replicas); without it,
+        `db_uri` is the only, "default", database.
+        """
+        databases = Config.get("databases")
+        if not databases:
+            db_uri = Config.get("db_uri") or os.environ.get("DB_URI")
+            databases = {DEFAULT_DATABASE: db_uri} if db_uri else {}
+
+        if not databases.get(DEFAULT_DATABASE):
             raise ConnectionCredentialError("Invalid database credentials.")
 
+        return {
+            name: [uris] if isinstance(uris, str) else list(uris)
+            for name, uris in databases.items()
+        }
+
+    @property
+    def routing(self) -> bool:
+        """
+        Whether there is more than one database to route statements to.
+        """
+        return len(self.databases) > 1
+
     @property
     def session(self) -> Session:
         if self._session:
@@ -37,20 +155,220 @@ class Connection:
         return self._session
 
     def create_session(self) -> Session:
+        from hojo.routing import RoutingSession
+
         session_factory = sessionmaker(
-            bind=self._get_engine(), future=True, expire_on_commit=False
+            bind=self._get_engine(),
+            class_=RoutingSession,
+            future=True,
+            expire_on_commit=False,
         )
         session: Session = scoped_session(session_factory)  # type: ignore
+        # One session per thread, in each `session_scope()` block or outside them
+        session.registry = SessionRegistry(
+            session_factory, ThreadLocalRegistry(session_factory), get_ident
+        )
         return session
 
+    @property
+    def async_session(self):
+        if self._async_session:
+            return self._async_session
+
+        self._async_session = self.create_async_session()
+        return self._async_session
+
+    def create_async_session(self):
+        from sqlalchemy.ext.asyncio import async_scoped_session, async_sessionmaker
+
+        from hojo.routing import AsyncRoutingSession
+
+        session_factory = async_sessionmaker(
+            bind=self._get_async_engine(),
+            sync_session_class=AsyncRoutingSession,
+            expire_on_commit=False,
+        )
+        session = async_scoped_session(session_factory, scopefunc=current_task)
+        # One session per asyncio task, in each `session_scope()` block or outside
+        session.registry = SessionRegistry(
+            session_factory, TaskRegistry(session_factory), current_task
+        )
+        return session
+
+    def remove(self) -> None:
+        """
+        Close the current session and forget it, e.g. at the end of a request; the
+        next use starts a new one.
+        """
+        if self._session is not None:
+            self._session.remove()
+
+    async def aremove(self) -> None:
+        if self._async_session is not None:
+            await self._async_session.remove()
+
+    def _after_fork(self) -> None:
+        # The child inherits the parent's pooled connections: drop them without
+        # closing, since the parent still uses them, along with its sessions
+        for engines in self._engines.values():
+            for engine in engines:
+                engine.dispose(close=False)
+        for engines in self._async_engines.values():
+            for engine in engines:
+                engine.sync_engine.dispose(close=False)
+
+        self._session = None
+        self._async_session = None
+        self._engines_lock = Lock()
+
     @classmethod
     def reset(cls):
         cls._instance = None
 
     def _get_engine(self):
-        if self._engine:
-            return self._engine
+        return self.get_engine(DEFAULT_DATABASE)
+
+    def _get_async_engine(self):
+        return self.get_async_engine(DEFAULT_DATABASE)
+
+    def get_engine(self, database: str = DEFAULT_DATABASE):
+        """
+        Engine of the named database; for a group of URIs, the one picked by the
+        `replica_balancing` strategy.
+        """
+        engines = self._engines.get(database)
+        if engines is None:
+            engines = self._group_engines(
+                database, self._engines, self.databases.get(database), create_engine
+            )
+        return self._pick(database, engines)
+
+    def get_async_engine(self, database: str = DEFAULT_DATABASE):
+        engines = self._async_engines.get(database)
+        if engines is None:
+            from sqlalchemy.ext.asyncio import create_async_engine
+
+            engines = self._group_engines(
+                database,
+                self._async_engines,
+                self._async_uris(database),
+                create_async_engine,
+            )
+        return self._pick(database, engines)
+
+    def _async_uris(self, database: str) -> Optional[List[str]]:
+        async_databases = Config.get("async_databases") or {}
+        if database in async_databases:
+            uris = async_databases[database]
+            return [uris] if isinstance(uris, str) else list(uris)
+
+        async_db_uri = Config.get("async_db_uri") or os.environ.get("ASYNC_DB_URI")
+        if database == DEFAULT_DATABASE and async_db_uri:
+            return [async_db_uri]
+        return self.databases.get(database)
+
+    def _group_engines(
+        self, database: str, engines: dict, uris: Optional[List[str]], factory
+    ) -> list:
+        if database not in self.databases:
+            raise ValueError(
+                f"Unknown database '{database}', "
+                f"expected one of: {', '.join(self.databases)}"
+            )
+
+        with self._engines_lock:
+            if database not in engines:
+                engines[database] = [
+                    self._build_engine(uri, factory, self._pool_metrics[database])
+                    for uri in uris
+                ]
+            return engines[database]
+
+    def _pick(self, database: str, engines: list):
+        if len(engines) == 1:
+            return engines[0]
+
+        strategy = Config.get("replica_balancing") or "round_robin"
+        if strategy not in BALANCING_STRATEGIES:
+            raise ValueError(
+                f"Unknown replica_balancing '{strategy}', "
+                f"expected one of: {', '.join(BALANCING_STRATEGIES)}"
+            )
+
+        turn = self._turns.setdefault(database, count())
+        start = next(turn) % len(engines)
+        if strategy == "least_loaded":
+            # Fewest connections in use; ties keep the round-robin order
+            rotated = engines[start:] + engines[:start]
+            return min(rotated, key=self._checked_out)
+        return engines[start]
+
+    @staticmethod
+    def _checked_out(engine) -> int:
+        pool = getattr(engine, "sync_engine", engine).pool
+        checkedout = getattr(pool, "checkedout", None)
+        return checkedout() if checkedout else 0
+
+    def _build_engine(self, db_uri, factory, pool_metrics=None):
+        options = self.engine_options()
+        url = make_url(db_uri)
+        pool_class = options.get("poolclass") or url.get_dialect().get_pool_class(url)
+        options["poolclass"] = timed_pool_class(
+            pool_class, pool_metrics or self.pool_metrics
+        )
+
+        engine = factory(url, **options)
+        instrument_engine(engine)
+
+        statement_timeout = Config.get("statement_timeout")
+        if statement_timeout is not None:
+            self._set_statement_timeout(engine, statement_timeout)
+
+        return engine
+
+    def engine_options(self) -> dict:
+        options = dict(Config.get("engine_options") or {})
+        for key in ENGINE_OPTIONS:
+            value = Config.get(key)
+            if value is not None:
+                options[key] = value
+
+        return options
+
+    def pool_stats(self, database: str = DEFAULT_DATABASE) -> dict:
+        """
+        Pool of the database's (first) engine, with checkout metrics for all of them.
+        """
+        self.get_engine(database)
+        pool = self._engines[database][0].pool
+        stats = {"pool": pool.__class__.__name__, "status": pool.status()}
+
+        # Only queue-based pools keep track of their size and overflow
+        for name in ("size", "checkedin", "checkedout", "overflow"):
+            method = getattr(pool, name, None)
+            if method:
+                stats[name] = method()
+
+        stats.update(self._pool_metrics[database].as_dict())
+        return stats
+
+    def _set_statement_timeout(self, engine, timeout_ms: int) -> None:
+        if engine.dialect.name != "postgresql":
+            return
+
+        @event.listens_for(getattr(engine, "sync_engine", engine), "connect")
+        def set_statement_timeout(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute(f"SET statement_timeout = {int(timeout_ms)}")
+            cursor.close()
+            dbapi_connection.commit()
+
+
+def _dispose_after_fork() -> None:
+    connection = Connection._instance
+    if connection is not None and getattr(connection, "_initialized", False):
+        connection._after_fork()
 
-        self._engine = create_engine(self.db_uri)  # type: ignore
 
-        return self._engine
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_dispose_after_fork)
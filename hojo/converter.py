@@ -1,9 +1,14 @@
-from datetime import date, datetime
+import sys
+from datetime import date, datetime, timezone
 from enum import IntEnum, StrEnum
+from functools import lru_cache
+from importlib import import_module
+from typing import Any, Callable, FrozenSet, Optional, Tuple
 from uuid import UUID
 
-import pendulum
+from attrs import fields
 from cattrs import Converter
+from cattrs.gen import make_dict_structure_fn, make_dict_unstructure_fn, override
 
 SchemaConverter = Converter()
 
@@ -41,27 +46,218 @@ def _structure_strenum(value, enum_type):
 SchemaConverter.register_unstructure_hook(IntEnum, _unstructure_strenum)
 SchemaConverter.register_structure_hook(IntEnum, _structure_strenum)
 
+
+# datetime / date converters. Values that are already typed pass through, strict
+# ISO-8601 strings go through the C `fromisoformat`, and only anything else is left
+# to `pendulum.parse`.
+#
+# pendulum is only imported once a pendulum type shows up: hooks are picked per
+# declared type, so schemas using the stdlib types never load it.
+def _is_pendulum(cls: type) -> bool:
+    return any(base.__module__.startswith("pendulum") for base in cls.__mro__)
+
+
+def _is_datetime(cls: Any) -> bool:
+    return isinstance(cls, type) and issubclass(cls, datetime)
+
+
+def _is_date(cls: Any) -> bool:
+    return isinstance(cls, type) and issubclass(cls, date) and not _is_datetime(cls)
+
+
+def _pendulum():
+    return sys.modules.get("pendulum") or import_module("pendulum")
+
+
+def _as_pendulum_datetime(value: datetime) -> datetime:
+    pendulum = _pendulum()
+    if isinstance(value, pendulum.DateTime):
+        return value
+
+    tzinfo = value.tzinfo
+    if tzinfo is None or tzinfo is timezone.utc:
+        # pendulum takes naive datetimes as UTC too
+        tzinfo = pendulum.UTC
+    elif not isinstance(tzinfo, (pendulum.Timezone, pendulum.FixedTimezone)):
+        tzinfo = pendulum.fixed_timezone(int(value.utcoffset().total_seconds()))
+
+    return pendulum.DateTime(
+        value.year,
+        value.month,
+        value.day,
+        value.hour,
+        value.minute,
+        value.second,
+        value.microsecond,
+        tzinfo=tzinfo,
+        fold=value.fold,
+    )
+
+
+def _parse_datetime(value: datetime | str) -> datetime:
+    if isinstance(value, datetime):
+        return value
+
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return _pendulum().parse(value)
+
+
+def _parse_date(value: date | str) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return _pendulum().parse(value).date()
+
+
+def _isoformat(value: date) -> str:
+    return value.isoformat()
+
+
 # pendulum.Date converter
-SchemaConverter.register_unstructure_hook(pendulum.Date, lambda dt: dt.to_date_string())
-SchemaConverter.register_structure_hook(
-    pendulum.Date, lambda dt, _: pendulum.parse(dt).date()
-)
+def _unstructure_pendulum_date(pd: date) -> str:
+    return pd.to_date_string()  # type: ignore
+
+
+def _structure_pendulum_date(value, _):
+    pendulum = _pendulum()
+    value = _parse_date(value)
+    if isinstance(value, pendulum.Date):
+        return value
+
+    return pendulum.Date(value.year, value.month, value.day)
 
 
 # pendulum.DateTime converter
-def _unstructure_pendulum_datetime(pdt: pendulum.DateTime | datetime):
+def _unstructure_pendulum_datetime(pdt: datetime) -> str:
     if type(pdt) == datetime:
-        return pendulum.instance(pdt).to_iso8601_string()
+        return _pendulum().instance(pdt).to_iso8601_string()
 
     return pdt.to_iso8601_string()  # type: ignore
 
 
 def _structure_pendulum_datetime(value, _):
-    return pendulum.parse(value)
+    return _as_pendulum_datetime(_parse_datetime(value))
+
 
+def _unstructure_datetime_hook(cls: type) -> Callable[[Any], str]:
+    return _unstructure_pendulum_datetime if _is_pendulum(cls) else _isoformat
 
-SchemaConverter.register_unstructure_hook(
-    pendulum.DateTime, _unstructure_pendulum_datetime
+
+def _structure_datetime_hook(cls: type) -> Callable[[Any, type], datetime]:
+    if _is_pendulum(cls):
+        return _structure_pendulum_datetime
+    return lambda dt, _: _parse_datetime(dt)
+
+
+def _unstructure_date_hook(cls: type) -> Callable[[Any], str]:
+    return _unstructure_pendulum_date if _is_pendulum(cls) else _isoformat
+
+
+def _structure_date_hook(cls: type) -> Callable[[Any, type], date]:
+    if _is_pendulum(cls):
+        return _structure_pendulum_date
+    return lambda dt, _: _parse_date(dt)
+
+
+SchemaConverter.register_unstructure_hook_factory(
+    _is_datetime, _unstructure_datetime_hook
 )
+SchemaConverter.register_structure_hook_factory(_is_datetime, _structure_datetime_hook)
+SchemaConverter.register_unstructure_hook_factory(_is_date, _unstructure_date_hook)
+SchemaConverter.register_structure_hook_factory(_is_date, _structure_date_hook)
+
+
+@lru_cache(maxsize=None)
+def native_converter(native_types: Tuple[type, ...]) -> Converter:
+    """
+    Copy of `SchemaConverter` that leaves `native_types` untouched, for JSON backends
+    that serialise them on their own.
+    """
+    converter = SchemaConverter.copy()
+    for native_type in native_types:
+        converter.register_unstructure_hook(native_type, lambda value: value)
+
+    return converter
+
+
+# `hojo.base.field` options that make a field a relationship. The two sides of a
+# relationship point at each other, so dumps leave them out unless they are named in
+# `only`, and then write the related ids instead of the objects.
+RELATIONSHIP_KINDS = ("has_many", "belongs_to", "has_one")
+
+
+def is_relationship(attribute) -> bool:
+    metadata = attribute.metadata or {}
+    return any(metadata.get(kind) for kind in RELATIONSHIP_KINDS)
+
+
+def _related_ids(converter: Converter) -> Callable[[Any], Any]:
+    def unstructure(value):
+        if value is None:
+            return None
+        if isinstance(value, (list, tuple, set)):
+            return [converter.unstructure(item.id) for item in value]
+        return converter.unstructure(value.id)
+
+    return unstructure
+
+
+# Specialised (un)structure functions, generated once per class and set of options
+@lru_cache(maxsize=None)
+def dump_fn(
+    cls: type,
+    only: Optional[FrozenSet[str]] = None,
+    exclude: Optional[FrozenSet[str]] = None,
+    skip_none: bool = False,
+    native_types: Tuple[type, ...] = (),
+) -> Callable[[Any], dict]:
+    converter = native_converter(native_types) if native_types else SchemaConverter
+    overrides = {}
+    # Fields that may hold None without it being their default can't use
+    # omit_if_default, so they are checked by name after unstructuring.
+    nullable = []
+
+    for attribute in fields(cls):
+        name = attribute.name
+        relationship = is_relationship(attribute)
+        if only:
+            omitted = name not in only
+        else:
+            omitted = relationship or bool(exclude and name in exclude)
+
+        if omitted:
+            overrides[name] = override(omit=True)
+            continue
+
+        options = {"unstruct_hook": _related_ids(converter)} if relationship else {}
+        if skip_none and attribute.default is None:
+            options["omit_if_default"] = True
+        elif skip_none:
+            nullable.append(name)
+        if options:
+            overrides[name] = override(**options)
+
+    unstructure = make_dict_unstructure_fn(cls, converter, **overrides)
+    if not nullable:
+        return unstructure
+
+    def unstructure_skip_none(obj) -> dict:
+        data = unstructure(obj)
+        for name in nullable:
+            if data[name] is None:
+                del data[name]
+        return data
+
+    return unstructure_skip_none
+
 
-SchemaConverter.register_structure_hook(pendulum.DateTime, _structure_pendulum_datetime)
+@lru_cache(maxsize=None)
+def load_fn(cls: type) -> Callable[[Any, type], Any]:
+    return make_dict_structure_fn(cls, SchemaConverter)
@@ -0,0 +1,44 @@
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from hojo.instrumentation import QueryEvent, _captures
+
+
+class CapturedQueries:
+    def __init__(self) -> None:
+        self.queries: List[QueryEvent] = []
+
+    def append(self, query_event: QueryEvent) -> None:
+        self.queries.append(query_event)
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    @property
+    def statements(self) -> List[str]:
+        return [query_event.sql for query_event in self.queries]
+
+    def __len__(self) -> int:
+        return len(self.queries)
+
+    def __iter__(self) -> Iterator[QueryEvent]:
+        return iter(self.queries)
+
+
+@contextmanager
+def capture_queries() -> Iterator[CapturedQueries]:
+    """
+    Collect the statements the block executes, in its thread or asyncio task, e.g.
+    to assert that a view doesn't run into N+1 queries:
+
+        with capture_queries() as queries:
+            render(Book.objects.select_related("author"))
+        assert queries.count == 1
+    """
+    captured = CapturedQueries()
+    token = _captures.set((*_captures.get(), captured))
+    try:
+        yield captured
+    finally:
+        _captures.reset(token)
@@ -0,0 +1,117 @@
+import json
+from typing import Any, Dict, Tuple, Union
+from uuid import UUID
+
+from hojo.config import Config
+from hojo.converter import SchemaConverter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+# Tried in this order with `json_backend="auto"`
+AUTO_BACKENDS = ("orjson", "msgspec", "json")
+
+
+class JSONBackend:
+    """
+    Encoder/decoder used by `BaseSchema.dumps`, `loads` and `dumps_lines`.
+
+    `native_types` are left as they are by the schema converter and serialised by the
+    backend itself; everything the backend can't handle falls back to the converter's
+    unstructure hooks.
+    """
+
+    name = "json"
+    binary = False
+    native_types: Tuple[type, ...] = ()
+
+    def dumps(self, data: Any) -> Union[str, bytes]:
+        return json.dumps(data)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps_line(self, data: Any) -> Union[str, bytes]:
+        return self.dumps(data) + (b"\n" if self.binary else "\n")
+
+
+class OrjsonBackend(JSONBackend):
+    name = "orjson"
+    binary = True
+    native_types = (UUID,)
+
+    # Same output as the pendulum hooks: UTC as "Z", naive datetimes taken as UTC
+    options = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC if orjson else 0
+
+    def dumps(self, data: Any) -> bytes:
+        return orjson.dumps(
+            data, default=SchemaConverter.unstructure, option=self.options
+        )
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecBackend(JSONBackend):
+    name = "msgspec"
+    binary = True
+    native_types = (UUID,)
+
+    def __init__(self) -> None:
+        self._encoder = msgspec.json.Encoder(enc_hook=SchemaConverter.unstructure)
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, data: Any) -> bytes:
+        return self._encoder.encode(data)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._decoder.decode(data)
+
+
+JSON_BACKENDS = {
+    "json": (JSONBackend, json),
+    "orjson": (OrjsonBackend, orjson),
+    "msgspec": (MsgspecBackend, msgspec),
+}
+
+_instances: Dict[str, JSONBackend] = {}
+
+
+def get_json_backend() -> JSONBackend:
+    """
+    Backend selected with `Hojo.config(json_backend=...)`: a backend name, a
+    `JSONBackend` instance, or "auto" for the fastest one installed. The default is
+    "json", so `dumps()` returns `str` whatever else happens to be installed.
+    """
+    backend = Config.get("json_backend") or "json"
+    if isinstance(backend, JSONBackend):
+        return backend
+
+    try:
+        return _instances[backend]
+    except KeyError:
+        pass
+
+    if backend == "auto":
+        name = next(name for name in AUTO_BACKENDS if JSON_BACKENDS[name][1])
+    elif backend in JSON_BACKENDS:
+        name = backend
+        if JSON_BACKENDS[name][1] is None:
+            raise ValueError(f"JSON backend '{name}' is not installed")
+    else:
+        raise ValueError(
+            f"Unknown JSON backend '{backend}', "
+            f"expected one of: auto, {', '.join(JSON_BACKENDS)}"
+        )
+
+    backend_class = JSON_BACKENDS[name][0]
+    _instances[backend] = _instances.get(name) or backend_class()
+    _instances[name] = _instances[backend]
+    return _instances[backend]
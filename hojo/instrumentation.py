@@ -0,0 +1,223 @@
+import logging
+import os
+import sys
+from collections import defaultdict, deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+
+from hojo.config import Config
+
+logger = logging.getLogger("hojo.queries")
+
+# Durations kept per (model, operation) for the percentiles
+STATS_SAMPLE_SIZE = 1024
+
+_HOJO_DIR = os.path.dirname(os.path.abspath(__file__))
+_SQLALCHEMY_DIR = os.path.dirname(os.path.abspath(event.__file__)).rsplit(os.sep, 1)[0]
+
+
+@dataclass
+class QueryEvent:
+    sql: str
+    params: Any
+    model: Optional[str]
+    operation: str
+    duration: float
+    rows: Optional[int] = None
+    call_site: Optional[str] = None
+
+
+class QueryScope:
+    """
+    Attributes the statements executed inside it to a model and an operation, and
+    holds their events back until the number of rows is known. `database` pins the
+    statements to a named database (see `QuerySet.using`).
+    """
+
+    def __init__(self, model: Any, operation: str, database: Optional[str] = None):
+        self.model = getattr(model, "__name__", None) or type(model).__name__
+        self.operation = operation
+        self.database = database
+        self.rows: Optional[int] = None
+        self.events: List[QueryEvent] = []
+        self._token = None
+
+    def __enter__(self) -> "QueryScope":
+        self._token = _current_scope.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        _current_scope.reset(self._token)
+        if self.events and self.rows is not None:
+            self.events[0].rows = self.rows
+
+        for query_event in self.events:
+            _dispatch(query_event)
+
+        return False
+
+
+_current_scope: ContextVar[Optional[QueryScope]] = ContextVar(
+    "hojo_query_scope", default=None
+)
+
+
+class QueryStats:
+    """
+    In-process count, total and p50/p99 durations per model and operation.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._counts: Dict[Tuple[Optional[str], str], int] = defaultdict(int)
+        self._totals: Dict[Tuple[Optional[str], str], float] = defaultdict(float)
+        self._samples: Dict[Tuple[Optional[str], str], deque] = defaultdict(
+            lambda: deque(maxlen=STATS_SAMPLE_SIZE)
+        )
+
+    def record(self, query_event: QueryEvent) -> None:
+        key = (query_event.model, query_event.operation)
+        with self._lock:
+            self._counts[key] += 1
+            self._totals[key] += query_event.duration
+            self._samples[key].append(query_event.duration)
+
+    def stats(self) -> dict:
+        with self._lock:
+            snapshot = {
+                key: (count, self._totals[key], sorted(self._samples[key]))
+                for key, count in self._counts.items()
+            }
+
+        result: dict = {}
+        for (model, operation), (count, total, samples) in snapshot.items():
+            result.setdefault(model, {})[operation] = {
+                "count": count,
+                "total": total,
+                "p50": _percentile(samples, 0.50),
+                "p99": _percentile(samples, 0.99),
+            }
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self._totals.clear()
+            self._samples.clear()
+
+
+QUERY_STATS = QueryStats()
+
+# Active `hojo.debug.capture_queries` blocks, per thread and asyncio task like the
+# query scopes, so a block only sees its own statements
+_captures: ContextVar[Tuple[Any, ...]] = ContextVar("hojo_captures", default=())
+
+
+def _percentile(samples: list, fraction: float) -> float:
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def current_scope() -> Optional[QueryScope]:
+    return _current_scope.get()
+
+
+def query_stats() -> dict:
+    return QUERY_STATS.stats()
+
+
+def query_hooks() -> List[Callable[[QueryEvent], Any]]:
+    """
+    Callbacks registered with `Hojo.config(query_hooks=[...])`; each one receives
+    a `QueryEvent` for every statement hojo's engines execute.
+    """
+    return Config.get("query_hooks") or []
+
+
+def record_mapping(model: Any, mapped: int, duration: float) -> None:
+    """
+    Cold-start cost: time spent mapping models, reported by `query_stats()` as the
+    "map" operation of the model that triggered it (None for `automap()`).
+    """
+    name = getattr(model, "__name__", None)
+    QUERY_STATS.record(
+        QueryEvent(sql="", params=None, model=name, operation="map", duration=duration)
+    )
+    logger.debug("Mapped %d model(s) for %s in %.3fs", mapped, name, duration)
+
+
+def call_site() -> Optional[str]:
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        # "<string>" frames come from code SQLAlchemy generates at runtime
+        if not filename.startswith((_HOJO_DIR, _SQLALCHEMY_DIR, "<")):
+            return f"{filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+def instrument_engine(engine) -> None:
+    sync_engine = getattr(engine, "sync_engine", engine)
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._hojo_started = perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = perf_counter() - context._hojo_started
+    scope = _current_scope.get()
+
+    rowcount = getattr(cursor, "rowcount", -1)
+    query_event = QueryEvent(
+        sql=statement,
+        params=parameters,
+        model=scope.model if scope else None,
+        operation=scope.operation if scope else statement.split(None, 1)[0].lower(),
+        duration=duration,
+        rows=rowcount if rowcount is not None and rowcount >= 0 else None,
+    )
+
+    # Walking the stack is only worth it when someone is going to look at it
+    threshold = Config.get("slow_query_threshold")
+    if (
+        _captures.get()
+        or query_hooks()
+        or (threshold is not None and duration >= threshold)
+    ):
+        query_event.call_site = call_site()
+
+    if scope is not None:
+        scope.events.append(query_event)
+    else:
+        _dispatch(query_event)
+
+
+def _dispatch(query_event: QueryEvent) -> None:
+    QUERY_STATS.record(query_event)
+
+    for captured in _captures.get():
+        captured.append(query_event)
+
+    threshold = Config.get("slow_query_threshold")
+    if threshold is not None and query_event.duration >= threshold:
+        logger.warning(
+            "Slow query (%.3fs) %s.%s at %s: %s",
+            query_event.duration,
+            query_event.model,
+            query_event.operation,
+            query_event.call_site,
+            query_event.sql,
+        )
+
+    for hook in query_hooks():
+        hook(query_event)
@@ -0,0 +1,61 @@
+from typing import Optional
+
+from sqlalchemy import func
+
+
+class Aggregate:
+    """
+    SQL aggregate over a model field, for `QuerySet.aggregate` and `annotate`:
+
+        Order.objects.aggregate(total=Sum("amount"), orders=Count("id"))
+        Order.objects.values("status").annotate(total=Sum("amount"))
+    """
+
+    function = ""
+
+    def __init__(self, field: str = "*", distinct: bool = False) -> None:
+        self.field = field
+        self.distinct = distinct
+
+    @property
+    def default_alias(self) -> str:
+        if self.field == "*":
+            return self.function
+        return f"{self.field}__{self.function}"
+
+    def key(self) -> tuple:
+        return (self.function, self.field, self.distinct)
+
+    def resolve(self, column: Optional[object]):
+        if self.distinct:
+            column = column.distinct()
+        return getattr(func, self.function)(column)
+
+    def __repr__(self) -> str:
+        distinct = ", distinct=True" if self.distinct else ""
+        return f"{self.__class__.__name__}({self.field!r}{distinct})"
+
+
+class Count(Aggregate):
+    function = "count"
+
+    def resolve(self, column: Optional[object]):
+        if column is None:
+            return func.count()
+        return super().resolve(column)
+
+
+class Sum(Aggregate):
+    function = "sum"
+
+
+class Avg(Aggregate):
+    function = "avg"
+
+
+class Min(Aggregate):
+    function = "min"
+
+
+class Max(Aggregate):
+    function = "max"
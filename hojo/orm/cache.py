@@ -0,0 +1,162 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, Hashable, Iterable, Optional, Tuple
+
+from attrs import fields
+
+from hojo.config import Config
+
+DEFAULT_QUERY_CACHE_SIZE = 500
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache that keeps hit and miss counters.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        maxsize = self.maxsize
+        if maxsize <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class QueryCache(LRUCache):
+    """
+    Statements built by `QuerySet`, keyed by the shape of the query (model, filter
+    fields, lookups, exclude flags and ordering) and holding bind parameters in place
+    of values. Reusing the same statement object lets SQLAlchemy skip both cache-key
+    generation and compilation on repeated executions.
+
+    The size is read from `Hojo.config(query_cache_size=...)`; 0 disables it.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(DEFAULT_QUERY_CACHE_SIZE)
+
+    @property
+    def maxsize(self) -> int:
+        size = Config.get("query_cache_size")
+        return self._maxsize if size is None else size
+
+
+QUERY_CACHE = QueryCache()
+
+
+class ModelCache(LRUCache):
+    """
+    Opt-in, process-local read-through cache for `get()` lookups by `id` or by a
+    `field(unique=True)` field. Declare it on a model to enable it:
+
+        @model
+        class Setting:
+            key: str = field(unique=True)
+
+            cache = ModelCache(maxsize=1000, ttl=60)
+
+    Entries expire after `ttl` seconds (never when `ttl` is None) and are dropped by
+    hojo's own writes on the model. They hold column values only: each hit is a
+    copy merged into the caller's session, without a query.
+    """
+
+    def __init__(self, maxsize: int = 1000, ttl: Optional[float] = None) -> None:
+        super().__init__(maxsize)
+        self.ttl = ttl
+        self.keys: Tuple[str, ...] = ("id",)
+        self.invalidations = 0
+
+    def bind(self, model_class: type) -> "ModelCache":
+        unique = [
+            attr.name for attr in fields(model_class) if attr.metadata.get("unique")
+        ]
+        self.keys = ("id", *unique)
+        return self
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = super().get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= monotonic():
+            with self._lock:
+                self._entries.pop(key, None)
+                # Counted as a hit by the lookup above
+                self.hits -= 1
+                self.misses += 1
+            return None
+
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = None if self.ttl is None else monotonic() + self.ttl
+        super().set(key, (expires_at, value))
+
+    def cache_keys(self, obj: Any) -> list:
+        return [(name, getattr(obj, name, None)) for name in self.keys]
+
+    def discard(self, keys: Iterable[Hashable]) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def invalidate(self) -> None:
+        """
+        Drop every entry, keeping the hit and miss counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        return {**super().stats(), "ttl": self.ttl, "invalidations": self.invalidations}
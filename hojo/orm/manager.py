@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Optional, TypeVar
+from copy import copy
+from typing import Any, Iterator, Optional, TypeVar
 
 from hojo.connection import Connection
-from hojo.orm.queryset import QuerySet
+from hojo.orm.queryset import DEFAULT_CHUNK_SIZE, AsyncQuerySet, QuerySet
 from hojo.schema import BaseSchema
 
 T = TypeVar("T")
@@ -28,6 +29,11 @@ class Manager:
     def model_class(self, value: type[T]) -> None:
         self._model_class = value
 
+    def bind(self, model_class: type[T]) -> Manager:
+        manager = copy(self)
+        manager.model_class = model_class
+        return manager
+
     def get_queryset(self) -> QuerySet[T]:
         return QuerySet(self._model_class, Connection().session)
 
@@ -40,6 +46,14 @@ class Manager:
     def exclude(self, **kwargs) -> QuerySet[T]:
         return self.get_queryset().exclude(**kwargs)
 
+    def iterator(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE, expunge: bool = False
+    ) -> Iterator[T]:
+        return self.get_queryset().iterator(chunk_size=chunk_size, expunge=expunge)
+
+    def parallel_map(self, func, **kwargs) -> Any:
+        return self.get_queryset().parallel_map(func, **kwargs)
+
     def first(self) -> T:
         return self.get_queryset().first()
 
@@ -55,14 +69,32 @@ class Manager:
     def get(self, **kwargs) -> T:
         return self.get_queryset().get(**kwargs)
 
-    def get_or_create(self, **kwargs) -> T:
+    def get_or_create(self, **kwargs) -> tuple[T, bool]:
         return self.get_queryset().get_or_create(**kwargs)
 
-    def bulk_create(self, objs):
-        return self.get_queryset().bulk_create(objs)
-
-    def bulk_update(self, objs):
-        return self.get_queryset().bulk_update(objs)
+    def update_or_create(self, **kwargs) -> tuple[T, bool]:
+        return self.get_queryset().update_or_create(**kwargs)
+
+    def bulk_create(
+        self,
+        objs,
+        batch_size: Optional[int] = None,
+        on_conflict: Optional[str] = None,
+        conflict_fields: Optional[list[str]] = None,
+    ) -> list[T]:
+        return self.get_queryset().bulk_create(
+            objs,
+            batch_size=batch_size,
+            on_conflict=on_conflict,
+            conflict_fields=conflict_fields,
+        )
+
+    def bulk_update(
+        self, objs, fields: Optional[list[str]] = None, batch_size: Optional[int] = None
+    ) -> int:
+        return self.get_queryset().bulk_update(
+            objs, fields=fields, batch_size=batch_size
+        )
 
     def count(self) -> int:
         return self.get_queryset().count()
@@ -70,26 +102,42 @@ class Manager:
     def order_by(self, *fields: str) -> QuerySet[T]:
         return self.get_queryset().order_by(*fields)
 
-    def values(self, *fields: str) -> list[dict]:
+    def paginate_by_key(
+        self, order_field: str = "id", after: Any = None, page_size: int = 50
+    ) -> QuerySet[T]:
+        return self.get_queryset().paginate_by_key(
+            order_field, after=after, page_size=page_size
+        )
+
+    def values(self, *fields: str) -> QuerySet[dict]:
         return self.get_queryset().values(*fields)
 
-    def values_list(self, *fields: str, flat=False) -> list:
+    def values_list(self, *fields: str, flat=False) -> QuerySet[Any]:
         return self.get_queryset().values_list(*fields, flat=flat)
 
     def exists(self) -> bool:
         return self.get_queryset().exists()
 
     def delete(self) -> None:
-        self.get_queryset().delete()
+        return self.get_queryset().delete()
 
     def update(self, **kwargs) -> None:
-        self.get_queryset().update(**kwargs)
+        return self.get_queryset().update(**kwargs)
 
     def annotate(self, **kwargs) -> QuerySet[T]:
         return self.get_queryset().annotate(**kwargs)
 
-    def aggregate(self, **kwargs) -> dict:
-        return self.get_queryset().aggregate(**kwargs)
+    def aggregate(self, *args, **kwargs) -> dict:
+        return self.get_queryset().aggregate(*args, **kwargs)
+
+    def using(self, database: str) -> QuerySet[T]:
+        return self.get_queryset().using(database)
+
+    def select_related(self, *fields: str) -> QuerySet[T]:
+        return self.get_queryset().select_related(*fields)
+
+    def prefetch_related(self, *fields: str) -> QuerySet[T]:
+        return self.get_queryset().prefetch_related(*fields)
 
     def reverse(self) -> QuerySet[T]:
         return self.get_queryset().reverse()
@@ -98,14 +146,30 @@ class Manager:
         return self.get_queryset().distinct()
 
 
+class AsyncManager(Manager):
+    """
+    Manager whose querysets run on the async engine: every database-bound method
+    returns an awaitable, e.g. `await Model.aobjects.filter(...).all()`.
+    """
+
+    def get_queryset(self) -> AsyncQuerySet[T]:
+        return AsyncQuerySet(self._model_class, Connection().async_session)
+
+
 class ModelDescriptor:
     def __init__(self, manager):
         self.manager = manager
+        self._bound_managers: dict[type, Manager] = {}
 
     def __get__(self, instance, owner):
         if instance is not None:
             raise AttributeError("Manager isn't accessible via model instances")
 
-        # Bind the model class to the manager and return it
-        self.manager.model_class = owner
-        return self.manager
+        # Each model gets its own copy of the manager, bound once on first access
+        manager = self._bound_managers.get(owner)
+        if manager is None:
+            from hojo.orm.mapper import ensure_mapped
+
+            ensure_mapped(owner)
+            manager = self._bound_managers.setdefault(owner, self.manager.bind(owner))
+        return manager
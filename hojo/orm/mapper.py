@@ -1,45 +1,352 @@
+from dataclasses import dataclass
+from datetime import timezone
 from enum import EnumType
-from typing import Union, get_args, get_origin
+from functools import lru_cache
+from threading import RLock
+from time import perf_counter
+from typing import Dict, Optional, Union, get_args, get_origin
+from weakref import WeakKeyDictionary
 
 from attrs import fields, resolve_types
 from pluralizer import Pluralizer
-from sqlalchemy import Column, Index, Table
-from sqlalchemy.dialects.postgresql import UUID as SQLAlchemyUUID
-from sqlalchemy.orm import registry
-from sqlalchemy.types import Boolean, Date, DateTime, Float, Integer, String
+from sqlalchemy import (
+    Column,
+    ForeignKey,
+    ForeignKeyConstraint,
+    Index,
+    Table,
+    UniqueConstraint,
+    inspect,
+)
+from sqlalchemy.orm import registry, relationship
+from sqlalchemy.types import (
+    Boolean,
+    Date,
+    DateTime,
+    Float,
+    Integer,
+    String,
+    TypeDecorator,
+    Uuid,
+)
 from sqlalchemy_utils.types import EnrichedDateTimeType, EnrichedDateType
 
 from hojo.base import BaseModel
+from hojo.converter import RELATIONSHIP_KINDS
+from hojo.instrumentation import record_mapping
 
 MAPPER_REGISTRY = registry()
 
 
-def automap(registry=None):
+# registry -> {model: table} of the models already mapped in it
+_mapped_tables: "WeakKeyDictionary[registry, Dict[type, Table]]" = WeakKeyDictionary()
+_mapping_lock = RLock()
+
+# Set by `automap(lazy=True)`: models are mapped into it on first use
+_lazy_registry: Optional[registry] = None
+
+# model -> class attributes replaced by lazy mapping hooks, to restore when mapped
+_lazy_hooks: Dict[type, dict] = {}
+
+
+def automap(registry=None, lazy=False):
+    """
+    Map every declared model. With `lazy=True` nothing is mapped up front: each
+    model is mapped, together with the models it has relationships with, the first
+    time its manager or one of its columns is used.
+    """
+    global _lazy_registry
+
+    if lazy:
+        _lazy_registry = registry or MAPPER_REGISTRY
+        with _mapping_lock:
+            mapped = _mapped_tables.get(_lazy_registry, {})
+            for model in BaseModel._registry:
+                if model not in mapped and not _is_mapped(model):
+                    _install_lazy_hooks(model)
+        return _lazy_registry
+
+    return map_models(BaseModel._registry, registry)
+
+
+def map_models(models, registry=None):
     registry = registry or MAPPER_REGISTRY
+    with _mapping_lock:
+        _map_models(models, registry)
+    return registry
+
+
+def ensure_mapped(model) -> bool:
+    """
+    Map `model` into the lazy registry if it isn't mapped yet; returns whether it
+    mapped anything.
+    """
+    mapper_registry = _lazy_registry
+    if mapper_registry is None or model in _mapped_tables.get(mapper_registry, ()):
+        return False
+    if model not in BaseModel._registry or _is_mapped(model):
+        return False
+
+    with _mapping_lock:
+        return bool(_map_models(_related_models(model), mapper_registry, model))
+
+
+class _LazyAttribute:
+    """
+    Stands in for a field of a model awaiting lazy mapping; the first access maps
+    the model, which replaces it with the mapped column.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance, owner):
+        _map_on_first_use(owner)
+        return getattr(owner if instance is None else instance, self.name)
+
+    def __set__(self, instance, value) -> None:
+        _map_on_first_use(type(instance))
+        setattr(instance, self.name, value)
+
+
+def _lazy_init(self, *args, **kwargs) -> None:
+    # Instances need the mapped class, so the model is mapped before the first one
+    _map_on_first_use(type(self))
+    type(self).__init__(self, *args, **kwargs)
+
+
+def _map_on_first_use(model) -> None:
+    with _mapping_lock:
+        _remove_lazy_hooks(model)
+        ensure_mapped(model)
+
+
+def _is_mapped(model) -> bool:
+    return inspect(model, raiseerr=False) is not None
+
+
+def _install_lazy_hooks(model) -> None:
+    if model in _lazy_hooks:
+        return
+
+    names = ["__init__", *(field_info.name for field_info in fields(model))]
+    _lazy_hooks[model] = {name: model.__dict__.get(name) for name in names}
+
+    model.__init__ = _lazy_init
+    for name in names[1:]:
+        setattr(model, name, _LazyAttribute(name))
+
+
+def _remove_lazy_hooks(model) -> None:
+    originals = _lazy_hooks.pop(model, None)
+    if originals is None:
+        return
+
+    for name, original in originals.items():
+        if original is None:
+            delattr(model, name)
+        else:
+            setattr(model, name, original)
+
+
+def _map_models(models, registry, trigger=None) -> list:
+    started = perf_counter()
+    tables = _mapped_tables.setdefault(registry, {})
+
+    builders = []
+    for model in dict.fromkeys(models):
+        if model not in tables:
+            builders.append(TableBuilder(registry, model))
+    if not builders:
+        return builders
+
+    for builder in builders:
+        _remove_lazy_hooks(builder.model)
+        builder.build_table()
+
+    properties = build_relationships(builders, tables)
+    for builder in builders:
+        builder.automap(properties[builder.model])
+        tables[builder.model] = builder.table
+
+    record_mapping(trigger, len(builders), perf_counter() - started)
+    return builders
+
+
+def _related_models(model) -> list:
+    """
+    `model` and every model connected to it through relationships, in either
+    direction: their foreign keys and `relationship()` properties are built together.
+    """
+    referenced_by: Dict[type, list] = {}
+    for other in BaseModel._registry:
+        for target in _relationship_targets(other):
+            referenced_by.setdefault(target, []).append(other)
+
+    related, pending = {}, [model]
+    while pending:
+        current = pending.pop()
+        if current in related:
+            continue
+        related[current] = True
+        pending.extend(_relationship_targets(current))
+        pending.extend(referenced_by.get(current, ()))
+
+    return list(related)
+
+
+@lru_cache(maxsize=None)
+def _relationship_targets(model) -> tuple:
+    targets = []
+    for field_info in fields(model):
+        metadata = field_info.metadata or {}
+        for kind in RELATIONSHIP_KINDS:
+            if metadata.get(kind):
+                targets.append(resolve_model(metadata[kind]))
+    return tuple(targets)
+
+
+def resolve_model(target):
+    if not isinstance(target, str):
+        return target
 
     for model in BaseModel._registry:
-        builder = TableBuilder(registry, model)
-        builder.automap()
+        if model.__name__ == target:
+            return model
+
+    raise ValueError(f"Unknown model in relationship: {target}")
+
+
+def build_relationships(builders, mapped_tables=None):
+    """
+    Turn the `has_many` / `belongs_to` / `has_one` fields of the given models into
+    foreign keys and `relationship()` properties, keyed by model.
+
+    The foreign key always lives on the "many" side: `belongs_to` adds
+    `<field>_id` to its own table, while `has_many` / `has_one` reuse the matching
+    `belongs_to` of the target or add `<model>_id` to the target table.
+
+    `mapped_tables` are the tables of models mapped earlier, which relationships of
+    the new models may point to.
+    """
+    tables = {**(mapped_tables or {})}
+    tables.update({builder.model: builder.table for builder in builders})
+    specs = [
+        spec
+        for builder in builders
+        for spec in builder.relationship_manager.get_relationships().values()
+    ]
+    properties = {builder.model: {} for builder in builders}
+
+    for spec in specs:
+        if spec.target not in tables:
+            raise ValueError(
+                f"{spec.model.__name__}.{spec.field_name} points to an unmapped "
+                f"model: {spec.target.__name__}"
+            )
+
+        back_reference = spec.back_reference(specs)
+
+        if spec.kind == "belongs_to":
+            table, column_name = tables[spec.model], f"{spec.field_name}_id"
+        elif back_reference:
+            table, column_name = tables[spec.target], f"{back_reference.field_name}_id"
+        else:
+            table = tables[spec.target]
+            column_name = f"{spec.model.__name__.lower()}_id"
+
+        referred_table = tables[
+            spec.target if spec.kind == "belongs_to" else spec.model
+        ]
+        column = _foreign_key_column(table, column_name, referred_table)
+
+        options = {}
+        if spec.kind == "belongs_to" and spec.target is spec.model:
+            options["remote_side"] = [referred_table.c.id]
+
+        properties[spec.model][spec.field_name] = relationship(
+            spec.target,
+            foreign_keys=[column],
+            uselist=spec.kind == "has_many",
+            back_populates=back_reference.field_name if back_reference else None,
+            **options,
+        )
+
+    return properties
+
+
+def _foreign_key_column(table, column_name, referred_table):
+    referred_column = referred_table.c.id
+
+    if column_name in table.c:
+        column = table.c[column_name]
+        if not column.foreign_keys:
+            table.append_constraint(ForeignKeyConstraint([column], [referred_column]))
+        return column
+
+    column = Column(
+        column_name,
+        referred_column.type,
+        ForeignKey(referred_column),
+        nullable=True,
+        index=True,
+    )
+    table.append_column(column)
+    return column
+
+
+@lru_cache(maxsize=None)
+def _pluralizer() -> Pluralizer:
+    return Pluralizer()
+
+
+@lru_cache(maxsize=None)
+def table_name(model_name: str) -> str:
+    return _pluralizer().plural(model_name.lower())
+
+
+class UTCDateTime(TypeDecorator):
+    """
+    Stdlib `datetime` stored like the pendulum columns: as naive UTC, so no
+    database or session time zone gets involved, and loaded back as aware UTC.
+    Naive values are taken to be UTC already.
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is not None and value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    def process_result_value(self, value, dialect):
+        if value is not None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value
 
-    return registry
+
+TYPE_MAPPING = {
+    "int": Integer,
+    "float": Float,
+    "str": String,
+    "bool": Boolean,
+    "datetime": UTCDateTime,
+    "date": Date,
+    "UUID": Uuid(as_uuid=True),
+}
 
 
 class TypeTranslator:
-    def __init__(self, model):
-        self.model = model
-        self.type_mapping = {
-            "int": Integer,
-            "float": Float,
-            "str": String,
-            "bool": Boolean,
-            "datetime": DateTime,
-            "date": Date,
-            "UUID": SQLAlchemyUUID(as_uuid=True),
-        }
+    """
+    Translates attrs fields to column types. Stateless, so one instance is shared by
+    every `TableBuilder`; fields must have their types resolved beforehand.
+    """
 
-        resolve_types(self.model)
+    def __init__(self, type_mapping=None):
+        self.type_mapping = type_mapping or TYPE_MAPPING
 
-    def translate(self, field):
+    def translate(self, field, model):
         field_type = field.type
         origin_type = get_origin(field_type)
         field_args = get_args(field_type)
@@ -62,16 +369,52 @@ class TypeTranslator:
             return String
         else:
             raise TypeError(
-                f"Unsupported type: {field_type} for {self.model.__name__}.{field_type_name}'"
+                f"Unsupported type: {field_type} for {model.__name__}.{field.name}"
             )
 
 
+TYPE_TRANSLATOR = TypeTranslator()
+
+
+@dataclass
+class RelationshipSpec:
+    model: type
+    field_name: str
+    kind: str
+    target: type
+
+    def back_reference(self, specs) -> Optional["RelationshipSpec"]:
+        if self.kind == "belongs_to":
+            wanted = ("has_many", "has_one")
+        else:
+            wanted = ("belongs_to",)
+
+        for spec in specs:
+            if (
+                spec is not self
+                and spec.model is self.target
+                and spec.target is self.model
+                and spec.kind in wanted
+            ):
+                return spec
+
+        return None
+
+
 class RelationshipManager:
-    def __init__(self):
+    def __init__(self, model=None):
+        self.model = model
         self.relationships = {}
 
     def add_relationship(self, field_name, field_info):
-        pass
+        metadata = field_info.metadata or {}
+        for kind in RELATIONSHIP_KINDS:
+            target = metadata.get(kind)
+            if target:
+                self.relationships[field_name] = RelationshipSpec(
+                    self.model, field_name, kind, resolve_model(target)
+                )
+                return
 
     def get_relationships(self):
         return self.relationships
@@ -81,10 +424,13 @@ class TableBuilder:
     def __init__(self, mapper_registry, model):
         self.mapper_registry = mapper_registry
         self.model = model
-        self.translator = TypeTranslator(model)
-        self.relationship_manager = RelationshipManager()
+        self.translator = TYPE_TRANSLATOR
+        self.relationship_manager = RelationshipManager(model)
+        self.table = None
 
     def build_table(self):
+        resolve_types(self.model)
+
         columns = []
         uniques = {}
         indexes = {}
@@ -94,7 +440,7 @@ class TableBuilder:
                 self.relationship_manager.add_relationship(field_info.name, field_info)
                 continue
 
-            column_type = self.translator.translate(field_info)
+            column_type = self.translator.translate(field_info, self.model)
 
             is_primary_key = field_info.name == "id"  # id is the primary key by default
             is_nullable = field_info.default is None
@@ -118,13 +464,17 @@ class TableBuilder:
             index_name = "ix_" + "_".join(idx_fields)
             columns.append(Index(index_name, *idx_fields))
 
-        table = Table(
-            Pluralizer().plural((self.model.__name__.lower())),
-            self.mapper_registry.metadata,
-            *columns,
-        )
+        name = table_name(self.model.__name__)
+
+        # `field(unique="group")` fields share one composite constraint per group
+        for unique in uniques:
+            unique_fields = sorted(uniques[unique])
+            unique_name = f"uq_{name}_" + "_".join(unique_fields)
+            columns.append(UniqueConstraint(*unique_fields, name=unique_name))
+
+        self.table = Table(name, self.mapper_registry.metadata, *columns)
 
-        return table
+        return self.table
 
     def get_constraint(self, contraint_type, contraints, field_info):
         idx = field_info.metadata.get(contraint_type)
@@ -143,10 +493,11 @@ class TableBuilder:
         info = getattr(field_info, "metadata") or {}
         return info.get("has_many") or info.get("belongs_to") or info.get("has_one")
 
-    def automap(self):
-        table = self.build_table()
+    def automap(self, properties=None):
+        table = self.table if self.table is not None else self.build_table()
 
         self.mapper_registry.map_imperatively(
             self.model,
             table,
+            properties=properties or {},
         )
@@ -0,0 +1,208 @@
+import os
+import pickle
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from functools import reduce as reduce_values
+from math import ceil
+from multiprocessing import get_all_start_methods, get_context
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import func as sql_func
+from sqlalchemy import select
+
+from hojo.config import Config
+
+# Ranges per worker: more, smaller ranges even out skewed ones
+CHUNKS_PER_WORKER = 4
+
+_MISSING = object()
+
+
+@dataclass
+class Chunk:
+    """
+    A key range of a queryset, with what a worker process needs to rebuild the
+    queryset on its own connection.
+    """
+
+    model_class: type
+    lookups: list
+    fields: Optional[Tuple[str, ...]]
+    values_mode: Optional[str]
+    select_related: Tuple[str, ...]
+    prefetch_related: Tuple[str, ...]
+    database: Optional[str]
+    chunk_by: str
+    low: Any
+    high: Any
+    func: Callable
+    reduce: Optional[Callable] = None
+
+    def queryset(self, session):
+        from hojo.orm.queryset import QuerySet
+
+        queryset = QuerySet(self.model_class, session)
+        queryset.lookup_filters = list(self.lookups)
+        if self.fields is not None:
+            queryset = queryset._values(self.fields, self.values_mode)
+        queryset._select_related = self.select_related
+        queryset._prefetch_related = self.prefetch_related
+        if self.database is not None:
+            queryset = queryset.using(self.database)
+
+        bounds = {}
+        if self.low is not None:
+            bounds[f"{self.chunk_by}__gt"] = self.low
+        if self.high is not None:
+            bounds[f"{self.chunk_by}__lte"] = self.high
+        return queryset.filter(**bounds)
+
+
+def run_chunk(chunk: Chunk) -> Tuple[bool, Any]:
+    """
+    Runs in a worker process: maps `func` over the rows of the range and returns
+    the results, or `(has_value, value)` of their reduction.
+    """
+    from hojo.connection import Connection
+    from hojo.sessions import session_scope
+
+    with session_scope():
+        rows = chunk.queryset(Connection().session).iterator(expunge=True)
+        values = map(chunk.func, rows)
+        if chunk.reduce is None:
+            return True, list(values)
+        return fold(chunk.reduce, values)
+
+
+def fold(function: Callable, values: Iterable) -> Tuple[bool, Any]:
+    # `functools.reduce`, but an empty range has no value rather than raising
+    values = iter(values)
+    first = next(values, _MISSING)
+    if first is _MISSING:
+        return False, None
+    return True, reduce_values(function, values, first)
+
+
+def key_ranges(queryset, chunk_by: str, chunks: int) -> List[Tuple[Any, Any]]:
+    """
+    Split the filtered rows into about `chunks` disjoint `(low, high]` ranges of
+    `chunk_by` with as many rows each, `None` meaning unbounded.
+    """
+    total = queryset.count()
+    if not total:
+        return []
+
+    column = getattr(queryset.model_class, chunk_by)
+    numbered = (
+        select(
+            column.label("key"),
+            sql_func.row_number().over(order_by=column).label("position"),
+        )
+        .where(*queryset.compile_conditions())
+        .subquery()
+    )
+    step = max(1, ceil(total / chunks))
+    query = (
+        select(numbered.c.key)
+        .where(numbered.c.position % step == 0, numbered.c.position < total)
+        .order_by(numbered.c.position)
+    )
+    with queryset._scope("parallel_map"):
+        boundaries = list(dict.fromkeys(queryset.session.scalars(query)))
+
+    lows = [None, *boundaries]
+    highs = [*boundaries, None]
+    return list(zip(lows, highs))
+
+
+def worker_context():
+    # Forked workers inherit the configuration and the mapped models; their pools
+    # are reset by the fork hook in `hojo.connection`
+    if "fork" in get_all_start_methods():
+        return get_context("fork")
+    return get_context()
+
+
+def _picklable_config() -> dict:
+    configurations = {}
+    for key, value in Config.instance()._configurations.items():
+        try:
+            pickle.dumps(value)
+        except Exception:
+            continue
+        configurations[key] = value
+    return configurations
+
+
+def _init_worker(configurations: dict) -> None:
+    # Spawned workers start from a blank configuration
+    for key, value in configurations.items():
+        if Config.get(key) is None:
+            Config.set(key, value)
+
+
+def parallel_map(
+    queryset,
+    func: Callable,
+    workers: Optional[int] = None,
+    chunk_by: str = "id",
+    chunks: Optional[int] = None,
+    reduce: Optional[Callable] = None,
+    initial: Any = _MISSING,
+):
+    queryset._assert_not_sliced("parallel_map")
+    if queryset._annotations or queryset._distinct:
+        raise ValueError("parallel_map() cannot split annotated or distinct querysets.")
+
+    workers = workers or os.cpu_count() or 1
+    ranges = key_ranges(queryset, chunk_by, chunks or workers * CHUNKS_PER_WORKER)
+    pending = [
+        Chunk(
+            queryset.model_class,
+            queryset.lookup_filters,
+            queryset._fields,
+            queryset._values_mode,
+            queryset._select_related,
+            queryset._prefetch_related,
+            queryset._database,
+            chunk_by,
+            low,
+            high,
+            func,
+            reduce,
+        )
+        for low, high in ranges
+    ]
+
+    results = _run(pending, workers)
+    if reduce is None:
+        return (value for _, values in results for value in values)
+
+    # Ranges are reduced on their own, so `reduce` must be associative
+    partials = [value for has_value, value in results if has_value]
+    if initial is not _MISSING:
+        return reduce_values(reduce, partials, initial)
+    if not partials:
+        raise TypeError("parallel_map() of an empty queryset with no initial value")
+    return reduce_values(reduce, partials)
+
+
+def _run(chunks: List[Chunk], workers: int) -> Iterator[Tuple[bool, Any]]:
+    if not chunks:
+        return
+
+    executor = ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)),
+        mp_context=worker_context(),
+        initializer=_init_worker,
+        initargs=(_picklable_config(),),
+    )
+    try:
+        futures = {executor.submit(run_chunk, chunk) for chunk in chunks}
+        # Results come back as ranges finish; a failed range raises here
+        while futures:
+            done, futures = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -1,14 +1,93 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, List, Tuple, Type, TypeVar, Union
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
-from sqlalchemy import delete, select, update
+from attrs import fields_dict
+from sqlalchemy import (
+    Integer,
+    UniqueConstraint,
+    asc,
+    bindparam,
+    delete,
+    desc,
+    func,
+    insert,
+    inspect,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import MultipleResultsFound, NoResultFound
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import (
+    MANYTOONE,
+    Mapper,
+    Session,
+    joinedload,
+    make_transient_to_detached,
+    selectinload,
+)
+from sqlalchemy.orm.attributes import set_committed_value
+
+from hojo.config import Config
+from hojo.instrumentation import QueryScope
+from hojo.orm.aggregates import Aggregate
+from hojo.orm.cache import QUERY_CACHE, ModelCache
+from hojo.transaction import reads_uncommitted, should_commit
 
 T = TypeVar("T")
 
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_CHUNK_SIZE = 2000
+
+ON_CONFLICT_ACTIONS = ("ignore", "update")
+
+# Dialects with INSERT ... ON CONFLICT
+UPSERT_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+
+def _chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+@lru_cache(maxsize=None)
+def _foreign_keys(
+    mapper: Mapper,
+) -> Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...]:
+    """
+    `(relationship, ((foreign key column, related column), ...))` of the
+    many-to-one relationships of a mapped model.
+    """
+    return tuple(
+        (
+            relationship.key,
+            tuple(
+                (local.key, remote.key)
+                for local, remote in relationship.local_remote_pairs
+            ),
+        )
+        for relationship in mapper.relationships
+        if relationship.direction is MANYTOONE
+    )
+
 
 @dataclass
 class LookupFilter:
@@ -26,6 +105,17 @@ class QuerySet:
         self._result_cache = None
         self._executed = False
         self.lookup_filters: List[LookupFilter] = []
+        self.ordering: List[str] = []
+        self._reversed = False
+        self._low_mark = 0
+        self._high_mark: Optional[int] = None
+        self._fields: Optional[Tuple[str, ...]] = None
+        self._values_mode: Optional[str] = None
+        self._select_related: Tuple[str, ...] = ()
+        self._prefetch_related: Tuple[str, ...] = ()
+        self._annotations: Dict[str, Aggregate] = {}
+        self._distinct = False
+        self._database: Optional[str] = None
 
     def __iter__(self):
         if not self._executed:
@@ -42,6 +132,32 @@ class QuerySet:
             self._select()
         return bool(self._result_cache)
 
+    def __getitem__(self, key: Union[int, slice]):
+        if self._executed:
+            return self._result_cache[key]
+
+        if isinstance(key, slice):
+            if key.step is not None:
+                raise ValueError("Slicing with a step is not supported.")
+            if (key.start or 0) < 0 or (key.stop is not None and key.stop < 0):
+                raise ValueError("Negative indexing is not supported.")
+
+            cloned_qs = self._clone()
+            cloned_qs._set_limits(key.start or 0, key.stop)
+            return cloned_qs
+
+        if not isinstance(key, int):
+            raise TypeError(f"QuerySet indices must be integers or slices, not {key}")
+        if key < 0:
+            raise ValueError("Negative indexing is not supported.")
+
+        cloned_qs = self._clone()
+        cloned_qs._set_limits(key, key + 1)
+        cloned_qs._select()
+        if not cloned_qs._result_cache:
+            raise IndexError("QuerySet index out of range")
+        return cloned_qs._result_cache[0]
+
     def __repr__(self):
         if not self._executed:
             return "<QuerySet [not executed]>"
@@ -51,49 +167,307 @@ class QuerySet:
         qs = self.__class__(self.model_class, self.session)
         qs.query = self.query
         qs.lookup_filters = self.lookup_filters.copy()
+        qs.ordering = self.ordering.copy()
+        qs._reversed = self._reversed
+        qs._fields = self._fields
+        qs._values_mode = self._values_mode
+        qs._select_related = self._select_related
+        qs._prefetch_related = self._prefetch_related
+        qs._annotations = self._annotations.copy()
+        qs._distinct = self._distinct
+        qs._database = self._database
+        qs._low_mark = self._low_mark
+        qs._high_mark = self._high_mark
         return qs
 
-    def compile_conditions(self):
-        if self.lookup_filters:
-            conditions = []
-            for lookup in self.lookup_filters:
-                column = getattr(self.model_class, lookup.field_name)
-                lookup_name = lookup.lookup
-                if lookup_name == "eq":
-                    filter_expr = column == lookup.value
-                elif lookup_name == "gt":
-                    filter_expr = column > lookup.value
-                elif lookup_name == "gte":
-                    filter_expr = column >= lookup.value
-                elif lookup_name == "lt":
-                    filter_expr = column < lookup.value
-                elif lookup_name == "lte":
-                    filter_expr = column <= lookup.value
-                elif lookup_name == "in":
-                    filter_expr = column.in_(lookup.value)
-                elif lookup_name == "isnull":
-                    filter_expr = column.is_(None)
-                elif lookup_name == "between":
-                    filter_expr = column.between(*lookup.value)
-                else:
-                    filter_expr = getattr(column, lookup_name)(lookup.value)
-                if lookup.exclude:
-                    filter_expr = ~filter_expr
-                conditions.append(filter_expr)
+    def _set_limits(self, low: int, high: Optional[int]) -> None:
+        if high is not None:
+            high = self._low_mark + high
+            if self._high_mark is not None:
+                high = min(self._high_mark, high)
+            self._high_mark = max(high, self._low_mark)
 
-            return conditions
+        low = self._low_mark + low
+        if self._high_mark is not None:
+            low = min(self._high_mark, low)
+        self._low_mark = low
 
-    def _mount_filters(self):
-        conditions = self.compile_conditions()
-        self.query = self.query.where(*conditions)
+    @property
+    def is_sliced(self) -> bool:
+        return bool(self._low_mark) or self._high_mark is not None
+
+    def _assert_not_sliced(self, operation: str) -> None:
+        if self.is_sliced:
+            raise ValueError(f"Cannot {operation} a query once a slice has been taken.")
+
+    def compile_conditions(self, bind_params: bool = False):
+        conditions = []
+        for index, lookup in enumerate(self.lookup_filters):
+            if lookup.field_name in self._annotations:
+                continue
+            column = getattr(self.model_class, lookup.field_name)
+            conditions.append(self._compile_lookup(index, lookup, column, bind_params))
+
+        return conditions
+
+    def compile_having(self, bind_params: bool = False):
+        """
+        Conditions on annotations, which filter the groups rather than the rows.
+        """
+        conditions = []
+        for index, lookup in enumerate(self.lookup_filters):
+            if lookup.field_name not in self._annotations:
+                continue
+            column = self._annotation_expression(lookup.field_name)
+            conditions.append(self._compile_lookup(index, lookup, column, bind_params))
+
+        return conditions
+
+    def _compile_lookup(
+        self, index: int, lookup: LookupFilter, column, bind_params: bool = False
+    ):
+        lookup_name = lookup.lookup
+        value = lookup.value
+        if bind_params and self._is_bound(lookup):
+            value = self._bind_param(index, lookup)
+
+        if lookup_name == "eq":
+            filter_expr = column == value
+        elif lookup_name == "gt":
+            filter_expr = column > value
+        elif lookup_name == "gte":
+            filter_expr = column >= value
+        elif lookup_name == "lt":
+            filter_expr = column < value
+        elif lookup_name == "lte":
+            filter_expr = column <= value
+        elif lookup_name == "in":
+            filter_expr = column.in_(value)
+        elif lookup_name == "isnull":
+            filter_expr = column.is_(None)
+        elif lookup_name == "between":
+            filter_expr = column.between(*value)
+        else:
+            filter_expr = getattr(column, lookup_name)(value)
+        if lookup.exclude:
+            filter_expr = ~filter_expr
+        return filter_expr
+
+    def compile_ordering(self):
+        clauses = []
+        for field in self.ordering:
+            descending = field.startswith("-") != self._reversed
+            name = field.lstrip("-")
+            if name in self._annotations:
+                # Annotations are ordered by their label in the select
+                clauses.append(desc(name) if descending else asc(name))
+                continue
+
+            column = getattr(self.model_class, name)
+            clauses.append(column.desc() if descending else column.asc())
+
+        return clauses
+
+    def _annotation_expression(self, name: str):
+        aggregate = self._annotations[name]
+        return aggregate.resolve(self._aggregate_column(aggregate))
+
+    def _aggregate_column(self, aggregate: Aggregate, source=None):
+        if aggregate.field == "*":
+            return None
+        if source is not None:
+            return source.c[aggregate.field]
+        return getattr(self.model_class, aggregate.field)
+
+    def _is_bound(self, lookup: LookupFilter) -> bool:
+        return lookup.value is not None and lookup.lookup != "isnull"
+
+    def _bind_param(self, index: int, lookup: LookupFilter):
+        name = f"{lookup.field_name}_{index}"
+        if lookup.lookup == "between":
+            return bindparam(f"{name}_start"), bindparam(f"{name}_end")
+        return bindparam(name, expanding=lookup.lookup == "in")
+
+    def _bind_values(self) -> dict:
+        params = {}
+        for index, lookup in enumerate(self.lookup_filters):
+            if not self._is_bound(lookup):
+                continue
+
+            name = f"{lookup.field_name}_{index}"
+            if lookup.lookup == "between":
+                params[f"{name}_start"], params[f"{name}_end"] = lookup.value
+            elif lookup.lookup == "in":
+                params[name] = list(lookup.value)
+            else:
+                params[name] = lookup.value
+
+        if self._low_mark:
+            params["_offset"] = self._low_mark
+        if self._high_mark is not None:
+            params["_limit"] = self._high_mark - self._low_mark
+
+        return params
+
+    def _shape(self) -> tuple:
+        filters = tuple(
+            (lookup.field_name, lookup.lookup, lookup.exclude, self._is_bound(lookup))
+            for lookup in self.lookup_filters
+        )
+        limits = (bool(self._low_mark), self._high_mark is not None)
+        ordering = (tuple(self.ordering), self._reversed)
+        related = (self._select_related, self._prefetch_related)
+        annotations = tuple(
+            (name, aggregate.key()) for name, aggregate in self._annotations.items()
+        )
+        return (
+            self.model_class,
+            self._fields,
+            filters,
+            ordering,
+            limits,
+            related,
+            annotations,
+            self._distinct,
+        )
+
+    def _filters_relationships(self) -> bool:
+        mapper = inspect(self.model_class, raiseerr=False)
+        if mapper is None:
+            return False
+        return any(
+            lookup.field_name in mapper.relationships for lookup in self.lookup_filters
+        )
+
+    def _cached_query(self, kind: Union[str, tuple], build) -> Tuple[Any, dict]:
+        # Related objects are compared through their keys, which SQLAlchemy renders
+        # into the statement rather than into our bound parameters
+        if not QUERY_CACHE.enabled or self._filters_relationships():
+            return build(False), {}
+
+        key = (kind, *self._shape())
+        query = QUERY_CACHE.get(key)
+        if query is None:
+            query = build(True)
+            QUERY_CACHE.set(key, query)
+
+        return query, self._bind_values()
+
+    def _build_query(self, bind_params: bool = False):
+        query = self.query.where(*self.compile_conditions(bind_params))
+        if self._annotations:
+            query = query.group_by(
+                *[getattr(self.model_class, field) for field in self._fields]
+            )
+            query = query.having(*self.compile_having(bind_params))
+        if self._distinct:
+            query = query.distinct()
+        query = query.order_by(*self.compile_ordering())
+        if self._values_mode is None and self._has_related:
+            query = query.options(*self._loader_options())
+        return self._apply_limits(query, bind_params)
+
+    @property
+    def _has_related(self) -> bool:
+        return bool(self._select_related or self._prefetch_related)
+
+    def _loader_options(self) -> list:
+        options = [self._loader_path(joinedload, path) for path in self._select_related]
+        options += [
+            self._loader_path(selectinload, path) for path in self._prefetch_related
+        ]
+        return options
+
+    def _loader_path(self, loader, path: str):
+        model, option = self.model_class, None
+        for name in path.split("__"):
+            attribute = getattr(model, name)
+            if option is None:
+                option = loader(attribute)
+            else:
+                option = getattr(option, loader.__name__)(attribute)
+            model = attribute.property.mapper.class_
+
+        return option
+
+    def _apply_limits(self, query, bind_params: bool = False):
+        if self._low_mark:
+            offset = self._low_mark
+            if bind_params:
+                offset = bindparam("_offset", type_=Integer)
+            query = query.offset(offset)
+
+        if self._high_mark is not None:
+            limit = self._high_mark - self._low_mark
+            if bind_params:
+                limit = bindparam("_limit", type_=Integer)
+            query = query.limit(limit)
+
+        return query
+
+    def _rows(self, result):
+        if self._select_related and self._values_mode is None:
+            # Joined eager loads of collections repeat the parent row per child
+            result = result.unique()
+        if self._values_mode in (None, "flat"):
+            return result.scalars()
+        return result
+
+    def _convert_rows(self, rows: list) -> list:
+        if self._values_mode == "dict":
+            names = (*self._fields, *self._annotations)
+            return [dict(zip(names, row)) for row in rows]
+        if self._values_mode == "tuple":
+            return [tuple(row) for row in rows]
+        return rows
 
     def _select(self):
-        self._mount_filters()
+        query, params = self._cached_query("select", self._build_query)
+        with self._scope("select") as scope:
+            self._set_result(self.session.execute(query, params))
+            scope.rows = len(self._result_cache)
 
-        self._result_cache = self.session.execute(self.query).scalars().all()
+    def _set_result(self, result) -> None:
+        self._result_cache = self._convert_rows(self._rows(result).all())
         self._executed = True
 
+    def _ordered(self) -> QuerySet[T]:
+        if self.ordering:
+            return self
+        cloned_qs = self._clone()
+        if self._annotations:
+            # Grouped rows can only be ordered by what they are grouped on
+            cloned_qs.ordering = list(self._fields)
+        else:
+            # uuid7 primary keys are time-ordered, so they make a stable default
+            cloned_qs.ordering = ["id"]
+        return cloned_qs
+
+    def _fetch_first(self) -> Union[T, None]:
+        if self._is_empty_slice:
+            return None
+        with self._scope("first") as scope:
+            row = self._first_row(self.session.execute(*self._first_query()))
+            scope.rows = int(row is not None)
+        return row
+
+    @property
+    def _is_empty_slice(self) -> bool:
+        return self._high_mark is not None and self._high_mark == self._low_mark
+
+    def _first_query(self) -> Tuple[Any, dict]:
+        query, params = self._cached_query(
+            "first", lambda bind_params: self._build_query(bind_params).limit(1)
+        )
+        params.pop("_limit", None)
+        return query, params
+
+    def _first_row(self, result) -> Union[T, None]:
+        rows = self._convert_rows(self._rows(result).all())
+        return rows[0] if rows else None
+
     def _apply_filter(self, exclude=False, **kwargs) -> QuerySet[T]:
+        self._assert_not_sliced("filter")
         cloned_qs = self._clone()
 
         lookups = [
@@ -130,20 +504,275 @@ class QuerySet:
     def all(self) -> QuerySet[T]:
         return self._clone()
 
+    def iterator(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE, expunge: bool = False
+    ) -> Iterator[T]:
+        """
+        Stream rows through a server-side cursor, `chunk_size` rows at a time,
+        without filling the result cache. With `expunge`, each chunk is removed
+        from the session once consumed so the identity map stays bounded.
+        """
+        query, params = self._cached_query("select", self._build_query)
+        # Only around the execution: a scope must not stay open across yields
+        with self._scope("iterator"):
+            result = self.session.execute(
+                query, params, execution_options={"yield_per": chunk_size}
+            )
+        try:
+            for chunk in self._rows(result).partitions():
+                yield from self._convert_rows(chunk)
+                if expunge and self._values_mode is None:
+                    for obj in chunk:
+                        self.session.expunge(obj)
+        finally:
+            result.close()
+
+    def parallel_map(
+        self,
+        func: Callable[[T], Any],
+        workers: Optional[int] = None,
+        chunk_by: str = "id",
+        chunks: Optional[int] = None,
+        reduce: Optional[Callable[[Any, Any], Any]] = None,
+        **kwargs,
+    ) -> Any:
+        """
+        Split the rows into disjoint `chunk_by` ranges and map `func` over each
+        range in a pool of `workers` processes (one per CPU by default), each with
+        its own connections. Results stream back as ranges finish, in no
+        particular order; with `reduce`, they are folded into a single value
+        (`initial=` as in `functools.reduce`). Errors in `func` are raised here.
+
+        `func` and `reduce` must be picklable, e.g. module-level functions.
+        """
+        from hojo.orm.parallel import parallel_map
+
+        return parallel_map(self, func, workers, chunk_by, chunks, reduce, **kwargs)
+
     def first(self) -> Union[T, None]:
-        if not self._executed:
-            self._select()
-        return self._result_cache[0] if self._result_cache else None
+        if self._executed:
+            return self._result_cache[0] if self._result_cache else None
+        return self._ordered()._fetch_first()
 
     def last(self) -> Union[T, None]:
-        if not self._executed:
+        if self.is_sliced and not self._executed:
             self._select()
-        return self._result_cache[-1] if self._result_cache else None
+        if self._executed:
+            return self._result_cache[-1] if self._result_cache else None
+        return self._ordered().reverse()._fetch_first()
+
+    def count(self) -> int:
+        if self._executed:
+            return len(self._result_cache)
+
+        query, params = self._cached_query("count", self._build_count_query)
+        with self._scope("count"):
+            return self.session.execute(query, params).scalar()
+
+    def _build_count_query(self, bind_params: bool = False):
+        if self.is_sliced or self._annotations or self._distinct:
+            subquery = self._build_query(bind_params).subquery()
+            return select(func.count()).select_from(subquery)
+
+        count_query = select(func.count()).select_from(self.model_class)
+        return count_query.where(*self.compile_conditions(bind_params))
+
+    def exists(self) -> bool:
+        if self._executed:
+            return bool(self._result_cache)
+
+        query, params = self._cached_query("exists", self._build_exists_query)
+        with self._scope("exists"):
+            return bool(self.session.execute(query, params).scalar())
+
+    def _build_exists_query(self, bind_params: bool = False):
+        if self._annotations:
+            return select(self._build_query(bind_params).exists())
+
+        query = self.query.where(*self.compile_conditions(bind_params))
+        return select(self._apply_limits(query, bind_params).exists())
+
+    def aggregate(self, *args: Aggregate, **kwargs: Aggregate) -> dict:
+        """
+        Compute aggregates over the filtered rows in a single query:
+
+            Order.objects.filter(paid=True).aggregate(total=Sum("amount"))
+            # {"total": Decimal("1250.00")}
+
+        Positional aggregates are named after their field, e.g. "amount__sum".
+        """
+        query, params = self._cached_query(
+            ("aggregate", *self._aggregate_shape(args, kwargs)),
+            lambda bind_params: self._build_aggregate_query(args, kwargs, bind_params),
+        )
+        with self._scope("aggregate"):
+            return dict(self.session.execute(query, params).one()._mapping)
+
+    def _aggregates(self, args: tuple, kwargs: dict) -> Dict[str, Aggregate]:
+        aggregates = {aggregate.default_alias: aggregate for aggregate in args}
+        aggregates.update(kwargs)
+        if not aggregates:
+            raise ValueError("aggregate() requires at least one aggregate.")
+        for name, aggregate in aggregates.items():
+            if not isinstance(aggregate, Aggregate):
+                raise ValueError(f"'{name}' is not an aggregate expression.")
+        return aggregates
+
+    def _aggregate_shape(self, args: tuple, kwargs: dict) -> tuple:
+        aggregates = self._aggregates(args, kwargs)
+        return tuple((name, aggregate.key()) for name, aggregate in aggregates.items())
+
+    def _build_aggregate_query(
+        self, args: tuple, kwargs: dict, bind_params: bool = False
+    ):
+        aggregates = self._aggregates(args, kwargs)
+        if self.is_sliced or self._annotations or self._distinct:
+            source = self._build_query(bind_params).subquery()
+            return select(
+                *[
+                    aggregate.resolve(self._aggregate_column(aggregate, source)).label(
+                        name
+                    )
+                    for name, aggregate in aggregates.items()
+                ]
+            ).select_from(source)
+
+        return (
+            select(
+                *[
+                    aggregate.resolve(self._aggregate_column(aggregate)).label(name)
+                    for name, aggregate in aggregates.items()
+                ]
+            )
+            .select_from(self.model_class)
+            .where(*self.compile_conditions(bind_params))
+        )
+
+    def annotate(self, **annotations: Aggregate) -> QuerySet[Any]:
+        """
+        Add aggregates computed per group of the `values`/`values_list` fields, which
+        become the query's GROUP BY:
+
+            Order.objects.values("status").annotate(total=Sum("amount"))
+            # [{"status": "paid", "total": ...}, {"status": "open", "total": ...}]
+
+        Annotations can be filtered (as HAVING) and ordered on like fields.
+        """
+        if self._values_mode not in ("dict", "tuple"):
+            raise ValueError(
+                "annotate() must follow values() or values_list() without `flat`."
+            )
+        for name, aggregate in annotations.items():
+            if not isinstance(aggregate, Aggregate):
+                raise ValueError(f"'{name}' is not an aggregate expression.")
+            if name in self._fields or hasattr(self.model_class, name):
+                raise ValueError(f"The annotation '{name}' conflicts with a field.")
+
+        cloned_qs = self._clone()
+        cloned_qs._annotations.update(annotations)
+        cloned_qs.query = cloned_qs._values_query()
+        return cloned_qs
+
+    def distinct(self) -> QuerySet[T]:
+        cloned_qs = self._clone()
+        cloned_qs._distinct = True
+        return cloned_qs
 
     def order_by(self, *fields: str) -> QuerySet[T]:
+        self._assert_not_sliced("reorder")
         cloned_qs = self._clone()
-        for field in fields:
-            cloned_qs.query = cloned_qs.query.order_by(getattr(self.model_class, field))
+        cloned_qs.ordering.extend(fields)
+        return cloned_qs
+
+    def paginate_by_key(
+        self, order_field: str = "id", after: Any = None, page_size: int = 50
+    ) -> QuerySet[T]:
+        """
+        Keyset (seek) pagination: the `page_size` rows that come strictly after
+        `after` when ordered by `order_field` ("-field" pages in descending order).
+        Unlike OFFSET, the cost of a page does not grow with its depth. The field
+        should be unique and indexed, e.g. the time-ordered `id`; pass the key of
+        the last row of a page as `after` to get the next one.
+        """
+        field_name = order_field.lstrip("-")
+        lookup = "lt" if order_field.startswith("-") else "gt"
+
+        queryset = self
+        if after is not None:
+            queryset = self.filter(**{f"{field_name}__{lookup}": after})
+
+        cloned_qs = queryset._clone()
+        cloned_qs.ordering = [order_field]
+        cloned_qs._reversed = False
+        return cloned_qs[:page_size]
+
+    def values(self, *fields: str) -> QuerySet[dict]:
+        """
+        Select only `fields` (every column by default) and return rows as plain
+        dicts, without building model instances.
+        """
+        return self._values(fields, "dict")
+
+    def values_list(self, *fields: str, flat: bool = False) -> QuerySet[Any]:
+        """
+        Like `values`, but rows are tuples. With `flat=True` and a single field,
+        rows are the bare column values.
+        """
+        if flat and len(fields) != 1:
+            raise ValueError("`flat` is only valid when values_list has one field.")
+
+        return self._values(fields, "flat" if flat else "tuple")
+
+    def _values(self, fields: Tuple[str, ...], mode: str) -> QuerySet[Any]:
+        if self._annotations:
+            raise ValueError("values() cannot follow annotate().")
+
+        cloned_qs = self._clone()
+        cloned_qs._fields = tuple(fields) or tuple(self._column_names())
+        cloned_qs._values_mode = mode
+        cloned_qs.query = cloned_qs._values_query()
+        return cloned_qs
+
+    def _values_query(self):
+        return select(
+            *[getattr(self.model_class, field) for field in self._fields],
+            *[
+                self._annotation_expression(name).label(name)
+                for name in self._annotations
+            ],
+        )
+
+    def using(self, database: str) -> QuerySet[T]:
+        """
+        Run this queryset's statements on the named database from
+        `Hojo.config(databases=...)`, bypassing the router.
+        """
+        cloned_qs = self._clone()
+        cloned_qs._database = database
+        return cloned_qs
+
+    def select_related(self, *fields: str) -> QuerySet[T]:
+        """
+        Load the given relationships in the same query with a JOIN. Nested
+        relationships are spelled `"author__publisher"`.
+        """
+        cloned_qs = self._clone()
+        cloned_qs._select_related += fields
+        return cloned_qs
+
+    def prefetch_related(self, *fields: str) -> QuerySet[T]:
+        """
+        Load the given relationships with one extra `SELECT ... WHERE IN` per
+        relationship, batched over every row of the result.
+        """
+        cloned_qs = self._clone()
+        cloned_qs._prefetch_related += fields
+        return cloned_qs
+
+    def reverse(self) -> QuerySet[T]:
+        self._assert_not_sliced("reverse")
+        cloned_qs = self._clone()
+        cloned_qs._reversed = not self._reversed
         return cloned_qs
 
     def filter(self, **kwargs) -> QuerySet[T]:
@@ -153,29 +782,682 @@ class QuerySet:
         return self._apply_filter(exclude=True, **kwargs)
 
     def create(self, **kwargs) -> T:
-        obj = self.model_class.load(kwargs)
+        obj = self._build(kwargs)
         self.session.add(obj)
-        self.session.commit()
+        with self._scope("create"):
+            self._commit()
+        self._invalidate_cache(obj)
         return obj
 
     def delete(self, **kwargs) -> None:
-        conditions = self.compile_conditions()
-        delete_query = delete(self.model_class).where(*conditions)
-
-        self.session.execute(delete_query)
-        self.session.commit()
+        with self._scope("delete"):
+            self.session.execute(self._build_delete_query())
+            self._commit()
+        self._invalidate_cache()
 
     def update(self, **kwargs) -> None:
+        with self._scope("update"):
+            self.session.execute(self._build_update_query(**kwargs))
+            self._commit()
+        self._invalidate_cache()
+
+    def _build_delete_query(self):
+        self._assert_not_sliced("delete")
         conditions = self.compile_conditions()
-        update_query = update(self.model_class).where(*conditions).values(**kwargs)
+        return delete(self.model_class).where(*conditions)
+
+    def _build_update_query(self, **kwargs):
+        self._assert_not_sliced("update")
+        conditions = self.compile_conditions()
+        return update(self.model_class).where(*conditions).values(**kwargs)
+
+    def bulk_create(
+        self,
+        objs: Iterable[Any],
+        batch_size: Optional[int] = None,
+        on_conflict: Optional[str] = None,
+        conflict_fields: Optional[List[str]] = None,
+    ) -> List[T]:
+        """
+        Insert `objs` (model instances, dicts or schemas) in batches, emitting one
+        multi-row INSERT and a single commit per batch. Rows are read back with
+        RETURNING when the dialect supports it.
+
+        With `on_conflict="ignore"` rows that violate a unique constraint are
+        skipped; with `on_conflict="update"` they overwrite the existing row matched
+        on `conflict_fields` (by default the model's unique field). Both use
+        INSERT ... ON CONFLICT, and only the inserted or updated rows are returned,
+        which needs RETURNING: on other dialects they raise `ValueError`.
+        """
+        returning = self._supports_returning()
+        batches = self._insert_batches(
+            objs, batch_size, returning, on_conflict, conflict_fields
+        )
+
+        created: List[T] = []
+        for insert_query, rows, instances in batches:
+            with self._scope("bulk_create"):
+                if returning:
+                    created.extend(self.session.scalars(insert_query, rows).all())
+                else:
+                    self.session.execute(insert_query, rows)
+                    created.extend(instances)
+
+                self._commit()
+
+        if on_conflict == "update":
+            self._invalidate_cache()
+        return created
+
+    def get_or_create(
+        self, defaults: Optional[dict] = None, **kwargs
+    ) -> Tuple[T, bool]:
+        """
+        Return `(obj, created)`. When `kwargs` are exactly a unique field (or `id`),
+        with everything else in `defaults`, this is a single INSERT ... ON CONFLICT
+        DO NOTHING, and the existing row is only read when the insert was skipped.
+        Otherwise it falls back to a lookup on all of `kwargs` followed by an insert.
+        """
+        conflict_fields = self._lookup_conflict_fields(kwargs)
+        if conflict_fields is None:
+            obj = self.filter(**kwargs).first()
+            if obj is not None:
+                return obj, False
+            return self.create(**{**kwargs, **(defaults or {})}), True
+
+        insert_query, row = self._get_or_create_query(conflict_fields, defaults, kwargs)
+        with self._scope("get_or_create"):
+            obj = self.session.scalars(insert_query, [row]).first()
+            self._commit()
+
+        if obj is not None:
+            self._invalidate_cache(obj)
+            return obj, True
+
+        return self._conflicting(conflict_fields, kwargs).first(), False
+
+    def update_or_create(
+        self, defaults: Optional[dict] = None, **kwargs
+    ) -> Tuple[T, bool]:
+        """
+        Return `(obj, created)` after inserting `kwargs` + `defaults`, or writing
+        `defaults` to the row matching `kwargs`, in a single INSERT ... ON CONFLICT DO
+        UPDATE. `kwargs` must be exactly a unique field or `id`; other fields go in
+        `defaults`.
+        """
+        conflict_fields = self._lookup_conflict_fields(kwargs)
+        if conflict_fields is None:
+            raise ValueError(
+                "`update_or_create` lookup fields must be exactly a unique field; "
+                "pass the other fields in `defaults`."
+            )
+
+        insert_query, row = self._update_or_create_query(
+            conflict_fields, defaults, kwargs
+        )
+        with self._scope("update_or_create"):
+            obj = self.session.scalars(insert_query, [row]).one()
+            self._commit()
+
+        self._invalidate_cache()
+        # On conflict the existing row, and its id, is returned instead of ours
+        return obj, obj.id == row["id"]
+
+    def bulk_update(
+        self,
+        objs: Iterable[Any],
+        fields: Optional[List[str]] = None,
+        batch_size: Optional[int] = None,
+    ) -> int:
+        """
+        Update `objs` by primary key with an executemany UPDATE per batch. Only
+        `fields` are written when given, otherwise every column is.
+        """
+        updated = 0
+        for update_query, rows in self._update_batches(objs, fields, batch_size):
+            with self._scope("bulk_update"):
+                self.session.execute(update_query, rows)
+                self._commit()
+            updated += len(rows)
+
+        self._invalidate_cache()
+        return updated
+
+    def _insert_batches(
+        self,
+        objs: Iterable[Any],
+        batch_size: Optional[int],
+        returning: bool,
+        on_conflict: Optional[str] = None,
+        conflict_fields: Optional[List[str]] = None,
+    ):
+        columns = self._column_names()
+        if on_conflict is None:
+            insert_query = insert(self.model_class)
+            if returning:
+                insert_query = insert_query.returning(
+                    self.model_class, sort_by_parameter_order=True
+                )
+        else:
+            # Without RETURNING there is no telling which rows were skipped
+            if not returning:
+                raise ValueError(
+                    "bulk_create(on_conflict=...) needs a dialect that supports "
+                    "INSERT ... RETURNING."
+                )
+            insert_query = self._upsert_query(on_conflict, conflict_fields)
+            # Skipped rows return nothing, so results can't be matched to parameters
+            insert_query = insert_query.returning(self.model_class)
+
+        for batch in _chunked(objs, self._batch_size(batch_size)):
+            instances = [self._as_instance(obj) for obj in batch]
+            rows = [self._as_row(obj, columns) for obj in instances]
+            yield insert_query, rows, instances
+
+    def _update_batches(
+        self,
+        objs: Iterable[Any],
+        fields: Optional[List[str]],
+        batch_size: Optional[int],
+    ):
+        columns = self._column_names()
+        if fields:
+            columns = ["id"] + [name for name in fields if name != "id"]
+
+        for batch in _chunked(objs, self._batch_size(batch_size)):
+            rows = [self._as_row(obj, columns) for obj in batch]
+            if any(row.get("id") is None for row in rows):
+                raise ValueError("`bulk_update` requires an `id` for every object.")
+
+            yield update(self.model_class), rows
+
+    def _upsert_query(
+        self,
+        on_conflict: str,
+        conflict_fields: Optional[List[str]] = None,
+        update_fields: Optional[List[str]] = None,
+    ):
+        if on_conflict not in ON_CONFLICT_ACTIONS:
+            raise ValueError(
+                f"Invalid `on_conflict`: {on_conflict}, "
+                f"expected one of: {', '.join(ON_CONFLICT_ACTIONS)}"
+            )
+
+        dialect = self.session.get_bind().dialect.name
+        if dialect not in UPSERT_INSERTS:
+            raise ValueError(f"`on_conflict` is not supported on {dialect}.")
+
+        insert_query = UPSERT_INSERTS[dialect](self.model_class)
+        if on_conflict == "ignore":
+            return insert_query.on_conflict_do_nothing(index_elements=conflict_fields)
+
+        conflict_fields = conflict_fields or self._default_conflict_fields()
+        if update_fields is None:
+            skipped = {"id", "created_at", *conflict_fields}
+            update_fields = [
+                name for name in self._column_names() if name not in skipped
+            ]
+
+        upsert = insert_query.on_conflict_do_update(
+            index_elements=conflict_fields,
+            set_={name: insert_query.excluded[name] for name in update_fields},
+        )
+        # Objects already in the session are refreshed with the updated values
+        return upsert.execution_options(populate_existing=True)
+
+    def _get_or_create_query(
+        self, conflict_fields: List[str], defaults: Optional[dict], kwargs: dict
+    ) -> Tuple[Any, dict]:
+        obj = self._build(self._with_foreign_keys({**kwargs, **(defaults or {})}))
+        row = self._as_row(obj, self._column_names())
+        insert_query = self._upsert_query("ignore", conflict_fields)
+        return insert_query.returning(self.model_class), row
+
+    def _update_or_create_query(
+        self, conflict_fields: List[str], defaults: Optional[dict], kwargs: dict
+    ) -> Tuple[Any, dict]:
+        defaults = self._with_foreign_keys(defaults or {})
+        obj = self._build({**kwargs, **defaults})
+        row = self._as_row(obj, self._column_names())
+        update_fields = [*defaults, "updated_at"]
+        insert_query = self._upsert_query("update", conflict_fields, update_fields)
+        return insert_query.returning(self.model_class), row
+
+    def _with_foreign_keys(self, data: dict) -> dict:
+        """
+        `data` with related objects replaced by their foreign keys, which is all an
+        upsert row needs; the related objects' collections are left alone.
+        """
+        foreign_keys = dict(_foreign_keys(inspect(self.model_class)))
+        resolved = {}
+        for name, value in data.items():
+            if name not in foreign_keys:
+                resolved[name] = value
+                continue
+            for column, related_column in foreign_keys[name]:
+                resolved[column] = getattr(value, related_column, None)
+        return resolved
+
+    def _conflicting(self, conflict_fields: List[str], kwargs: dict) -> QuerySet[T]:
+        return self.filter(**{name: kwargs[name] for name in conflict_fields})
+
+    def _unique_keys(self) -> List[Tuple[str, ...]]:
+        """
+        Column sets of the model's unique constraints (from `field(unique=...)`),
+        followed by the primary key.
+        """
+        table = inspect(self.model_class).local_table
+        keys = [
+            tuple(column.key for column in constraint.columns)
+            for constraint in table.constraints
+            if isinstance(constraint, UniqueConstraint)
+        ]
+        keys.sort(key=len)
+        keys.append(tuple(column.key for column in table.primary_key.columns))
+        return keys
+
+    def _lookup_conflict_fields(self, kwargs: dict) -> Optional[List[str]]:
+        # ON CONFLICT only matches on the key, so any other lookup field would be
+        # ignored when the row already exists
+        if self.lookup_filters:
+            return None
+
+        for key in self._unique_keys():
+            if set(key) == set(kwargs):
+                return list(key)
+        return None
+
+    def _default_conflict_fields(self) -> List[str]:
+        unique_keys = self._unique_keys()[:-1]
+        if len(unique_keys) != 1:
+            raise ValueError(
+                "`conflict_fields` is required unless the model has exactly one "
+                "unique constraint."
+            )
+        return list(unique_keys[0])
+
+    def _scope(self, operation: str) -> QueryScope:
+        return QueryScope(self.model_class, operation, self._database)
+
+    def _commit(self) -> None:
+        if should_commit(self.session):
+            self.session.commit()
+        else:
+            self.session.flush()
+
+    def _column_names(self) -> List[str]:
+        return [column.key for column in inspect(self.model_class).column_attrs]
+
+    def _supports_returning(self) -> bool:
+        dialect = self.session.get_bind().dialect
+        return bool(dialect.insert_executemany_returning_sort_by_parameter_order)
+
+    def _batch_size(self, batch_size: Optional[int]) -> int:
+        return batch_size or Config.get("bulk_batch_size") or DEFAULT_BATCH_SIZE
+
+    def _build(self, data: dict) -> T:
+        """
+        `load(data)`, also accepting related objects for relationship fields and
+        values for foreign keys (`<field>_id`). These are set through the mapper:
+        cattrs can't structure ORM instances and `load` drops non-attrs keys.
+        """
+        mapper = inspect(self.model_class, raiseerr=False)
+        if mapper is None:
+            return self.model_class.load(data)
+
+        attributes = fields_dict(self.model_class)
+        mapped = {
+            name: data[name]
+            for name in data
+            if name in mapper.relationships
+            or (name in mapper.column_attrs and name not in attributes)
+        }
+        obj = self.model_class.load(
+            {name: value for name, value in data.items() if name not in mapped}
+        )
+        for name, value in mapped.items():
+            setattr(obj, name, value)
+
+        for relationship, pairs in _foreign_keys(mapper):
+            if relationship not in data and any(key in mapped for key, _ in pairs):
+                # The None `load` gave the relationship would null the given key at
+                # flush; without it the relationship loads from the key instead
+                delattr(obj, relationship)
+        return obj
+
+    def _as_instance(self, obj: Any) -> T:
+        if isinstance(obj, self.model_class):
+            return obj
+        return self._build(obj)
+
+    def _as_row(self, obj: Any, columns: List[str]) -> dict:
+        if isinstance(obj, dict):
+            return {key: obj[key] for key in columns if key in obj}
+
+        row = {key: getattr(obj, key) for key in columns if hasattr(obj, key)}
+        mapper = inspect(type(obj), raiseerr=False)
+        if mapper is None:
+            return row
+
+        # Foreign keys are only copied from related objects at flush, which the bulk
+        # statements skip
+        for relationship, pairs in _foreign_keys(mapper):
+            related = obj.__dict__.get(relationship)
+            if related is None:
+                continue
+            for column, related_column in pairs:
+                if column in row:
+                    row[column] = getattr(related, related_column)
+        return row
+
+    @property
+    def _model_cache(self) -> Optional[ModelCache]:
+        cache = getattr(self.model_class, "_model_cache", None)
+        return cache if cache is not None and cache.enabled else None
+
+    def _get_key(self, kwargs: dict) -> Optional[Tuple[str, Any]]:
+        """
+        `(field, value)` when `get(**kwargs)` looks up a single `id` or cached unique
+        field on an unfiltered queryset, which is what the fast paths can serve.
+        """
+        if len(kwargs) != 1 or self.lookup_filters or self.is_sliced:
+            return None
+        if self._fields is not None or self._has_related:
+            return None
 
-        self.session.execute(update_query)
-        self.session.commit()
+        ((name, value),) = kwargs.items()
+        cache = self._model_cache
+        keys = cache.keys if cache is not None else ("id",)
+        return (name, value) if name in keys else None
+
+    def _cache_get(self, key: Optional[Tuple[str, Any]]) -> Union[T, None]:
+        cache = self._model_cache
+        if key is None or cache is None:
+            return None
+        return cache.get(key)
+
+    def _cache_set(self, key: Optional[Tuple[str, Any]], obj: Union[T, None]) -> None:
+        cache = self._model_cache
+        if key is None or cache is None or obj is None:
+            return
+        # Other sessions must not see rows that may still be rolled back
+        if reads_uncommitted(self.session):
+            return
+
+        snapshot = self._detached_copy(obj)
+        for cache_key in cache.cache_keys(obj):
+            cache.set(cache_key, snapshot)
+
+    def _detached_copy(self, obj: T) -> T:
+        """
+        A copy of `obj`'s column values that belongs to no session. The cache holds
+        these, and each hit is merged into the caller's session, since the loaded
+        instance stays bound to the session (and thread) that loaded it.
+        """
+        mapper = inspect(self.model_class)
+        snapshot = mapper.class_manager.new_instance()
+        for attr in mapper.column_attrs:
+            set_committed_value(snapshot, attr.key, getattr(obj, attr.key))
+        make_transient_to_detached(snapshot)
+        return snapshot
+
+    def _invalidate_cache(self, obj: Any = None) -> None:
+        cache = self._model_cache
+        if cache is None:
+            return
+
+        if obj is None:
+            cache.invalidate()
+        else:
+            cache.discard(cache.cache_keys(obj))
 
     def get(self, **kwargs) -> T:
+        key = self._get_key(kwargs)
+        if (cached := self._cache_get(key)) is not None:
+            return self.session.merge(cached, load=False)
+
+        if key is not None and key[0] == "id":
+            # Served from the session's identity map when the object is already loaded
+            with self._scope("get"):
+                obj = self.session.get(self.model_class, key[1])
+        else:
+            try:
+                obj = self.filter(**kwargs).first()
+            except NoResultFound:
+                raise ValueError("No results found.")
+            except MultipleResultsFound:
+                raise ValueError("Multiple results returned for `get`.")
+
+        self._cache_set(key, obj)
+        return obj
+
+
+class AsyncQuerySet(QuerySet):
+    """
+    Awaitable counterpart of `QuerySet`, bound to an `AsyncSession`. Queries are
+    built exactly as with `QuerySet` (filter, exclude, order_by, slicing, values);
+    every method that reaches the database is a coroutine, and rows can be
+    streamed with `async for`.
+    """
+
+    def __iter__(self):
+        raise TypeError("Use `async for` or `await queryset.all()` on AsyncQuerySet.")
+
+    def __len__(self):
+        raise TypeError("Use `await queryset.count()` on AsyncQuerySet.")
+
+    def __bool__(self):
+        raise TypeError("Use `await queryset.exists()` on AsyncQuerySet.")
+
+    def __getitem__(self, key: Union[int, slice]):
+        if isinstance(key, int) and not self._executed:
+            raise TypeError("Use `await queryset[n:].first()` on AsyncQuerySet.")
+        return super().__getitem__(key)
+
+    def __aiter__(self):
+        return self.iterator()
+
+    def parallel_map(self, func: Callable[[T], Any], **kwargs) -> Any:
+        # Workers read through blocking sync sessions, which would stall the loop
+        raise NotImplementedError(
+            "parallel_map() is not available on AsyncQuerySet; use `Model.objects`."
+        )
+
+    async def _commit(self) -> None:
+        if should_commit(self.session):
+            await self.session.commit()
+        else:
+            await self.session.flush()
+
+    async def _select(self):
+        query, params = self._cached_query("select", self._build_query)
+        with self._scope("select") as scope:
+            self._set_result(await self.session.execute(query, params))
+            scope.rows = len(self._result_cache)
+
+    async def _fetch_first(self) -> Union[T, None]:
+        if self._is_empty_slice:
+            return None
+        with self._scope("first") as scope:
+            result = await self.session.execute(*self._first_query())
+            row = self._first_row(result)
+            scope.rows = int(row is not None)
+        return row
+
+    async def all(self) -> List[T]:
+        cloned_qs = self._clone()
+        await cloned_qs._select()
+        return cloned_qs._result_cache
+
+    async def iterator(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE, expunge: bool = False
+    ) -> AsyncIterator[T]:
+        query, params = self._cached_query("select", self._build_query)
+        with self._scope("iterator"):
+            result = await self.session.stream(
+                query, params, execution_options={"yield_per": chunk_size}
+            )
         try:
-            return self.filter(**kwargs).first()
-        except NoResultFound:
-            raise ValueError("No results found.")
-        except MultipleResultsFound:
-            raise ValueError("Multiple results returned for `get`.")
+            async for chunk in self._rows(result).partitions():
+                for row in self._convert_rows(chunk):
+                    yield row
+                if expunge and self._values_mode is None:
+                    for obj in chunk:
+                        self.session.expunge(obj)
+        finally:
+            await result.close()
+
+    async def first(self) -> Union[T, None]:
+        if self._executed:
+            return self._result_cache[0] if self._result_cache else None
+        return await self._ordered()._fetch_first()
+
+    async def last(self) -> Union[T, None]:
+        if self.is_sliced and not self._executed:
+            await self._select()
+        if self._executed:
+            return self._result_cache[-1] if self._result_cache else None
+        return await self._ordered().reverse()._fetch_first()
+
+    async def count(self) -> int:
+        if self._executed:
+            return len(self._result_cache)
+
+        query, params = self._cached_query("count", self._build_count_query)
+        with self._scope("count"):
+            return (await self.session.execute(query, params)).scalar()
+
+    async def exists(self) -> bool:
+        if self._executed:
+            return bool(self._result_cache)
+
+        query, params = self._cached_query("exists", self._build_exists_query)
+        with self._scope("exists"):
+            return bool((await self.session.execute(query, params)).scalar())
+
+    async def aggregate(self, *args: Aggregate, **kwargs: Aggregate) -> dict:
+        query, params = self._cached_query(
+            ("aggregate", *self._aggregate_shape(args, kwargs)),
+            lambda bind_params: self._build_aggregate_query(args, kwargs, bind_params),
+        )
+        with self._scope("aggregate"):
+            return dict((await self.session.execute(query, params)).one()._mapping)
+
+    async def create(self, **kwargs) -> T:
+        obj = self._build(kwargs)
+        self.session.add(obj)
+        with self._scope("create"):
+            await self._commit()
+        self._invalidate_cache(obj)
+        return obj
+
+    async def delete(self, **kwargs) -> None:
+        with self._scope("delete"):
+            await self.session.execute(self._build_delete_query())
+            await self._commit()
+        self._invalidate_cache()
+
+    async def update(self, **kwargs) -> None:
+        with self._scope("update"):
+            await self.session.execute(self._build_update_query(**kwargs))
+            await self._commit()
+        self._invalidate_cache()
+
+    async def bulk_create(
+        self,
+        objs: Iterable[Any],
+        batch_size: Optional[int] = None,
+        on_conflict: Optional[str] = None,
+        conflict_fields: Optional[List[str]] = None,
+    ) -> List[T]:
+        returning = self._supports_returning()
+        batches = self._insert_batches(
+            objs, batch_size, returning, on_conflict, conflict_fields
+        )
+
+        created: List[T] = []
+        for insert_query, rows, instances in batches:
+            with self._scope("bulk_create"):
+                if returning:
+                    result = await self.session.scalars(insert_query, rows)
+                    created.extend(result.all())
+                else:
+                    await self.session.execute(insert_query, rows)
+                    created.extend(instances)
+
+                await self._commit()
+
+        if on_conflict == "update":
+            self._invalidate_cache()
+        return created
+
+    async def get_or_create(
+        self, defaults: Optional[dict] = None, **kwargs
+    ) -> Tuple[T, bool]:
+        conflict_fields = self._lookup_conflict_fields(kwargs)
+        if conflict_fields is None:
+            obj = await self.filter(**kwargs).first()
+            if obj is not None:
+                return obj, False
+            return await self.create(**{**kwargs, **(defaults or {})}), True
+
+        insert_query, row = self._get_or_create_query(conflict_fields, defaults, kwargs)
+        with self._scope("get_or_create"):
+            obj = (await self.session.scalars(insert_query, [row])).first()
+            await self._commit()
+
+        if obj is not None:
+            self._invalidate_cache(obj)
+            return obj, True
+
+        return await self._conflicting(conflict_fields, kwargs).first(), False
+
+    async def update_or_create(
+        self, defaults: Optional[dict] = None, **kwargs
+    ) -> Tuple[T, bool]:
+        conflict_fields = self._lookup_conflict_fields(kwargs)
+        if conflict_fields is None:
+            raise ValueError(
+                "`update_or_create` lookup fields must be exactly a unique field; "
+                "pass the other fields in `defaults`."
+            )
+
+        insert_query, row = self._update_or_create_query(
+            conflict_fields, defaults, kwargs
+        )
+        with self._scope("update_or_create"):
+            obj = (await self.session.scalars(insert_query, [row])).one()
+            await self._commit()
+
+        self._invalidate_cache()
+        return obj, obj.id == row["id"]
+
+    async def bulk_update(
+        self,
+        objs: Iterable[Any],
+        fields: Optional[List[str]] = None,
+        batch_size: Optional[int] = None,
+    ) -> int:
+        updated = 0
+        for update_query, rows in self._update_batches(objs, fields, batch_size):
+            with self._scope("bulk_update"):
+                await self.session.execute(update_query, rows)
+                await self._commit()
+            updated += len(rows)
+
+        self._invalidate_cache()
+        return updated
+
+    async def get(self, **kwargs) -> T:
+        key = self._get_key(kwargs)
+        if (cached := self._cache_get(key)) is not None:
+            return await self.session.merge(cached, load=False)
+
+        if key is not None and key[0] == "id":
+            with self._scope("get"):
+                obj = await self.session.get(self.model_class, key[1])
+        else:
+            obj = await self.filter(**kwargs).first()
+
+        self._cache_set(key, obj)
+        return obj
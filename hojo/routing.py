@@ -0,0 +1,107 @@
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from hojo.config import Config
+from hojo.connection import DEFAULT_DATABASE, Connection
+from hojo.instrumentation import current_scope
+from hojo.transaction import WRITTEN, in_atomic_block
+
+
+class DatabaseRouter:
+    """
+    Picks the database for each statement. Writes go to "default"; reads go to
+    "replica" when it is configured, except inside `atomic` blocks and once the
+    session has written in its current transaction, so they see their own writes.
+
+    Replace it with `Hojo.config(database_router=MyRouter())`; returning None from
+    either method falls back to "default".
+    """
+
+    read_database = "replica"
+
+    def db_for_read(self, model: Any, **hints) -> Optional[str]:
+        session = hints.get("session")
+        if session is not None and (in_atomic_block(session) or session.has_written):
+            return DEFAULT_DATABASE
+        if self.read_database in Connection().databases:
+            return self.read_database
+        return DEFAULT_DATABASE
+
+    def db_for_write(self, model: Any, **hints) -> Optional[str]:
+        return DEFAULT_DATABASE
+
+
+DEFAULT_ROUTER = DatabaseRouter()
+
+
+def get_router() -> DatabaseRouter:
+    return Config.get("database_router") or DEFAULT_ROUTER
+
+
+class RoutingSession(Session):
+    """
+    Session that runs each statement on the database chosen by the router, or the
+    one pinned with `QuerySet.using`. With a single database it is a plain session.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._connection = Connection()
+
+    @property
+    def has_written(self) -> bool:
+        """
+        Whether the session has written in its current transaction.
+        """
+        return self.info.get(WRITTEN, False)
+
+    @has_written.setter
+    def has_written(self, value: bool) -> None:
+        self.info[WRITTEN] = value
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        write = self._flushing or getattr(clause, "is_dml", False)
+        if write:
+            self.has_written = True
+
+        if bind is not None or not self._connection.routing:
+            return super().get_bind(mapper, clause=clause, bind=bind, **kwargs)
+
+        return self._engine(self.database_for(mapper, clause, write))
+
+    def database_for(self, mapper=None, clause=None, write: bool = False) -> str:
+        scope = current_scope()
+        if scope is not None and scope.database:
+            return scope.database
+
+        model = getattr(mapper, "class_", mapper)
+        hints = {
+            "session": self,
+            "operation": scope.operation if scope is not None else None,
+        }
+        if write:
+            database = get_router().db_for_write(model, **hints)
+        else:
+            database = get_router().db_for_read(model, **hints)
+        return database or DEFAULT_DATABASE
+
+    def _engine(self, database: str):
+        return self._connection.get_engine(database)
+
+
+class AsyncRoutingSession(RoutingSession):
+    """
+    Sync session behind an `AsyncSession`, which needs the async engines.
+    """
+
+    def _engine(self, database: str):
+        return self._connection.get_async_engine(database).sync_engine
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _reset_written(session, transaction) -> None:
+    # Once the outermost transaction ends, replicas can serve reads again
+    if transaction.parent is None:
+        session.has_written = False
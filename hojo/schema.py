@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-import json
-from typing import List, Optional, Union
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
 from attrs import define, make_class
 
-from hojo.converter import SchemaConverter
+from hojo.converter import dump_fn, load_fn
 
 
 class BaseSchema:
@@ -14,7 +13,7 @@ class BaseSchema:
         if isinstance(data, BaseSchema):
             data = data.dump()
 
-        return SchemaConverter.structure(data, cls)
+        return load_fn(cls)(data, cls)
 
     def dump(
         self,
@@ -22,22 +21,104 @@ class BaseSchema:
         only: Optional[List[str]] = None,
         exclude: Optional[List[str]] = None,
     ):
-        data = SchemaConverter.unstructure(self)
+        unstructure = dump_fn(
+            self.__class__,
+            frozenset(only) if only else None,
+            frozenset(exclude) if exclude else None,
+            skip_none,
+        )
+        return unstructure(self)
+
+    def dumps(
+        self,
+        skip_none: bool = False,
+        only: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+    ) -> Union[str, bytes]:
+        """
+        Serialise with the configured JSON backend: `str` with the default stdlib
+        backend, `bytes` with orjson and msgspec (and "auto" when either is installed).
+        """
+        # Imported here so that only JSON users load the optional backends
+        from hojo.encoders import get_json_backend
+
+        backend = get_json_backend()
+        unstructure = dump_fn(
+            self.__class__,
+            frozenset(only) if only else None,
+            frozenset(exclude) if exclude else None,
+            skip_none,
+            backend.native_types,
+        )
+        return backend.dumps(unstructure(self))
 
-        if only:
-            data = {key: val for key, val in data.items() if key in only}
-        elif exclude:
-            data = {key: val for key, val in data.items() if key not in exclude}
+    @classmethod
+    def loads(cls, data: Union[str, bytes]):
+        from hojo.encoders import get_json_backend
 
-        if skip_none:
-            data = {key: val for key, val in data.items() if val is not None}
+        return cls.load(get_json_backend().loads(data))
 
-        return data
+    @classmethod
+    def load_many(cls, iterable: Iterable[Union[dict, BaseSchema]]) -> list:
+        structure = load_fn(cls)
 
-    def dumps(self, **kwargs):
-        data = self.dump(**kwargs)
+        return [
+            structure(data.dump() if isinstance(data, BaseSchema) else data, cls)
+            for data in iterable
+        ]
 
-        return json.dumps(data)
+    @classmethod
+    def dump_many(
+        cls,
+        iterable: Iterable[BaseSchema],
+        skip_none: bool = False,
+        only: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+    ) -> List[dict]:
+        return list(_dump_iter(iterable, skip_none, only, exclude))
+
+    @classmethod
+    def dumps_lines(
+        cls,
+        iterable: Iterable[BaseSchema],
+        skip_none: bool = False,
+        only: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+    ) -> Iterator[Union[str, bytes]]:
+        """
+        Yield one JSON document per object, newline terminated (JSON Lines). Objects
+        are serialised as they are consumed, so a `QuerySet.iterator()` can be
+        streamed to a file with `fp.writelines(Model.dumps_lines(rows))`. Lines are
+        `bytes` for binary JSON backends.
+        """
+        from hojo.encoders import get_json_backend
+
+        backend = get_json_backend()
+        dumped = _dump_iter(iterable, skip_none, only, exclude, backend.native_types)
+        for data in dumped:
+            yield backend.dumps_line(data)
+
+
+def _dump_iter(
+    iterable: Iterable[BaseSchema],
+    skip_none: bool,
+    only: Optional[List[str]],
+    exclude: Optional[List[str]],
+    native_types: Tuple[type, ...] = (),
+) -> Iterator[dict]:
+    only = frozenset(only) if only else None
+    exclude = frozenset(exclude) if exclude else None
+
+    # Rows of a batch are almost always of one class, so the function is only looked
+    # up again when the class changes
+    current_cls = None
+    unstructure = None
+    for obj in iterable:
+        if obj.__class__ is not current_cls:
+            current_cls = obj.__class__
+            unstructure = dump_fn(current_cls, only, exclude, skip_none, native_types)
+
+        yield unstructure(obj)
 
 
 def schema(cls) -> BaseSchema:
@@ -0,0 +1,146 @@
+from asyncio import current_task
+from contextlib import ContextDecorator
+from contextvars import ContextVar
+from inspect import isawaitable
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy.util import ScopedRegistry
+
+
+class session_scope(ContextDecorator):
+    """
+    Give the block its own sessions, closed when it ends, e.g. one per web request,
+    job or asyncio task, so identity maps don't outlive the unit of work:
+
+        with session_scope():
+            handle(request)
+
+    `Connection().session` and the managers use the block's session while it runs.
+    Nested blocks share the outermost block's sessions. asyncio tasks started in the
+    block get their own, also closed when it ends; so do threads, but only those
+    that run in a copy of its context (`asyncio.to_thread`,
+    `contextvars.copy_context().run`), since a plain `threading.Thread` starts
+    outside the scope. Use `async with` when the block uses async sessions, so they
+    can be closed.
+    """
+
+    def __init__(self) -> None:
+        self.sessions: Dict[Any, Any] = {}
+        self._token = None
+
+    def _recreate_cm(self):
+        return self.__class__()
+
+    def __enter__(self) -> "session_scope":
+        if _current_scope.get() is None:
+            self._token = _current_scope.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        if self._token is not None:
+            _current_scope.reset(self._token)
+            for session in self._pop_sessions():
+                session.close()
+        return False
+
+    async def __aenter__(self) -> "session_scope":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> bool:
+        if self._token is not None:
+            _current_scope.reset(self._token)
+            for session in self._pop_sessions():
+                closed = session.close()
+                if isawaitable(closed):
+                    await closed
+        return False
+
+    def _pop_sessions(self) -> list:
+        sessions = list(self.sessions.values())
+        self.sessions.clear()
+        return sessions
+
+
+_current_scope: ContextVar[Optional[session_scope]] = ContextVar(
+    "hojo_session_scope", default=None
+)
+
+
+def in_session_scope() -> bool:
+    return _current_scope.get() is not None
+
+
+class SessionRegistry:
+    """
+    Registry behind `Connection().session` and `async_session`: inside a
+    `session_scope()` the scope's session for the current `scopefunc()` (thread or
+    asyncio task), otherwise the `fallback` registry's.
+    """
+
+    def __init__(
+        self, createfunc: Callable[[], Any], fallback, scopefunc: Callable[[], Any]
+    ) -> None:
+        self.createfunc = createfunc
+        self.fallback = fallback
+        self.scopefunc = scopefunc
+
+    def _key(self) -> tuple:
+        # Tasks (and threads run in a copy of the context) inherit the block's scope,
+        # but a session can't be used concurrently: each gets its own, closed with
+        # the block
+        return self, self.scopefunc()
+
+    def __call__(self):
+        scope = _current_scope.get()
+        if scope is None:
+            return self.fallback()
+
+        key = self._key()
+        session = scope.sessions.get(key)
+        if session is None:
+            session = scope.sessions[key] = self.createfunc()
+        return session
+
+    def has(self) -> bool:
+        scope = _current_scope.get()
+        if scope is None:
+            return self.fallback.has()
+        return self._key() in scope.sessions
+
+    def set(self, obj) -> None:
+        scope = _current_scope.get()
+        if scope is None:
+            self.fallback.set(obj)
+        else:
+            scope.sessions[self._key()] = obj
+
+    def clear(self) -> None:
+        scope = _current_scope.get()
+        if scope is None:
+            self.fallback.clear()
+        else:
+            scope.sessions.pop(self._key(), None)
+
+
+class TaskRegistry(ScopedRegistry):
+    """
+    One async session per asyncio task, closed once the task is done.
+    """
+
+    def __init__(self, createfunc: Callable[[], Any]) -> None:
+        super().__init__(createfunc, current_task)
+
+    def __call__(self):
+        task = current_task()
+        try:
+            return self.registry[task]
+        except KeyError:
+            session = self.registry.setdefault(task, self.createfunc())
+            if task is not None:
+                task.add_done_callback(self._discard)
+            return session
+
+    def _discard(self, task) -> None:
+        session = self.registry.pop(task, None)
+        if session is not None:
+            task.get_loop().create_task(session.close())
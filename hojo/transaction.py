@@ -0,0 +1,134 @@
+from contextlib import ContextDecorator
+
+from hojo.config import Config
+from hojo.connection import Connection
+
+# Key in `session.info`. The depth is kept on the session the block opened rather
+# than in the context: asyncio tasks spawned in the block copy the context but
+# write through their own sessions, which the block never commits.
+ATOMIC_DEPTH = "hojo_atomic_depth"
+
+# Key in `session.info`, set once the session writes in its current transaction
+WRITTEN = "hojo_written"
+
+
+def in_atomic_block(session=None) -> bool:
+    """
+    Whether `session` (the current thread's session by default) is in an `atomic`
+    block.
+    """
+    if session is None:
+        session = Connection().session
+    return session.info.get(ATOMIC_DEPTH, 0) > 0
+
+
+def reads_uncommitted(session=None) -> bool:
+    """
+    Whether what `session` reads may still be rolled back: inside an `atomic` block,
+    or once it has written in its current transaction.
+    """
+    if session is None:
+        session = Connection().session
+    return in_atomic_block(session) or session.info.get(WRITTEN, False)
+
+
+def should_commit(session=None) -> bool:
+    """
+    Whether a write through `session` should commit right away: only outside
+    `atomic` blocks, and only while autocommit is on
+    (`Hojo.config(autocommit=False)` turns it off).
+    """
+    if in_atomic_block(session):
+        return False
+
+    autocommit = Config.get("autocommit")
+    return autocommit is None or bool(autocommit)
+
+
+class atomic(ContextDecorator):
+    """
+    Group writes into a single transaction. Inside the block, `create`, `update`,
+    `delete` and the bulk operations only flush; the outermost block commits on exit,
+    or rolls back if an exception escapes it. Nested blocks run in a SAVEPOINT unless
+    `savepoint=False`.
+
+    Works as a context manager (`with atomic():` / `async with atomic():`) and as a
+    decorator for synchronous functions. The block covers the session it opened:
+    asyncio tasks spawned in it write through their own sessions and commit on their
+    own.
+    """
+
+    def __init__(self, savepoint: bool = True) -> None:
+        self.savepoint = savepoint
+        self._session = None
+        self._transaction = None
+        self._outermost = False
+
+    def _enter_block(self) -> bool:
+        depth = self._session.info.get(ATOMIC_DEPTH, 0)
+        self._session.info[ATOMIC_DEPTH] = depth + 1
+        return depth == 0
+
+    def _exit_block(self) -> None:
+        depth = self._session.info.pop(ATOMIC_DEPTH) - 1
+        if depth:
+            self._session.info[ATOMIC_DEPTH] = depth
+
+    def _recreate_cm(self):
+        # Decorated functions may run concurrently, so each call gets its own state
+        return self.__class__(self.savepoint)
+
+    def __enter__(self):
+        # The session itself, so the block ends on the session it started on
+        self._session = Connection().session()
+        self._outermost = self._enter_block()
+        if not self._outermost and self.savepoint:
+            self._transaction = self._session.begin_nested()
+        return self._session
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._exit_block()
+
+        if self._outermost:
+            if exc_type is None:
+                try:
+                    self._session.commit()
+                except BaseException:
+                    self._session.rollback()
+                    raise
+            else:
+                self._session.rollback()
+        elif self._transaction is not None:
+            if exc_type is None:
+                self._transaction.commit()
+            else:
+                self._transaction.rollback()
+
+        return False
+
+    async def __aenter__(self):
+        self._session = Connection().async_session()
+        self._outermost = self._enter_block()
+        if not self._outermost and self.savepoint:
+            self._transaction = await self._session.begin_nested()
+        return self._session
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self._exit_block()
+
+        if self._outermost:
+            if exc_type is None:
+                try:
+                    await self._session.commit()
+                except BaseException:
+                    await self._session.rollback()
+                    raise
+            else:
+                await self._session.rollback()
+        elif self._transaction is not None:
+            if exc_type is None:
+                await self._transaction.commit()
+            else:
+                await self._transaction.rollback()
+
+        return False
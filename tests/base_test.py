@@ -18,3 +18,18 @@ class TestBaseModel:
     def test_inheritance_from_base_schema(self):
         assert issubclass(TestBaseModel.MockModel, BaseModel)
         assert issubclass(TestBaseModel.MockModel, BaseSchema)
+
+    def test_manager_bound_per_model(self):
+        manager = TestBaseModel.MockModel.objects
+        another_manager = TestBaseModel.AnotherMockModel.objects
+
+        assert manager is not another_manager
+        assert manager.model_class is TestBaseModel.MockModel
+        assert another_manager.model_class is TestBaseModel.AnotherMockModel
+
+    def test_manager_binding_is_cached(self):
+        assert TestBaseModel.MockModel.objects is TestBaseModel.MockModel.objects
+
+    def test_manager_not_accessible_from_instance(self):
+        with pytest.raises(AttributeError):
+            TestBaseModel.MockModel().objects
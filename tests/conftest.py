@@ -1,6 +1,11 @@
+from functools import lru_cache
+
 import pytest
+from sqlalchemy.orm import registry
 
 from hojo import Hojo
+from hojo.connection import Connection
+from hojo.orm.mapper import map_models
 
 
 @pytest.fixture
@@ -16,3 +21,69 @@ def config():
     )
 
     Hojo.config(db_uri=db_uri)
+
+
+def _in_tmp_path(value, tmp_path):
+    if isinstance(value, str):
+        return value.format(tmp_path=tmp_path)
+    if isinstance(value, dict):
+        return {key: _in_tmp_path(item, tmp_path) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_in_tmp_path(item, tmp_path) for item in value]
+    return value
+
+
+@pytest.fixture
+def database(request, tmp_path):
+    """
+    A fresh `Connection` to a SQLite file under `tmp_path`, sync and async, torn
+    down after the test. Parametrise it indirectly to change the configuration;
+    `{tmp_path}` in strings is filled in:
+
+        @pytest.mark.parametrize("database", [{"pool_size": 3}], indirect=True)
+    """
+    configurations = {
+        "db_uri": "sqlite:///{tmp_path}/hojo.db",
+        "async_db_uri": "sqlite+aiosqlite:///{tmp_path}/hojo.db",
+        **getattr(request, "param", {}),
+    }
+    configurations = _in_tmp_path(configurations, tmp_path)
+
+    Connection.reset()
+    Hojo.config(**configurations)
+    connection = Connection()
+    yield connection
+
+    connection.remove()
+    for engines in connection._engines.values():
+        for engine in engines:
+            engine.dispose()
+    for engines in connection._async_engines.values():
+        for engine in engines:
+            engine.sync_engine.dispose()
+    Hojo.config(**dict.fromkeys(configurations))
+    Connection.reset()
+
+
+@lru_cache(maxsize=None)
+def _mapped(*models) -> registry:
+    # A model is only mapped once, so each set of models keeps its registry
+    return map_models(list(models), registry())
+
+
+@pytest.fixture
+def create_tables(database):
+    """
+    Map `models` in a registry of their own and create their tables on the test's
+    `database` (or on `engine`); returns the registry:
+
+        def test_launch(create_tables):
+            create_tables(Rocket, Launch)
+    """
+
+    def create(*models, engine=None) -> registry:
+        mapper_registry = _mapped(*models)
+        mapper_registry.metadata.create_all(engine or database.get_engine())
+        return mapper_registry
+
+    return create
@@ -3,7 +3,14 @@ import os
 import pytest
 
 from hojo import Config, Hojo
-from hojo.connection import Connection, ConnectionCredentialError, scoped_session
+from hojo.connection import (
+    Connection,
+    ConnectionCredentialError,
+    PoolMetrics,
+    scoped_session,
+)
+
+POOL_CONFIG = {"pool_size": 3, "max_overflow": 2}
 
 
 # Test class for Connection
@@ -37,3 +44,48 @@ class TestConnection:
         connection1 = Connection()
         connection2 = Connection()
         assert connection1 is connection2
+
+    def test_singleton_keeps_engine(self, config):
+        engine = Connection()._get_engine()
+        assert Connection()._get_engine() is engine
+
+    @pytest.mark.parametrize("database", [POOL_CONFIG], indirect=True)
+    def test_engine_options_from_config(self, database):
+        Hojo.config(engine_options={"pool_recycle": 300})
+        options = Connection().engine_options()
+        Hojo.config(engine_options=None)
+
+        assert options == {"pool_size": 3, "max_overflow": 2, "pool_recycle": 300}
+
+    @pytest.mark.parametrize("database", [POOL_CONFIG], indirect=True)
+    def test_pool_stats(self, database):
+        connection = Connection()
+        with connection._get_engine().connect():
+            stats = connection.pool_stats()
+
+        assert stats["size"] == 3
+        assert stats["checkedout"] == 1
+        assert stats["checkouts"] == 1
+        assert stats["timeouts"] == 0
+
+    @pytest.mark.parametrize("database", [POOL_CONFIG], indirect=True)
+    def test_checkout_hook(self, database):
+        waits = []
+        Hojo.config(on_pool_checkout=waits.append)
+        with Connection()._get_engine().connect():
+            pass
+        Hojo.config(on_pool_checkout=None)
+
+        assert len(waits) == 1
+
+
+class TestPoolMetrics:
+    def test_record_checkout(self):
+        metrics = PoolMetrics()
+        metrics.record_checkout(0.1)
+        metrics.record_checkout(0.3)
+
+        stats = metrics.as_dict()
+        assert stats["checkouts"] == 2
+        assert stats["wait_max"] == 0.3
+        assert stats["wait_avg"] == pytest.approx(0.2)
@@ -0,0 +1,59 @@
+import subprocess
+import sys
+from pathlib import Path
+
+# Modules only the ORM needs; `from hojo import schema` must not load them
+ORM_MODULES = ("sqlalchemy", "sqlalchemy_utils", "pendulum", "pluralizer", "uuid6")
+
+
+def imported_modules(code: str) -> dict:
+    """
+    Run `code` in a fresh interpreter with `-X importtime` and return the imported
+    top-level packages with their cumulative import time in microseconds.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    modules: dict = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        package = name.strip().split(".")[0]
+        modules[package] = max(modules.get(package, 0), int(cumulative))
+
+    return modules
+
+
+class TestImportTime:
+    def test_schema_does_not_load_the_orm(self):
+        modules = imported_modules("from hojo import schema, BaseSchema")
+
+        assert "cattrs" in modules
+        assert not [module for module in ORM_MODULES if module in modules]
+
+    def test_schema_round_trip_does_not_load_the_orm(self):
+        modules = imported_modules(
+            "from datetime import datetime\n"
+            "from hojo import schema\n"
+            "@schema\n"
+            "class Event:\n"
+            "    name: str\n"
+            "    at: datetime\n"
+            "Event.load(Event.load({'name': 'a', 'at': '2023-12-10T10:00:00'}).dump())"
+        )
+
+        assert not [module for module in ORM_MODULES if module in modules]
+
+    def test_orm_loads_on_first_use(self):
+        modules = imported_modules("import hojo; hojo.model")
+
+        assert "sqlalchemy" in modules
+        assert "pendulum" in modules
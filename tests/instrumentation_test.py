@@ -0,0 +1,122 @@
+import logging
+from threading import Thread
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from hojo import Hojo
+from hojo.debug import capture_queries
+from hojo.instrumentation import (
+    QUERY_STATS,
+    QueryEvent,
+    QueryScope,
+    instrument_engine,
+    query_stats,
+)
+
+
+class Book:
+    pass
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    QUERY_STATS.reset()
+    yield engine
+    engine.dispose()
+    QUERY_STATS.reset()
+    Hojo.config(query_hooks=None, slow_query_threshold=None)
+
+
+def run(engine, sql: str):
+    with engine.connect() as connection:
+        return connection.execute(text(sql)).all()
+
+
+class TestInstrumentation:
+    def test_hooks_receive_events(self, engine):
+        events = []
+        Hojo.config(query_hooks=[events.append])
+
+        run(engine, "SELECT 1")
+
+        (query_event,) = events
+        assert isinstance(query_event, QueryEvent)
+        assert query_event.sql == "SELECT 1"
+        assert query_event.model is None
+        assert query_event.operation == "select"
+        assert query_event.duration >= 0
+        assert query_event.call_site.startswith(__file__)
+
+    def test_scope_sets_model_operation_and_rows(self, engine):
+        events = []
+        Hojo.config(query_hooks=[events.append])
+
+        with QueryScope(Book, "select") as scope:
+            scope.rows = len(run(engine, "SELECT 1 UNION SELECT 2"))
+            assert events == []
+
+        assert [(e.model, e.operation, e.rows) for e in events] == [
+            ("Book", "select", 2)
+        ]
+
+    def test_slow_query_log(self, engine, caplog):
+        Hojo.config(slow_query_threshold=0)
+
+        with caplog.at_level(logging.WARNING, logger="hojo.queries"):
+            run(engine, "SELECT 1")
+
+        assert "Slow query" in caplog.text
+        assert "SELECT 1" in caplog.text
+
+    def test_no_slow_query_log_below_threshold(self, engine, caplog):
+        Hojo.config(slow_query_threshold=60)
+
+        with caplog.at_level(logging.WARNING, logger="hojo.queries"):
+            run(engine, "SELECT 1")
+
+        assert caplog.text == ""
+
+    def test_stats_per_model_and_operation(self, engine):
+        for _ in range(3):
+            with QueryScope(Book, "count"):
+                run(engine, "SELECT 1")
+        run(engine, "SELECT 1")
+
+        stats = query_stats()
+        assert stats["Book"]["count"]["count"] == 3
+        assert stats[None]["select"]["count"] == 1
+        assert set(stats["Book"]["count"]) == {"count", "total", "p50", "p99"}
+        assert stats["Book"]["count"]["p50"] <= stats["Book"]["count"]["p99"]
+
+
+class TestCaptureQueries:
+    def test_counts_queries(self, engine):
+        with capture_queries() as queries:
+            run(engine, "SELECT 1")
+            run(engine, "SELECT 2")
+
+        run(engine, "SELECT 3")
+
+        assert queries.count == 2
+        assert queries.statements == ["SELECT 1", "SELECT 2"]
+
+    def test_nested_captures(self, engine):
+        with capture_queries() as outer:
+            run(engine, "SELECT 1")
+            with capture_queries() as inner:
+                run(engine, "SELECT 2")
+
+        assert len(outer) == 2
+        assert len(inner) == 1
+
+    def test_other_threads_are_not_captured(self, engine):
+        with capture_queries() as queries:
+            thread = Thread(target=run, args=(engine, "SELECT 1"))
+            thread.start()
+            thread.join()
+            run(engine, "SELECT 2")
+
+        assert queries.statements == ["SELECT 2"]
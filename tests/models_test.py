@@ -1,3 +1,4 @@
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID
 
@@ -5,7 +6,14 @@ import pytest
 from pendulum import DateTime
 
 from hojo.base import BaseModel, model
+from hojo.config import Config
 from hojo.errors import ValidationError
+from hojo.orm.manager import Manager
+
+
+class ActiveManager(Manager):
+    def active(self):
+        return self.filter(active=True)
 
 
 @model
@@ -14,6 +22,13 @@ class User:
     age: Optional[int] = None
 
 
+@model
+class Account:
+    active: bool = True
+
+    objects = ActiveManager()
+
+
 def test_decorator():
     payload = {"name": "John", "age": 30}
     user = User(**payload)
@@ -58,3 +73,69 @@ def test_dump():
     assert user_dict["id"] == user_id
     assert user_dict["created_at"] == user_created
     assert user_dict["updated_at"] == user_updated
+
+
+def test_custom_manager():
+    assert isinstance(Account.objects, ActiveManager)
+    assert Account.objects.model_class is Account
+    assert not isinstance(User.objects, ActiveManager)
+    assert User.objects.model_class is User
+
+
+def test_load_structures_timestamps_without_reparsing():
+    created_at = DateTime(2023, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    user = User.load(
+        {"name": "John", "created_at": created_at, "updated_at": "2023-01-02T03:04:05Z"}
+    )
+
+    assert user.created_at is created_at
+    assert isinstance(user.updated_at, DateTime)
+    assert user.updated_at == created_at
+
+
+def test_stdlib_timestamps():
+    Config.set("stdlib_timestamps", True)
+    try:
+
+        @model
+        class Event:
+            name: str
+
+    finally:
+        Config.set("stdlib_timestamps", None)
+        BaseModel._registry.remove(Event)
+
+    event = Event.load({"name": "launch", "created_at": "2023-01-02T03:04:05+00:00"})
+
+    assert type(event.created_at) is datetime
+    assert event.created_at == datetime(2023, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert type(event.updated_at) is datetime
+    assert event.updated_at.tzinfo is timezone.utc
+    assert event.dump()["created_at"] == "2023-01-02T03:04:05+00:00"
+
+
+def test_stdlib_timestamps_round_trip(database, create_tables):
+    Config.set("stdlib_timestamps", True)
+    try:
+
+        @model
+        class Launch:
+            name: str
+            at: Optional[datetime] = None
+
+    finally:
+        Config.set("stdlib_timestamps", None)
+        BaseModel._registry.remove(Launch)
+
+    create_tables(Launch)
+    at = datetime(2023, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=-3)))
+    created = Launch.objects.create(name="liftoff", at=at)
+    database.remove()
+
+    loaded = Launch.objects.get(id=created.id)
+    fresh = Launch(name="orbit")
+
+    assert loaded.created_at == created.created_at
+    assert loaded.created_at.tzinfo is timezone.utc
+    assert loaded.created_at < fresh.created_at
+    assert loaded.at == at
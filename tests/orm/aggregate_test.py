@@ -0,0 +1,187 @@
+import pytest
+
+from hojo.base import model
+from hojo.debug import capture_queries
+from hojo.orm.aggregates import Avg, Count, Max, Min, Sum
+from hojo.orm.cache import QUERY_CACHE
+from hojo.orm.queryset import QuerySet
+
+
+@model
+class Sale:
+    region: str = ""
+    product: str = ""
+    amount: int = 0
+
+
+SALES = [
+    ("north", "tea", 10),
+    ("north", "tea", 30),
+    ("north", "coffee", 20),
+    ("south", "tea", 5),
+    ("west", "coffee", 40),
+]
+
+
+@pytest.fixture
+def session(database, create_tables):
+    create_tables(Sale)
+    QuerySet(Sale, database.session).bulk_create(
+        [
+            Sale(region=region, product=product, amount=amount)
+            for region, product, amount in SALES
+        ]
+    )
+    return database.session
+
+
+def sales(session) -> QuerySet:
+    return QuerySet(Sale, session)
+
+
+class TestAggregate:
+    def test_single_query(self, session):
+        with capture_queries() as queries:
+            result = sales(session).aggregate(total=Sum("amount"), n=Count("id"))
+
+        assert result == {"total": 105, "n": 5}
+        assert queries.count == 1
+
+    def test_filtered(self, session):
+        result = (
+            sales(session)
+            .filter(region="north")
+            .aggregate(low=Min("amount"), high=Max("amount"), average=Avg("amount"))
+        )
+
+        assert result == {"low": 10, "high": 30, "average": 20}
+
+    def test_default_alias(self, session):
+        result = sales(session).aggregate(Sum("amount"), Count())
+
+        assert result == {"amount__sum": 105, "count": 5}
+
+    def test_count_distinct(self, session):
+        result = sales(session).aggregate(regions=Count("region", distinct=True))
+
+        assert result == {"regions": 3}
+
+    def test_empty(self, session):
+        result = sales(session).filter(region="east").aggregate(total=Sum("amount"))
+
+        assert result == {"total": None}
+
+    def test_sliced(self, session):
+        result = sales(session).order_by("-amount")[:2].aggregate(total=Sum("amount"))
+
+        assert result == {"total": 70}
+
+    def test_cached_query_rebinds_values(self, session):
+        QUERY_CACHE.clear()
+
+        north = sales(session).filter(region="north").aggregate(total=Sum("amount"))
+        south = sales(session).filter(region="south").aggregate(total=Sum("amount"))
+
+        assert (north, south) == ({"total": 60}, {"total": 5})
+
+    def test_requires_aggregates(self, session):
+        with pytest.raises(ValueError):
+            sales(session).aggregate()
+
+        with pytest.raises(ValueError):
+            sales(session).aggregate(total="amount")
+
+
+class TestAnnotate:
+    def test_group_by(self, session):
+        with capture_queries() as queries:
+            result = list(
+                sales(session)
+                .values("region")
+                .annotate(total=Sum("amount"), n=Count())
+                .order_by("region")
+            )
+
+        assert result == [
+            {"region": "north", "total": 60, "n": 3},
+            {"region": "south", "total": 5, "n": 1},
+            {"region": "west", "total": 40, "n": 1},
+        ]
+        assert queries.count == 1
+        assert "GROUP BY" in queries.statements[0]
+
+    def test_values_list(self, session):
+        result = list(
+            sales(session)
+            .values_list("region", "product")
+            .annotate(total=Sum("amount"))
+            .order_by("region", "product")
+        )
+
+        assert result == [
+            ("north", "coffee", 20),
+            ("north", "tea", 40),
+            ("south", "tea", 5),
+            ("west", "coffee", 40),
+        ]
+
+    def test_filter_on_annotation_is_having(self, session):
+        with capture_queries() as queries:
+            result = list(
+                sales(session)
+                .filter(product="tea")
+                .values("region")
+                .annotate(total=Sum("amount"))
+                .filter(total__gte=10)
+            )
+
+        assert result == [{"region": "north", "total": 40}]
+        assert "HAVING" in queries.statements[0]
+
+    def test_order_by_annotation(self, session):
+        result = (
+            sales(session)
+            .values_list("region")
+            .annotate(total=Sum("amount"))
+            .order_by("-total")
+        )
+
+        assert [row[0] for row in result] == ["north", "west", "south"]
+
+    def test_first_and_count(self, session):
+        grouped = sales(session).values("region").annotate(total=Sum("amount"))
+
+        assert grouped.first() == {"region": "north", "total": 60}
+        assert grouped.count() == 3
+        assert grouped.exists()
+
+    def test_aggregate_over_groups(self, session):
+        result = (
+            sales(session)
+            .values("region")
+            .annotate(total=Sum("amount"))
+            .aggregate(largest=Max("total"))
+        )
+
+        assert result == {"largest": 60}
+
+    def test_requires_values(self, session):
+        with pytest.raises(ValueError):
+            sales(session).annotate(total=Sum("amount"))
+
+        with pytest.raises(ValueError):
+            sales(session).values_list("region", flat=True).annotate(n=Count())
+
+    def test_conflicting_name(self, session):
+        with pytest.raises(ValueError):
+            sales(session).values("region").annotate(amount=Sum("amount"))
+
+
+class TestDistinct:
+    def test_values(self, session):
+        result = sales(session).values_list("region", flat=True).distinct()
+
+        assert sorted(result) == ["north", "south", "west"]
+
+    def test_count(self, session):
+        assert sales(session).values("product").distinct().count() == 2
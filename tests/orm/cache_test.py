@@ -0,0 +1,211 @@
+import asyncio
+from threading import Thread
+
+import pytest
+from attrs import define
+from sqlalchemy import update
+
+from hojo import Hojo
+from hojo.base import field, model
+from hojo.config import Config
+from hojo.debug import capture_queries
+from hojo.orm.cache import DEFAULT_QUERY_CACHE_SIZE, LRUCache, ModelCache, QueryCache
+from hojo.sessions import session_scope
+from hojo.transaction import atomic
+
+
+@model
+class Flag:
+    key: str = field(unique=True)
+    enabled: bool = False
+
+    cache = ModelCache(maxsize=10)
+
+
+@pytest.fixture
+def flag(database, create_tables):
+    create_tables(Flag)
+    flag = Flag.objects.create(key="beta")
+    database.remove()
+    Flag._model_cache.clear()
+    yield flag
+    Flag._model_cache.clear()
+
+
+class TestLRUCache:
+    def test_get_and_set(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 2}
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_clear(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.hits == 0
+
+
+class TestQueryCache:
+    @pytest.fixture(autouse=True)
+    def reset_config(self):
+        yield
+        Config.set("query_cache_size", None)
+
+    def test_default_size(self):
+        assert QueryCache().maxsize == DEFAULT_QUERY_CACHE_SIZE
+
+    def test_size_from_config(self):
+        Hojo.config(query_cache_size=10)
+        assert QueryCache().maxsize == 10
+
+    def test_disabled(self):
+        Hojo.config(query_cache_size=0)
+        cache = QueryCache()
+        cache.set("a", 1)
+
+        assert not cache.enabled
+        assert len(cache) == 0
+
+
+class TestModelCache:
+    def test_expires_after_ttl(self):
+        cache = ModelCache(maxsize=2, ttl=0)
+        cache.set(("id", 1), "obj")
+
+        assert cache.get(("id", 1)) is None
+        assert len(cache) == 0
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hits"] == 0
+
+    def test_without_ttl(self):
+        cache = ModelCache(maxsize=2)
+        cache.set(("id", 1), "obj")
+
+        assert cache.get(("id", 1)) == "obj"
+
+    def test_invalidate_keeps_counters(self):
+        cache = ModelCache(maxsize=2)
+        cache.set(("id", 1), "obj")
+        cache.get(("id", 1))
+        cache.invalidate()
+
+        assert len(cache) == 0
+        assert cache.stats() == {
+            "hits": 1,
+            "misses": 0,
+            "size": 0,
+            "maxsize": 2,
+            "ttl": None,
+            "invalidations": 1,
+        }
+
+    def test_bind_collects_unique_fields(self):
+        @define
+        class Setting:
+            key: str = field(unique=True)
+            value: str = ""
+            id: int = 0
+
+        cache = ModelCache().bind(Setting)
+
+        assert cache.keys == ("id", "key")
+        assert cache.cache_keys(Setting(key="a", id=3)) == [("id", 3), ("key", "a")]
+
+
+class TestCachedGet:
+    def test_hits_skip_the_database(self, flag):
+        Flag.objects.get(key="beta")
+
+        with session_scope(), capture_queries() as queries:
+            by_key = Flag.objects.get(key="beta")
+            by_id = Flag.objects.get(id=flag.id)
+
+        assert queries.count == 0
+        assert by_key.id == by_id.id == flag.id
+        assert Flag._model_cache.stats()["hits"] == 2
+
+    def test_hits_belong_to_the_callers_session(self, database, flag):
+        with session_scope():
+            loaded = Flag.objects.get(id=flag.id)
+
+        found = []
+        with session_scope():
+            thread = Thread(target=lambda: found.append(Flag.objects.get(id=flag.id)))
+            thread.start()
+            thread.join()
+
+            cached = Flag.objects.get(id=flag.id)
+            assert cached is not loaded
+            assert cached in database.session()
+            assert found[0] is not cached
+
+            cached.enabled = True
+            database.session.commit()
+
+        assert Flag.objects.filter(enabled=True).count() == 1
+
+    def test_writes_invalidate(self, flag):
+        Flag.objects.get(id=flag.id)
+        Flag.objects.filter(key="beta").update(enabled=True)
+
+        with session_scope():
+            assert Flag.objects.get(id=flag.id).enabled
+
+    def test_rolled_back_updates_are_not_cached(self, flag):
+        with pytest.raises(RuntimeError):
+            with atomic():
+                Flag.objects.filter(key="beta").update(enabled=True)
+                assert Flag.objects.get(key="beta").enabled
+                raise RuntimeError()
+
+        with session_scope():
+            assert not Flag.objects.get(key="beta").enabled
+
+    def test_rolled_back_creates_are_not_cached(self, flag):
+        with pytest.raises(RuntimeError):
+            with atomic():
+                Flag.objects.create(key="gamma")
+                Flag.objects.get(key="gamma")
+                raise RuntimeError()
+
+        with session_scope():
+            assert Flag.objects.filter(key="gamma").count() == 0
+            assert Flag.objects.get(key="gamma") is None
+
+    def test_reads_after_uncommitted_writes_are_not_cached(self, database, flag):
+        database.session.execute(update(Flag).values(enabled=True))
+        assert Flag.objects.get(key="beta").enabled
+        database.session.rollback()
+
+        with session_scope():
+            assert not Flag.objects.get(key="beta").enabled
+
+    def test_async_hits(self, database, flag):
+        Flag.objects.get(id=flag.id)
+
+        async def main():
+            with capture_queries() as queries:
+                cached = await Flag.aobjects.get(id=flag.id)
+            assert cached in database.async_session()
+            await database.aremove()
+            return cached, queries.count
+
+        cached, count = asyncio.run(main())
+        assert (cached.key, count) == ("beta", 0)
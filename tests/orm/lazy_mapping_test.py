@@ -0,0 +1,93 @@
+from typing import Optional
+
+import pytest
+from sqlalchemy import create_engine, inspect, select
+from sqlalchemy.orm import Session, registry
+
+from hojo.base import field, model
+from hojo.instrumentation import QUERY_STATS, query_stats
+from hojo.orm import mapper
+from hojo.orm.queryset import QuerySet
+
+
+@model
+class Guild:
+    name: str
+    heroes: list = field(has_many="Hero", factory=list, repr=False)
+
+
+@model
+class Hero:
+    name: str
+    guild: Optional[Guild] = field(belongs_to=Guild, default=None, repr=False)
+
+
+@model
+class Relic:
+    name: str
+
+
+@pytest.fixture
+def lazy_registry():
+    QUERY_STATS.reset()
+    mapper_registry = mapper.automap(registry(), lazy=True)
+    yield mapper_registry
+    for lazy_model in list(mapper._lazy_hooks):
+        mapper._remove_lazy_hooks(lazy_model)
+    mapper._lazy_registry = None
+    mapper_registry.dispose()
+
+
+def mapped_models(mapper_registry):
+    return {mapping.class_ for mapping in mapper_registry.mappers}
+
+
+class TestLazyAutomap:
+    def test_maps_nothing_up_front(self, lazy_registry):
+        assert mapped_models(lazy_registry) == set()
+        assert inspect(Relic, raiseerr=False) is None
+
+    def test_column_access_maps_model_and_relationships(self, lazy_registry):
+        column = Hero.name
+
+        assert mapped_models(lazy_registry) == {Guild, Hero}
+        assert str(select(column)) == "SELECT heroes.name \nFROM heroes"
+
+    def test_manager_access_maps_model(self, lazy_registry):
+        Relic.objects
+
+        assert mapped_models(lazy_registry) == {Relic}
+
+    def test_instances_and_queries(self, lazy_registry):
+        guild = Guild(name="Avalanche")
+        hero = Hero(name="Cloud", guild=guild)
+
+        engine = create_engine("sqlite://")
+        lazy_registry.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(hero)
+            session.commit()
+
+            assert QuerySet(Hero, session).get(name="Cloud").guild.name == "Avalanche"
+        engine.dispose()
+
+    def test_idempotent(self, lazy_registry):
+        Relic.name
+        mapper.map_models([Relic, Guild, Hero], lazy_registry)
+        mapper.map_models([Relic], lazy_registry)
+
+        assert mapped_models(lazy_registry) == {Relic, Guild, Hero}
+
+    def test_reports_cold_start(self, lazy_registry):
+        Relic.name
+
+        assert query_stats()["Relic"]["map"]["count"] == 1
+
+
+class TestTableName:
+    def test_pluralises_once(self):
+        mapper.table_name.cache_clear()
+
+        assert mapper.table_name("Category") == "categories"
+        assert mapper.table_name("Category") == "categories"
+        assert mapper.table_name.cache_info().hits == 1
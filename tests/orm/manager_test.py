@@ -3,7 +3,8 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from hojo import BaseModel, model
-from hojo.orm.manager import Manager
+from hojo.orm.manager import AsyncManager, Manager
+from hojo.orm.queryset import AsyncQuerySet
 
 
 @model
@@ -33,6 +34,16 @@ class TestManager:
         User.objects.filter(name="test")
         mock_queryset.filter.assert_called_with(name="test")
 
+    def test_iterator(self, mock_queryset):
+        User.objects.iterator(chunk_size=100, expunge=True)
+        mock_queryset.iterator.assert_called_with(chunk_size=100, expunge=True)
+
+    def test_parallel_map(self, mock_queryset):
+        User.objects.parallel_map(str, workers=2, chunk_by="created_at")
+        mock_queryset.parallel_map.assert_called_with(
+            str, workers=2, chunk_by="created_at"
+        )
+
     def test_create(self, mock_queryset):
         test_data = {"field1": "value1", "field2": "value2"}
         User.objects.create(**test_data)
@@ -48,13 +59,30 @@ class TestManager:
 
     def test_bulk_create(self, mock_queryset):
         objs = [User(name="test1"), User(name="test2")]
-        User.objects.bulk_create(objs)
-        mock_queryset.bulk_create.assert_called_with(objs)
+        User.objects.bulk_create(objs, batch_size=500)
+        mock_queryset.bulk_create.assert_called_with(
+            objs, batch_size=500, on_conflict=None, conflict_fields=None
+        )
+
+    def test_bulk_create_on_conflict(self, mock_queryset):
+        objs = [User(name="test1")]
+        User.objects.bulk_create(objs, on_conflict="update", conflict_fields=["name"])
+        mock_queryset.bulk_create.assert_called_with(
+            objs, batch_size=None, on_conflict="update", conflict_fields=["name"]
+        )
+
+    def test_update_or_create(self, mock_queryset):
+        User.objects.update_or_create(name="test", defaults={"age": 3})
+        mock_queryset.update_or_create.assert_called_with(
+            name="test", defaults={"age": 3}
+        )
 
     def test_bulk_update(self, mock_queryset):
         objs = [User(name="test1"), User(name="test2")]
-        User.objects.bulk_update(objs)
-        mock_queryset.bulk_update.assert_called_with(objs)
+        User.objects.bulk_update(objs, fields=["name"])
+        mock_queryset.bulk_update.assert_called_with(
+            objs, fields=["name"], batch_size=None
+        )
 
     def test_count(self, mock_queryset):
         User.objects.count()
@@ -64,6 +92,12 @@ class TestManager:
         User.objects.order_by("name")
         mock_queryset.order_by.assert_called_with("name")
 
+    def test_paginate_by_key(self, mock_queryset):
+        User.objects.paginate_by_key("id", after="cursor", page_size=10)
+        mock_queryset.paginate_by_key.assert_called_with(
+            "id", after="cursor", page_size=10
+        )
+
     def test_values(self, mock_queryset):
         User.objects.values("name")
         mock_queryset.values.assert_called_with("name")
@@ -93,6 +127,18 @@ class TestManager:
         User.objects.aggregate(field="value")
         mock_queryset.aggregate.assert_called_with(field="value")
 
+    def test_using(self, mock_queryset):
+        User.objects.using("replica")
+        mock_queryset.using.assert_called_with("replica")
+
+    def test_select_related(self, mock_queryset):
+        User.objects.select_related("posts")
+        mock_queryset.select_related.assert_called_with("posts")
+
+    def test_prefetch_related(self, mock_queryset):
+        User.objects.prefetch_related("posts")
+        mock_queryset.prefetch_related.assert_called_with("posts")
+
     def test_reverse(self, mock_queryset):
         User.objects.reverse()
         mock_queryset.reverse.assert_called()
@@ -108,3 +154,18 @@ class TestManager:
     def test_last(self, mock_queryset):
         User.objects.last()
         mock_queryset.last.assert_called()
+
+
+class TestAsyncManager:
+    def test_async_manager(self):
+        assert isinstance(User.aobjects, AsyncManager)
+        assert User.aobjects.model_class is User
+
+    def test_get_queryset(self):
+        with patch("hojo.orm.manager.Connection") as connection, patch(
+            "hojo.orm.queryset.select"
+        ):
+            queryset = User.aobjects.get_queryset()
+
+        assert isinstance(queryset, AsyncQuerySet)
+        assert queryset.session is connection.return_value.async_session
@@ -0,0 +1,68 @@
+from typing import Optional
+
+import pytest
+
+from hojo.base import field, model
+
+
+@model
+class Publisher:
+    name: str
+    books: list = field(has_many="Novel", factory=list, repr=False)
+
+
+@model
+class Novel:
+    title: str
+    publisher: Optional[Publisher] = field(
+        belongs_to=Publisher, default=None, repr=False
+    )
+    cover: Optional["Cover"] = field(has_one="Cover", default=None, repr=False)
+
+
+@model
+class Cover:
+    color: str
+
+
+@model
+class Category:
+    name: str
+    parent: Optional["Category"] = field(belongs_to="Category", default=None)
+
+
+@pytest.fixture
+def mapper_registry(create_tables):
+    return create_tables(Publisher, Novel, Cover, Category)
+
+
+def foreign_keys(mapper_registry, table_name, column_name):
+    column = mapper_registry.metadata.tables[table_name].c[column_name]
+    return [fk.target_fullname for fk in column.foreign_keys]
+
+
+class TestRelationships:
+    def test_belongs_to_adds_foreign_key(self, mapper_registry):
+        assert foreign_keys(mapper_registry, "novels", "publisher_id") == [
+            "publishers.id"
+        ]
+
+    def test_has_one_adds_foreign_key_to_target(self, mapper_registry):
+        assert foreign_keys(mapper_registry, "covers", "novel_id") == ["novels.id"]
+
+    def test_self_reference(self, mapper_registry):
+        assert foreign_keys(mapper_registry, "categories", "parent_id") == [
+            "categories.id"
+        ]
+
+    def test_back_populates(self, mapper_registry):
+        publisher = Publisher(name="Square")
+        novel = Novel(title="Advent Children", publisher=publisher)
+
+        assert publisher.books == [novel]
+
+    def test_has_one_is_scalar(self, mapper_registry):
+        cover = Cover(color="black")
+        novel = Novel(title="Crisis Core", cover=cover)
+
+        assert novel.cover is cover
@@ -0,0 +1,93 @@
+import operator
+
+import pytest
+
+from hojo.base import model
+from hojo.orm.parallel import key_ranges
+from hojo.orm.queryset import QuerySet
+
+
+@model
+class Probe:
+    name: str
+    distance: int
+
+
+# Workers unpickle these by reference, so they live at module level
+def double_distance(probe) -> int:
+    return probe.distance * 2
+
+
+def fail_on_far_probes(probe) -> int:
+    if probe.distance > 40:
+        raise RuntimeError(f"{probe.name} is too far")
+    return probe.distance
+
+
+@pytest.fixture
+def probes(database, create_tables):
+    create_tables(Probe)
+    QuerySet(Probe, database.session).bulk_create(
+        [Probe(name=f"probe-{index}", distance=index) for index in range(50)]
+    )
+    return QuerySet(Probe, database.session)
+
+
+class TestKeyRanges:
+    def test_ranges_cover_every_row_once(self, probes):
+        ranges = key_ranges(probes, "distance", 4)
+
+        assert ranges == [(None, 12), (12, 25), (25, 38), (38, None)]
+
+    def test_ranges_follow_filters(self, probes):
+        ranges = key_ranges(probes.filter(distance__gte=40), "distance", 2)
+
+        assert ranges == [(None, 44), (44, None)]
+
+    def test_empty_queryset(self, probes):
+        assert key_ranges(probes.filter(distance__gt=100), "distance", 4) == []
+
+
+class TestParallelMap:
+    def test_matches_serial_map(self, probes):
+        results = probes.parallel_map(double_distance, workers=2, chunks=5)
+
+        assert sorted(results) == [index * 2 for index in range(50)]
+
+    def test_chunks_by_id(self, probes):
+        results = probes.filter(distance__lt=10).parallel_map(
+            double_distance, workers=2
+        )
+
+        assert sorted(results) == [index * 2 for index in range(10)]
+
+    def test_values(self, probes):
+        results = probes.values_list("distance", flat=True).parallel_map(
+            abs, workers=2, chunk_by="distance"
+        )
+
+        assert sorted(results) == list(range(50))
+
+    def test_reduce(self, probes):
+        total = probes.filter(distance__gte=10).parallel_map(
+            double_distance, workers=2, chunk_by="distance", reduce=operator.add
+        )
+
+        assert total == sum(index * 2 for index in range(10, 50))
+
+    def test_reduce_with_initial(self, probes):
+        empty = probes.filter(distance__gt=100)
+
+        assert empty.parallel_map(abs, reduce=operator.add, initial=0) == 0
+        with pytest.raises(TypeError):
+            empty.parallel_map(abs, reduce=operator.add)
+
+    def test_errors_propagate(self, probes):
+        with pytest.raises(RuntimeError, match="too far"):
+            list(
+                probes.parallel_map(fail_on_far_probes, workers=2, chunk_by="distance")
+            )
+
+    def test_sliced_queryset(self, probes):
+        with pytest.raises(ValueError):
+            probes[:10].parallel_map(abs)
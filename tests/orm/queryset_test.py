@@ -1,10 +1,13 @@
+import asyncio
 from dataclasses import dataclass, field
+from types import SimpleNamespace
 from typing import Optional
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from hojo.orm.queryset import LookupFilter, QuerySet
+from hojo.orm.cache import ModelCache
+from hojo.orm.queryset import AsyncQuerySet, LookupFilter, QuerySet
 
 
 class MockAlchemy:
@@ -14,6 +17,30 @@ class MockAlchemy:
     def where(self, *args, **kwargs):
         return self
 
+    def returning(self, *args, **kwargs):
+        return self
+
+    def order_by(self, *args, **kwargs):
+        self.order_by_args = args
+        return self
+
+    def limit(self, limit):
+        self.limit_value = limit
+        return self
+
+    def offset(self, offset):
+        self.offset_value = offset
+        return self
+
+    def select_from(self, *args, **kwargs):
+        return self
+
+    def exists(self):
+        return self
+
+    def scalar(self):
+        return self._result
+
     def values(self, *args, **kwargs):
         return self
 
@@ -26,6 +53,13 @@ class MockAlchemy:
     def scalars(self):
         return self
 
+    def partitions(self):
+        for start in range(0, len(self._result), 2):
+            yield self._result[start : start + 2]
+
+    def close(self):
+        pass
+
     def set_result(self, result):
         self._result = result
 
@@ -42,8 +76,12 @@ def mock_delete(*args, **kwargs):
     return MockAlchemy(*args, **kwargs)
 
 
+def mock_insert(*args, **kwargs):
+    return MockAlchemy(*args, **kwargs)
+
+
 def mock_session():
-    return Mock(execute=Mock(return_value=MockAlchemy()))
+    return Mock(execute=Mock(return_value=MockAlchemy()), info={})
 
 
 class MockModel:
@@ -53,6 +91,11 @@ class MockModel:
         self._occupation = occupation
         self.field = None
 
+    @property
+    def id(self):
+        self.field = "id"
+        return self
+
     @property
     def name(self):
         self.field = "name"
@@ -71,6 +114,8 @@ class MockModel:
     def __eq__(self, other):
         return f"{self.field} == '{other}'"
 
+    __hash__ = object.__hash__
+
     def __gt__(self, other):
         return f"{self.field} > {other}"
 
@@ -92,12 +137,24 @@ class MockModel:
     def between(self, start, end):
         return f"{self.field} between {start} and {end}"
 
+    def asc(self):
+        return f"{self.field} asc"
+
+    def desc(self):
+        return f"{self.field} desc"
+
 
 @pytest.fixture
 def session():
     return mock_session()
 
 
+def mock_async_session():
+    return Mock(
+        execute=AsyncMock(return_value=MockAlchemy()), commit=AsyncMock(), info={}
+    )
+
+
 @pytest.fixture
 def queryset(session: Mock):
     return QuerySet(MockModel(), session)  # type: ignore
@@ -111,7 +168,9 @@ def apply_patches():
         "hojo.orm.queryset.update", side_effect=mock_update
     ) as mock_update_patch, patch(
         "hojo.orm.queryset.delete", side_effect=mock_delete
-    ) as mock_delete_patch:
+    ) as mock_delete_patch, patch(
+        "hojo.orm.queryset.insert", side_effect=mock_insert
+    ) as mock_insert_patch:
         yield
 
 
@@ -284,3 +343,336 @@ class TestQuerySet:
 
         assert len(result) == 2
         assert all(isinstance(item, MockModel) for item in result)
+
+    def test_iterator_streams_in_chunks(self, queryset: QuerySet):
+        mock_result = [MockModel(name="Cloud"), MockModel(name="Tifa")]
+        mock_result.append(MockModel(name="Barret"))
+        queryset.session.execute.return_value.set_result(mock_result)
+
+        result = list(queryset.filter(name="Tifa").iterator(chunk_size=2))
+
+        assert result == mock_result
+        assert queryset._result_cache is None
+        options = queryset.session.execute.call_args.kwargs["execution_options"]
+        assert options == {"yield_per": 2}
+
+    def test_iterator_expunges_chunks(self, queryset: QuerySet):
+        mock_result = [MockModel(name="Cloud"), MockModel(name="Tifa")]
+        queryset.session.execute.return_value.set_result(mock_result)
+
+        list(queryset.iterator(expunge=True))
+
+        assert queryset.session.expunge.call_count == 2
+
+
+class TestQuerySetPushdown:
+    def test_first_uses_limit(self, queryset: QuerySet):
+        mock_result = [MockModel(name="Cloud")]
+        queryset.session.execute.return_value.set_result(mock_result)
+
+        assert queryset.filter(name="Cloud").first() is mock_result[0]
+
+        query = queryset.session.execute.call_args.args[0]
+        assert query.limit_value == 1
+        assert query.order_by_args == ("id asc",)
+
+    def test_last_reverses_ordering(self, queryset: QuerySet):
+        mock_result = [MockModel(name="Tifa")]
+        queryset.session.execute.return_value.set_result(mock_result)
+
+        assert queryset.order_by("name", "-age").last() is mock_result[0]
+
+        query = queryset.session.execute.call_args.args[0]
+        assert query.limit_value == 1
+        assert query.order_by_args == ("name desc", "age asc")
+
+    def test_count(self, queryset: QuerySet):
+        queryset.session.execute.return_value.set_result(3)
+
+        assert queryset.filter(age__gt=10).count() == 3
+
+    def test_exists(self, queryset: QuerySet):
+        queryset.session.execute.return_value.set_result(True)
+
+        assert queryset.filter(age__gt=10).exists() is True
+
+    def test_uses_result_cache_when_executed(self, queryset: QuerySet):
+        mock_result = [MockModel(name="Cloud"), MockModel(name="Tifa")]
+        queryset.session.execute.return_value.set_result(mock_result)
+
+        qs = queryset.filter(age__gt=10)
+        list(qs)
+        queryset.session.execute.reset_mock()
+
+        assert qs.first() is mock_result[0]
+        assert qs.last() is mock_result[1]
+        assert qs.count() == 2
+        assert qs.exists() is True
+        queryset.session.execute.assert_not_called()
+
+
+class TestQuerySetSlicing:
+    def test_slice_is_lazy(self, queryset: QuerySet):
+        sliced_qs = queryset.order_by("name")[10:30]
+
+        assert isinstance(sliced_qs, QuerySet)
+        assert sliced_qs._low_mark == 10
+        assert sliced_qs._high_mark == 30
+        queryset.session.execute.assert_not_called()
+
+    def test_slice_of_slice(self, queryset: QuerySet):
+        sliced_qs = queryset[10:30][5:50]
+
+        assert sliced_qs._low_mark == 15
+        assert sliced_qs._high_mark == 30
+
+    def test_slice_binds_limit_and_offset(self, queryset: QuerySet):
+        list(queryset.order_by("name")[10:30])
+
+        params = queryset.session.execute.call_args.args[1]
+        assert params == {"_offset": 10, "_limit": 20}
+
+    def test_index(self, queryset: QuerySet):
+        mock_result = [MockModel(name="Cloud")]
+        queryset.session.execute.return_value.set_result(mock_result)
+
+        assert queryset[3] is mock_result[0]
+        params = queryset.session.execute.call_args.args[1]
+        assert params == {"_offset": 3, "_limit": 1}
+
+    def test_index_out_of_range(self, queryset: QuerySet):
+        with pytest.raises(IndexError):
+            queryset[3]
+
+    def test_negative_index(self, queryset: QuerySet):
+        with pytest.raises(ValueError):
+            queryset[-1]
+
+    def test_filter_after_slice(self, queryset: QuerySet):
+        with pytest.raises(ValueError):
+            queryset[:10].filter(name="Cloud")
+
+    def test_paginate_by_key(self, queryset: QuerySet):
+        page = queryset.paginate_by_key("-age", after=30, page_size=20)
+
+        assert page.lookup_filters == [LookupFilter("age", "lt", 30, False)]
+        assert page.ordering == ["-age"]
+        assert page._high_mark == 20
+
+    def test_paginate_by_key_first_page(self, queryset: QuerySet):
+        page = queryset.paginate_by_key("id", page_size=20)
+
+        assert page.lookup_filters == []
+        assert page.ordering == ["id"]
+
+
+class TestQuerySetValues:
+    def test_values(self, queryset: QuerySet):
+        queryset.session.execute.return_value.set_result([("Cloud", 35)])
+
+        result = list(queryset.values("name", "age"))
+
+        assert result == [{"name": "Cloud", "age": 35}]
+
+    def test_values_list(self, queryset: QuerySet):
+        queryset.session.execute.return_value.set_result([("Cloud", 35)])
+
+        result = list(queryset.values_list("name", "age"))
+
+        assert result == [("Cloud", 35)]
+
+    def test_values_list_flat(self, queryset: QuerySet):
+        queryset.session.execute.return_value.set_result(["Cloud", "Tifa"])
+
+        result = list(queryset.values_list("name", flat=True))
+
+        assert result == ["Cloud", "Tifa"]
+
+    def test_values_list_flat_requires_single_field(self, queryset: QuerySet):
+        with pytest.raises(ValueError):
+            queryset.values_list("name", "age", flat=True)
+
+    def test_values_first(self, queryset: QuerySet):
+        queryset.session.execute.return_value.set_result([("Cloud", 35)])
+
+        assert queryset.values("name", "age").first() == {"name": "Cloud", "age": 35}
+
+    def test_values_keeps_filters(self, queryset: QuerySet):
+        qs = queryset.filter(name="Cloud").values("age")
+
+        assert qs.lookup_filters == [LookupFilter("name", "eq", "Cloud", False)]
+        assert qs._fields == ("age",)
+
+
+class TestQuerySetRelated:
+    def test_select_related(self, queryset: QuerySet):
+        qs = queryset.select_related("author").select_related("author__publisher")
+
+        assert qs._select_related == ("author", "author__publisher")
+        assert queryset._select_related == ()
+
+    def test_prefetch_related(self, queryset: QuerySet):
+        qs = queryset.filter(name="Cloud").prefetch_related("books")
+
+        assert qs._prefetch_related == ("books",)
+        assert qs.lookup_filters == [LookupFilter("name", "eq", "Cloud", False)]
+
+
+class TestQuerySetQueryCache:
+    def test_reuses_statement_for_same_shape(self, queryset: QuerySet):
+        queryset.filter(name="Cloud", age__gt=10).count()
+        queryset.filter(name="Tifa", age__gt=20).count()
+
+        first_call, second_call = queryset.session.execute.call_args_list
+        assert first_call.args[0] is second_call.args[0]
+        assert first_call.args[1] == {"name_0": "Cloud", "age_1": 10}
+        assert second_call.args[1] == {"name_0": "Tifa", "age_1": 20}
+
+    def test_different_shapes_build_new_statements(self, queryset: QuerySet):
+        queryset.filter(name="Cloud").count()
+        queryset.filter(age__gt=10).count()
+
+        first_call, second_call = queryset.session.execute.call_args_list
+        assert first_call.args[0] is not second_call.args[0]
+
+
+class TestAsyncQuerySet:
+    @pytest.fixture
+    def async_queryset(self):
+        return AsyncQuerySet(MockModel(), mock_async_session())  # type: ignore
+
+    def test_filter_returns_async_queryset(self, async_queryset: AsyncQuerySet):
+        filtered_qs = async_queryset.filter(name="Cloud").order_by("age")
+
+        assert isinstance(filtered_qs, AsyncQuerySet)
+        assert filtered_qs.lookup_filters == [
+            LookupFilter("name", "eq", "Cloud", False)
+        ]
+
+    def test_all(self, async_queryset: AsyncQuerySet):
+        mock_result = [MockModel(name="Cloud"), MockModel(name="Tifa")]
+        async_queryset.session.execute.return_value.set_result(mock_result)
+
+        result = asyncio.run(async_queryset.filter(age__gt=10).all())
+
+        assert result == mock_result
+
+    def test_first(self, async_queryset: AsyncQuerySet):
+        mock_result = [MockModel(name="Cloud")]
+        async_queryset.session.execute.return_value.set_result(mock_result)
+
+        assert asyncio.run(async_queryset.first()) is mock_result[0]
+
+    def test_count(self, async_queryset: AsyncQuerySet):
+        async_queryset.session.execute.return_value.set_result(2)
+
+        assert asyncio.run(async_queryset.count()) == 2
+
+    def test_update_commits(self, async_queryset: AsyncQuerySet):
+        asyncio.run(async_queryset.filter(name="Cloud").update(age=10))
+
+        async_queryset.session.execute.assert_awaited_once()
+        async_queryset.session.commit.assert_awaited_once()
+
+    def test_sync_iteration_is_rejected(self, async_queryset: AsyncQuerySet):
+        with pytest.raises(TypeError):
+            list(async_queryset)
+
+    def test_parallel_map_is_rejected(self, async_queryset: AsyncQuerySet):
+        with pytest.raises(NotImplementedError):
+            async_queryset.parallel_map(abs)
+
+
+class TestQuerySetBulk:
+    @pytest.fixture
+    def bulk_queryset(self, queryset: QuerySet):
+        queryset.model_class = MockModel
+        with patch.object(
+            QuerySet, "_column_names", return_value=["name", "age"]
+        ), patch.object(
+            MockModel, "load", create=True, side_effect=lambda d: MockModel(**d)
+        ):
+            yield queryset
+
+    def test_bulk_create_batches(self, bulk_queryset: QuerySet):
+        bulk_queryset.session.get_bind.return_value.dialect.insert_executemany_returning_sort_by_parameter_order = (
+            False
+        )
+        objs = [{"name": f"user-{i}", "age": i} for i in range(5)]
+
+        created = bulk_queryset.bulk_create(objs, batch_size=2)
+
+        assert len(created) == 5
+        assert bulk_queryset.session.execute.call_count == 3
+        assert bulk_queryset.session.commit.call_count == 3
+
+    def test_bulk_create_returning(self, bulk_queryset: QuerySet):
+        returned = [MockModel(name="Cloud")]
+        bulk_queryset.session.scalars.return_value.all.return_value = returned
+
+        created = bulk_queryset.bulk_create([MockModel(name="Cloud")])
+
+        assert created == returned
+        bulk_queryset.session.scalars.assert_called_once()
+        bulk_queryset.session.commit.assert_called_once()
+
+    def test_bulk_update_requires_id(self, bulk_queryset: QuerySet):
+        with pytest.raises(ValueError):
+            bulk_queryset.bulk_update([{"name": "Cloud"}], fields=["name"])
+
+    def test_bulk_update_batches(self, bulk_queryset: QuerySet):
+        objs = [{"id": i, "name": f"user-{i}"} for i in range(3)]
+
+        updated = bulk_queryset.bulk_update(objs, fields=["name"], batch_size=2)
+
+        assert updated == 3
+        assert bulk_queryset.session.commit.call_count == 2
+        rows = bulk_queryset.session.execute.call_args_list[0].args[1]
+        assert rows == [{"id": 0, "name": "user-0"}, {"id": 1, "name": "user-1"}]
+
+
+class TestQuerySetGet:
+    @pytest.fixture
+    def cache(self, queryset: QuerySet):
+        cache = ModelCache(maxsize=10)
+        cache.keys = ("id", "name")
+        queryset.model_class._model_cache = cache
+        return cache
+
+    def test_get_by_id_uses_session_get(self, queryset: QuerySet):
+        obj = queryset.get(id=1)
+
+        assert obj is queryset.session.get.return_value
+        queryset.session.get.assert_called_once_with(queryset.model_class, 1)
+        queryset.session.execute.assert_not_called()
+
+    def test_get_by_other_field_queries(self, queryset: QuerySet):
+        queryset.get(name="Cloud")
+
+        queryset.session.get.assert_not_called()
+        queryset.session.execute.assert_called_once()
+
+    def test_filtered_get_by_id_queries(self, queryset: QuerySet):
+        queryset.filter(age=10).get(id=1)
+
+        queryset.session.get.assert_not_called()
+
+    def test_create_discards_object_keys(self, queryset: QuerySet, cache: ModelCache):
+        stale = SimpleNamespace(id=1, name="Cloud")
+        cache.set(("id", 1), stale)
+        cache.set(("id", 2), stale)
+        created = SimpleNamespace(id=1, name="Cloud")
+        queryset.model_class.load = Mock(return_value=created)
+
+        queryset.create(name="Cloud")
+
+        assert cache.get(("id", 1)) is None
+        assert cache.get(("id", 2)) is stale
+
+    def test_async_get_by_id(self):
+        session = mock_async_session()
+        session.get = AsyncMock(return_value=Mock(id=1))
+        queryset = AsyncQuerySet(MockModel(), session)  # type: ignore
+
+        assert asyncio.run(queryset.get(id=1)) is session.get.return_value
+        session.get.assert_awaited_once()
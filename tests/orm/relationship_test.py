@@ -0,0 +1,123 @@
+from typing import Optional
+
+import pytest
+
+from hojo.base import field, model
+
+
+@model
+class Author:
+    name: str
+    books: list = field(has_many="Book", factory=list, repr=False)
+
+
+@model
+class Book:
+    title: str = field(unique=True)
+    author: Optional[Author] = field(belongs_to=Author, default=None, repr=False)
+
+
+@pytest.fixture
+def author(database, create_tables):
+    create_tables(Author, Book)
+    session = database.session()
+    author = Author(name="Ursula")
+    author.books = [Book(title="The Dispossessed"), Book(title="Lathe of Heaven")]
+    session.add(author)
+    session.commit()
+    database.remove()
+    return author
+
+
+class TestFilter:
+    def test_by_related_object(self, author):
+        other = Author.objects.create(name="Octavia")
+        Book.objects.create(title="Kindred", author=other)
+
+        for related, titles in ((author, 2), (other, 1)):
+            assert Book.objects.filter(author=related).count() == titles
+            assert len(Book.objects.filter(author=related).all()) == titles
+
+        assert Book.objects.exclude(author=other).count() == 2
+
+
+class TestDump:
+    def test_relationships_are_left_out(self, author):
+        loaded = Author.objects.get(id=author.id)
+        assert all(book.author is loaded for book in loaded.books)
+
+        data = loaded.dump()
+
+        assert "books" not in data
+        assert data["name"] == "Ursula"
+        assert "author" not in loaded.books[0].dump()
+
+    def test_named_relationships_are_ids(self, author):
+        loaded = Author.objects.get(id=author.id)
+        book = loaded.books[0]
+
+        assert book.dump(only=["title", "author"]) == {
+            "title": book.title,
+            "author": str(author.id),
+        }
+        assert sorted(loaded.dump(only=["books"])["books"]) == sorted(
+            str(book.id) for book in loaded.books
+        )
+
+    def test_dump_many(self, author):
+        books = Book.objects.filter(author_id=author.id)
+
+        assert sorted(data["title"] for data in Book.dump_many(books)) == [
+            "Lathe of Heaven",
+            "The Dispossessed",
+        ]
+
+
+class TestWrite:
+    def test_create_with_related_object(self, author):
+        book = Book.objects.create(title="The Word for World", author=author)
+        database_author = Author.objects.get(id=author.id)
+
+        assert book.author_id == author.id
+        assert "The Word for World" in [book.title for book in database_author.books]
+
+    def test_create_with_foreign_key(self, database, author):
+        book = Book.objects.create(title="Always Coming Home", author_id=author.id)
+        database.remove()
+
+        assert Book.objects.get(id=book.id).author.name == "Ursula"
+
+    def test_bulk_create_with_related_objects(self, database, author):
+        Book.objects.bulk_create(
+            [
+                Book(title="Tehanu", author=author),
+                {"title": "Tales from Earthsea", "author_id": author.id},
+            ]
+        )
+        database.remove()
+
+        assert Book.objects.filter(author_id=author.id).count() == 4
+
+    def test_get_or_create_with_foreign_key(self, author):
+        book, created = Book.objects.get_or_create(
+            title="The Telling", author_id=author.id
+        )
+
+        assert created
+        assert book.author_id == author.id
+        assert Book.objects.get_or_create(title="The Telling", author_id=author.id) == (
+            book,
+            False,
+        )
+
+    def test_update_or_create_with_related_object(self, database, author):
+        other = Author.objects.create(name="Octavia")
+
+        book, created = Book.objects.update_or_create(
+            title="The Dispossessed", defaults={"author": other}
+        )
+        database.remove()
+
+        assert not created
+        assert book.author_id == other.id
+        assert Book.objects.get(id=book.id).author.name == "Octavia"
@@ -0,0 +1,159 @@
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from hojo.base import field, model
+from hojo.orm.queryset import QuerySet
+
+
+@model
+class Ticket:
+    code: str = field(unique=True)
+    title: str = ""
+    seats: int = 0
+
+
+@model
+class Membership:
+    member: str = field(unique="member_group")
+    group: str = field(unique="member_group")
+    role: str = "guest"
+
+
+@pytest.fixture
+def session(database, create_tables):
+    create_tables(Ticket, Membership)
+    return database.session
+
+
+def tickets(session) -> QuerySet:
+    return QuerySet(Ticket, session)
+
+
+class TestGetOrCreate:
+    def test_creates(self, session):
+        ticket, created = tickets(session).get_or_create(
+            code="A1", defaults={"title": "Opening"}
+        )
+
+        assert created
+        assert (ticket.code, ticket.title) == ("A1", "Opening")
+        assert tickets(session).count() == 1
+
+    def test_gets_existing(self, session):
+        existing, _ = tickets(session).get_or_create(code="A1", defaults={"seats": 3})
+
+        ticket, created = tickets(session).get_or_create(
+            code="A1", defaults={"seats": 10}
+        )
+
+        assert not created
+        assert ticket.id == existing.id
+        assert ticket.seats == 3
+        assert tickets(session).count() == 1
+
+    def test_composite_unique(self, session):
+        memberships = QuerySet(Membership, session)
+
+        first, created = memberships.get_or_create(member="cloud", group="avalanche")
+        second, created_again = memberships.get_or_create(
+            member="cloud", group="avalanche"
+        )
+
+        assert created and not created_again
+        assert first.id == second.id
+
+    def test_without_unique_lookup_falls_back(self, session):
+        ticket, created = tickets(session).get_or_create(title="Matinee", code="B1")
+        assert created
+
+        ticket, created = tickets(session).get_or_create(title="Matinee")
+        assert not created
+        assert ticket.code == "B1"
+
+    def test_extra_lookup_fields_are_matched(self, session):
+        existing, _ = tickets(session).get_or_create(code="A1", defaults={"seats": 5})
+
+        ticket, created = tickets(session).get_or_create(code="A1", seats=5)
+        assert not created
+        assert ticket.id == existing.id
+
+        # The row with this code doesn't match, and another can't be inserted
+        with pytest.raises(IntegrityError):
+            tickets(session).get_or_create(code="A1", seats=6)
+
+
+class TestUpdateOrCreate:
+    def test_creates_then_updates(self, session):
+        ticket, created = tickets(session).update_or_create(
+            code="A1", defaults={"seats": 5}
+        )
+        assert created
+
+        updated, created = tickets(session).update_or_create(
+            code="A1", defaults={"seats": 8}
+        )
+
+        assert not created
+        assert updated.id == ticket.id
+        assert updated.seats == 8
+        assert tickets(session).count() == 1
+
+    def test_requires_unique_lookup(self, session):
+        with pytest.raises(ValueError):
+            tickets(session).update_or_create(title="Matinee")
+
+    def test_requires_exactly_a_unique_lookup(self, session):
+        with pytest.raises(ValueError):
+            tickets(session).update_or_create(code="A1", seats=6)
+
+
+class TestBulkCreateOnConflict:
+    def test_ignore(self, session):
+        tickets(session).bulk_create([{"code": "A1", "seats": 1}])
+
+        created = tickets(session).bulk_create(
+            [{"code": "A1", "seats": 2}, {"code": "A2", "seats": 2}],
+            on_conflict="ignore",
+        )
+
+        assert [ticket.code for ticket in created] == ["A2"]
+        assert tickets(session).get(code="A1").seats == 1
+        assert tickets(session).count() == 2
+
+    def test_update(self, session):
+        tickets(session).bulk_create([{"code": "A1", "title": "Old", "seats": 1}])
+
+        upserted = tickets(session).bulk_create(
+            [{"code": "A1", "title": "New", "seats": 2}, {"code": "A2"}],
+            on_conflict="update",
+        )
+
+        assert sorted(ticket.code for ticket in upserted) == ["A1", "A2"]
+        ticket = tickets(session).get(code="A1")
+        assert (ticket.title, ticket.seats) == ("New", 2)
+
+    def test_update_with_conflict_fields(self, session):
+        memberships = QuerySet(Membership, session)
+        memberships.bulk_create([{"member": "tifa", "group": "avalanche"}])
+
+        memberships.bulk_create(
+            [{"member": "tifa", "group": "avalanche", "role": "leader"}],
+            on_conflict="update",
+            conflict_fields=["member", "group"],
+        )
+
+        assert memberships.get(member="tifa").role == "leader"
+
+    def test_invalid_action(self, session):
+        with pytest.raises(ValueError):
+            tickets(session).bulk_create([{"code": "A1"}], on_conflict="replace")
+
+    def test_requires_returning(self, session, monkeypatch):
+        dialect = session.get_bind().dialect
+        monkeypatch.setattr(
+            dialect, "insert_executemany_returning_sort_by_parameter_order", False
+        )
+
+        with pytest.raises(ValueError):
+            tickets(session).bulk_create([{"code": "A1"}], on_conflict="ignore")
+        assert tickets(session).count() == 0
@@ -0,0 +1,109 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from hojo import Hojo
+from hojo.base import model
+from hojo.connection import Connection
+from hojo.orm.queryset import QuerySet
+from hojo.routing import DatabaseRouter
+from hojo.transaction import atomic
+
+
+@model
+class Airship:
+    name: str
+
+
+DATABASES = {
+    "default": "sqlite:///{tmp_path}/primary.db",
+    "replica": [
+        "sqlite:///{tmp_path}/replica_1.db",
+        "sqlite:///{tmp_path}/replica_2.db",
+    ],
+}
+# The tests change the router and the balancing, which the teardown resets
+REPLICAS = {"databases": DATABASES, "database_router": None, "replica_balancing": None}
+
+
+@pytest.fixture
+def databases(database, create_tables):
+    # Each file stands in for a server and holds a row saying which one it is
+    for name, uris in database.databases.items():
+        for index, uri in enumerate(uris, 1):
+            engine = create_engine(uri)
+            create_tables(Airship, engine=engine)
+            with Session(engine) as session:
+                label = "primary" if name == "default" else f"{name}_{index}"
+                session.add(Airship(name=label))
+                session.commit()
+            engine.dispose()
+
+    return database.databases
+
+
+def airships() -> QuerySet:
+    return QuerySet(Airship, Connection().session)
+
+
+def names(queryset) -> list:
+    return sorted(airship.name for airship in queryset)
+
+
+@pytest.mark.parametrize("database", [REPLICAS], indirect=True)
+class TestRouting:
+    def test_reads_go_to_replicas_round_robin(self, databases):
+        assert names(airships().all()) == ["replica_1"]
+        Connection().session.remove()
+        assert names(airships().all()) == ["replica_2"]
+
+    def test_count_and_iterator_read_from_replica(self, databases):
+        assert airships().count() == 1
+        assert [a.name for a in airships().iterator()][0].startswith("replica")
+
+    def test_writes_go_to_primary(self, databases):
+        airships().create(name="Highwind")
+
+        assert names(airships().using("default")) == ["Highwind", "primary"]
+
+    def test_reads_after_write_stay_on_primary(self, databases):
+        Hojo.config(autocommit=False)
+        try:
+            airships().create(name="Tiny Bronco")
+            assert "Tiny Bronco" in names(airships().all())
+        finally:
+            Hojo.config(autocommit=None)
+            Connection().session.rollback()
+
+    def test_atomic_reads_from_primary(self, databases):
+        with atomic():
+            assert names(airships().all()) == ["primary"]
+
+    def test_using_pins_database(self, databases):
+        assert names(airships().using("default")) == ["primary"]
+
+    def test_unknown_database(self, databases):
+        with pytest.raises(ValueError):
+            list(airships().using("archive"))
+
+    def test_custom_router(self, databases):
+        class PrimaryOnly(DatabaseRouter):
+            def db_for_read(self, model, **hints):
+                return "default"
+
+        Hojo.config(database_router=PrimaryOnly())
+
+        assert names(airships().all()) == ["primary"]
+
+    def test_least_loaded(self, databases):
+        Hojo.config(replica_balancing="least_loaded")
+        busy = Connection().get_engine("replica")
+        with busy.connect():
+            idle = Connection().get_engine("replica")
+
+        assert idle is not busy
+
+
+def test_single_database_is_unrouted(database):
+    assert not database.routing
+    assert database.session.get_bind() is database.get_engine()
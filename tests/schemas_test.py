@@ -1,8 +1,16 @@
+import io
+from datetime import date, datetime, timezone
 from typing import Optional
+from uuid import UUID
 
+import pendulum
 import pytest
 from attrs import define
 
+from hojo import Hojo
+from hojo.config import Config
+from hojo.converter import SchemaConverter, dump_fn, load_fn
+from hojo.encoders import JSONBackend, get_json_backend
 from hojo.errors import ValidationError
 from hojo.schema import BaseSchema
 
@@ -82,3 +90,186 @@ def test_dump_with_only():
     dumped_data = user.dump(only=["age"])
 
     assert {"age": 30} == dumped_data
+
+
+@define
+class Token(BaseSchema):
+    id: UUID
+    issued_at: pendulum.DateTime
+
+
+@define
+class Profile(BaseSchema):
+    nickname: Optional[str]
+    bio: Optional[str] = None
+    score: int = 0
+
+
+def test_dump_skip_none_without_none_default():
+    profile = Profile(nickname=None, bio=None, score=0)
+
+    assert profile.dump(skip_none=True) == {"score": 0}
+    assert profile.dump(skip_none=True, only=["nickname", "score"]) == {"score": 0}
+
+
+def test_dump_only_takes_precedence_over_exclude():
+    profile = Profile(nickname="jo", bio="hi", score=3)
+
+    assert profile.dump(only=["bio"], exclude=["bio"]) == {"bio": "hi"}
+
+
+def test_dump_functions_are_cached_per_options():
+    assert dump_fn(Profile, frozenset({"bio"}), None, False) is dump_fn(
+        Profile, frozenset({"bio"}), None, False
+    )
+    assert dump_fn(Profile, None, None, True) is not dump_fn(Profile, None, None, False)
+    assert load_fn(Profile) is load_fn(Profile)
+
+
+def test_dump_does_not_share_state_between_calls():
+    first = Profile(nickname="a", bio="b").dump()
+    first["extra"] = True
+
+    assert Profile(nickname="a", bio="b").dump() == {
+        "nickname": "a",
+        "bio": "b",
+        "score": 0,
+    }
+
+
+def test_load_many():
+    users = User.load_many([{"name": "John", "age": 30}, User(name="Jane")])
+
+    assert users == [User(name="John", age=30), User(name="Jane")]
+
+
+def test_dump_many():
+    users = [User(name="John", age=30), User(name="Jane")]
+
+    assert User.dump_many(iter(users), skip_none=True) == [
+        {"name": "John", "age": 30},
+        {"name": "Jane"},
+    ]
+    assert User.dump_many(users, only=["name"]) == [{"name": "John"}, {"name": "Jane"}]
+
+
+def test_dump_many_mixed_classes():
+    rows = [User(name="John"), Profile(nickname="jo")]
+
+    assert User.dump_many(rows, skip_none=True) == [
+        {"name": "John"},
+        {"nickname": "jo", "score": 0},
+    ]
+
+
+@pytest.fixture
+def json_backend():
+    def configure(name):
+        Hojo.config(json_backend=name)
+        return get_json_backend()
+
+    yield configure
+    Config.set("json_backend", None)
+
+
+def test_dumps_lines_streams_lazily(json_backend):
+    json_backend("json")
+
+    consumed = []
+
+    def rows():
+        for name in ("John", "Jane"):
+            consumed.append(name)
+            yield User(name=name)
+
+    lines = User.dumps_lines(rows(), exclude=["age"])
+    assert consumed == []
+
+    buffer = io.StringIO()
+    buffer.writelines(lines)
+
+    assert consumed == ["John", "Jane"]
+    assert buffer.getvalue() == '{"name": "John"}\n{"name": "Jane"}\n'
+
+
+def test_dumps_and_loads_with_stdlib_backend(json_backend):
+    json_backend("json")
+    user = User(name="John", age=30)
+
+    assert user.dumps() == '{"name": "John", "age": 30}'
+    assert user.dumps(exclude=["age"]) == '{"name": "John"}'
+    assert User.loads('{"name": "John", "age": 30}') == user
+    assert User.loads(b'{"name": "Jane"}') == User(name="Jane")
+
+
+def test_dumps_returns_str_by_default(json_backend):
+    backend = json_backend(None)
+
+    assert backend.name == "json"
+    assert User(name="John", age=30).dumps() == '{"name": "John", "age": 30}'
+
+
+def test_dumps_with_orjson_backend(json_backend):
+    pytest.importorskip("orjson")
+    backend = json_backend("orjson")
+    token = Token(id=UUID(int=1), issued_at=pendulum.datetime(2023, 1, 2, tz="UTC"))
+
+    assert backend.native_types == (UUID,)
+    assert token.dumps() == (
+        b'{"id":"00000000-0000-0000-0000-000000000001",'
+        b'"issued_at":"2023-01-02T00:00:00Z"}'
+    )
+    assert Token.loads(token.dumps()) == token
+    assert list(Token.dumps_lines([token], only=["id"])) == [
+        b'{"id":"00000000-0000-0000-0000-000000000001"}\n'
+    ]
+
+
+def test_custom_json_backend_instance(json_backend):
+    class UpperBackend(JSONBackend):
+        def dumps(self, data):
+            return super().dumps(data).upper()
+
+    json_backend(UpperBackend())
+
+    assert User(name="John").dumps(skip_none=True) == '{"NAME": "JOHN"}'
+
+
+def test_unknown_json_backend(json_backend):
+    with pytest.raises(ValueError):
+        json_backend("yaml")
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2023-01-02T03:04:05Z", pendulum.datetime(2023, 1, 2, 3, 4, 5)),
+        ("2023-01-02T03:04:05", pendulum.datetime(2023, 1, 2, 3, 4, 5)),
+        (
+            "2023-01-02T03:04:05.5+03:00",
+            pendulum.datetime(
+                2023, 1, 2, 3, 4, 5, 500000, tz=pendulum.fixed_timezone(10800)
+            ),
+        ),
+        ("2023-01-02", pendulum.datetime(2023, 1, 2)),
+        ("2023-W01", pendulum.parse("2023-W01")),  # not for fromisoformat
+        (datetime(2023, 1, 2), pendulum.datetime(2023, 1, 2)),
+    ],
+)
+def test_structure_pendulum_datetime(value, expected):
+    structured = SchemaConverter.structure(value, pendulum.DateTime)
+
+    assert isinstance(structured, pendulum.DateTime)
+    assert structured == expected
+    assert structured.utcoffset() == expected.utcoffset()
+
+
+def test_structure_dates():
+    assert SchemaConverter.structure("2023-01-02", pendulum.Date) == pendulum.date(
+        2023, 1, 2
+    )
+    assert type(SchemaConverter.structure("2023-01-02", pendulum.Date)) is pendulum.Date
+    assert SchemaConverter.structure("2023-01-02T05:00:00", date) == date(2023, 1, 2)
+    assert SchemaConverter.structure("2023-01-02T05:00:00+00:00", datetime) == datetime(
+        2023, 1, 2, 5, tzinfo=timezone.utc
+    )
@@ -0,0 +1,150 @@
+import asyncio
+import os
+from contextvars import copy_context
+from threading import Thread
+
+import pytest
+from sqlalchemy import text
+
+from hojo.connection import Connection
+from hojo.sessions import in_session_scope, session_scope
+
+
+class TestSessionScope:
+    def test_block_gets_its_own_session(self, database):
+        outer = database.session()
+
+        with session_scope():
+            inner = database.session()
+            assert inner is not outer
+            assert database.session() is inner
+            assert in_session_scope()
+
+        assert database.session() is outer
+        assert not in_session_scope()
+
+    def test_session_is_closed_at_scope_end(self, database):
+        with session_scope() as scope:
+            session = database.session()
+            closed = []
+            session.close = lambda: closed.append(session)
+
+        assert closed == [session]
+        assert scope.sessions == {}
+
+    def test_nested_blocks_share_the_session(self, database):
+        with session_scope():
+            outer = database.session()
+            with session_scope():
+                assert database.session() is outer
+            assert database.session() is outer
+            assert in_session_scope()
+
+    def test_decorator(self, database):
+        sessions = []
+
+        @session_scope()
+        def handle():
+            sessions.append(database.session())
+
+        handle()
+        handle()
+
+        assert sessions[0] is not sessions[1]
+        assert not in_session_scope()
+
+    def test_threads_in_scope_get_their_own_sessions(self, database):
+        sessions = []
+        with session_scope() as scope:
+            outer = database.session()
+            # Like `asyncio.to_thread`, the thread runs in a copy of the scope
+            thread = Thread(
+                target=copy_context().run,
+                args=(lambda: sessions.append(database.session()),),
+            )
+            thread.start()
+            thread.join()
+
+            assert sessions[0] is not outer
+            assert len(scope.sessions) == 2
+
+        assert scope.sessions == {}
+
+    def test_threads_get_their_own_sessions(self, database):
+        sessions = []
+        thread = Thread(target=lambda: sessions.append(database.session()))
+        thread.start()
+        thread.join()
+
+        assert sessions[0] is not database.session()
+
+    def test_remove(self, database):
+        session = database.session()
+        database.remove()
+
+        assert database.session() is not session
+
+
+class TestAsyncSessionScope:
+    def test_tasks_in_scope(self, database):
+        async def handle():
+            async with session_scope():
+                session = database.async_session()
+                assert database.async_session() is session
+                return session
+
+        async def main():
+            return await asyncio.gather(handle(), handle())
+
+        first, second = asyncio.run(main())
+        assert first is not second
+
+    def test_gather_in_scope(self, database):
+        async def query():
+            session = database.async_session()
+            assert await session.scalar(text("SELECT 1")) == 1
+            return session
+
+        async def main():
+            async with session_scope() as scope:
+                sessions = await asyncio.gather(*[query() for _ in range(5)])
+                assert len(scope.sessions) == 5
+            return scope, sessions
+
+        scope, sessions = asyncio.run(main())
+        assert len(set(map(id, sessions))) == 5
+        assert scope.sessions == {}
+
+    def test_task_session_is_discarded_when_done(self, database):
+        async def main():
+            task = asyncio.create_task(asyncio.sleep(0, database.async_session()))
+            await task
+            await asyncio.sleep(0)
+            return task, database.async_session.registry.fallback.registry
+
+        task, registry = asyncio.run(main())
+        assert task not in registry
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+class TestFork:
+    def test_child_gets_a_fresh_pool(self, database):
+        engine = database.get_engine()
+        parent_pool = engine.pool
+        parent_session = database.session
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            fresh = engine.pool is not parent_pool
+            fresh = fresh and Connection().session is not parent_session
+            os.write(write_fd, b"1" if fresh else b"0")
+            os._exit(0)
+
+        os.close(write_fd)
+        result = os.read(read_fd, 1)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        assert result == b"1"
+        assert engine.pool is parent_pool
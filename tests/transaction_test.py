@@ -0,0 +1,136 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.orm import Session
+
+from hojo import Hojo
+from hojo.base import model
+from hojo.transaction import atomic, in_atomic_block, should_commit
+
+
+@model
+class Ledger:
+    entry: str
+
+
+@pytest.fixture
+def session():
+    with patch("hojo.transaction.Connection") as connection:
+        session = connection.return_value.session.return_value
+        session.info = {}
+        yield session
+
+
+@pytest.fixture
+def ledger(database, create_tables):
+    create_tables(Ledger)
+    return database
+
+
+class TestAtomic:
+    def test_commits_on_exit(self, session: MagicMock):
+        with atomic():
+            assert in_atomic_block(session)
+            assert not should_commit(session)
+            session.commit.assert_not_called()
+
+        assert not in_atomic_block(session)
+        session.commit.assert_called_once()
+
+    def test_rolls_back_on_error(self, session: MagicMock):
+        with pytest.raises(RuntimeError):
+            with atomic():
+                raise RuntimeError()
+
+        session.rollback.assert_called_once()
+        session.commit.assert_not_called()
+
+    def test_nested_uses_savepoint(self, session: MagicMock):
+        savepoint = session.begin_nested.return_value
+
+        with atomic():
+            with pytest.raises(RuntimeError):
+                with atomic():
+                    raise RuntimeError()
+
+        savepoint.rollback.assert_called_once()
+        session.commit.assert_called_once()
+
+    def test_nested_without_savepoint(self, session: MagicMock):
+        with atomic():
+            with atomic(savepoint=False):
+                pass
+
+        session.begin_nested.assert_not_called()
+        session.commit.assert_called_once()
+
+    def test_decorator(self, session: MagicMock):
+        @atomic()
+        def write():
+            assert in_atomic_block(session)
+
+        write()
+        write()
+
+        assert session.commit.call_count == 2
+
+
+class TestShouldCommit:
+    def test_autocommit_by_default(self):
+        assert should_commit(Session())
+
+    def test_autocommit_disabled(self):
+        Hojo.config(autocommit=False)
+        try:
+            assert not should_commit(Session())
+        finally:
+            Hojo.config(autocommit=None)
+
+    def test_depends_on_the_writing_session(self, session):
+        with atomic():
+            assert not should_commit(session)
+            assert should_commit(Session())
+
+
+class TestAtomicDatabase:
+    def test_commits(self, ledger):
+        with atomic():
+            Ledger.objects.create(entry="debit")
+            Ledger.objects.create(entry="credit")
+
+        assert Ledger.objects.count() == 2
+
+    def test_rolls_back(self, ledger):
+        with pytest.raises(RuntimeError):
+            with atomic():
+                Ledger.objects.create(entry="debit")
+                raise RuntimeError()
+
+        assert Ledger.objects.count() == 0
+
+    def test_async_rolls_back(self, ledger):
+        async def main():
+            with pytest.raises(RuntimeError):
+                async with atomic():
+                    await Ledger.aobjects.create(entry="debit")
+                    raise RuntimeError()
+            count = await Ledger.aobjects.count()
+            await ledger.aremove()
+            return count
+
+        assert asyncio.run(main()) == 0
+
+    def test_writes_in_child_tasks_are_kept(self, ledger):
+        # Each task writes through its own session, outside the block's transaction
+        async def main():
+            async with atomic():
+                await asyncio.gather(
+                    Ledger.aobjects.create(entry="a"),
+                    Ledger.aobjects.create(entry="b"),
+                )
+            count = await Ledger.aobjects.count()
+            await ledger.aremove()
+            return count
+
+        assert asyncio.run(main()) == 2